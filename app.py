@@ -12,16 +12,29 @@ if module_path not in sys.path:
 import glob
 
 # Importación de Dash y componentes adicionales
-from dash import Dash, html, dcc, callback, Input, Output
+from dash import Dash, html, dcc, callback, Input, Output, State, no_update
 import dash_bootstrap_components as dbc  # Componentes Bootstrap para diseño estilizado
 
 # Importación de componentes personalizados
 from components.NavbarVertical import sidebar  # Menú lateral de navegación (Sidebar)
 from components.Footer import Footer  # Pie de página (Footer)
-from page.leage_players_page import leage_players  # Página principal con análisis de jugadores
-from page.players_page import players_page_content  # Página para análisis individual de jugadores
-from page.about import about_page_content  # Página "Acerca de"
-from page.scatter import scatter  # Página de gráfico de dispersión
+from page.registry import page_layout, preload_pages, register_page  # Registro de páginas con carga diferida
+from data.dataset import current, start_watcher  # Recarga en caliente de los datos de jugadores
+from data.live import LIVE_REFRESH_MS, LIVE_SOURCE, start_live_feed  # Datos en directo durante los partidos
+from prewarm import start_prewarm  # Precalentamiento de las cachés de figuras
+from utils.instrumentation import instrument  # Métricas de los callbacks en /metrics
+from utils.payload import compress  # Compresión de las respuestas JSON y HTML
+from utils.export import export  # Descarga de los datos de las páginas en CSV o Parquet
+
+# --- Registro de páginas ---
+
+# Los módulos se importan ya (registran sus callbacks), pero el layout y los datos de cada
+# página se construyen la primera vez que se visita su ruta
+register_page("/", "page.leage_players_page")  # Página principal con análisis de jugadores
+register_page("/players", "page.players_page", uses_data=False)  # Página para análisis individual de jugadores
+register_page("/about", "page.about", uses_data=False)  # Página "Acerca de"
+register_page("/scatter", "page.scatter")  # Página de gráfico de dispersión
+register_page("/correlation", "page.correlation")  # Página de correlaciones entre estadísticas
 
 # --- Configuración de rutas principales ---
 
@@ -51,6 +64,20 @@ app = Dash(
 # Servidor necesario para desplegar la aplicación en plataformas como Heroku
 server = app.server
 
+# Medir el tiempo, el tamaño y los errores de cada callback y publicarlos en /metrics
+instrument(app)
+
+# Comprimir las respuestas de los callbacks y del layout (se registra después para que
+# /metrics mida los bytes que realmente se envían)
+compress(app)
+
+# Descargas en streaming de las ventanas del ranking, del gráfico de dispersión y del radar
+export(app)
+
+# Modo "eager": construir ya todas las páginas (por ejemplo, antes de crear los workers)
+if os.environ.get("PAGES_EAGER") == "1":
+    preload_pages()
+
 # --- Definición del layout principal de la aplicación ---
 
 app.layout = html.Div(  # Contenedor principal de la aplicación
@@ -61,6 +88,10 @@ app.layout = html.Div(  # Contenedor principal de la aplicación
             children=[
                 # Componente para manejar rutas dinámicas (URLs)
                 dcc.Location(id="url"),  
+
+                # Comprobación periódica de la versión de los datos (solo con datos en directo)
+                dcc.Interval(id="live-interval", interval=LIVE_REFRESH_MS, disabled=not LIVE_SOURCE),
+                dcc.Store(id="data-version"),  # Versión de los datos que muestran las páginas
                 
                 # Menú lateral (Sidebar)
                 html.Aside(
@@ -107,18 +138,41 @@ def routing(path):
     Función de enrutamiento que devuelve el contenido dinámico de la página 
     basado en la ruta actual de la URL.
     """
-    if path == "/":  # Ruta principal
-        return leage_players  # Cargar contenido de jugadores por liga
-    elif path == "/players":  # Ruta para análisis individual de jugadores
-        return players_page_content
-    elif path == "/about":  # Ruta "Acerca de"
-        return about_page_content
-    elif path == "/scatter":  # Ruta para el gráfico de dispersión
-        return scatter
-    else:  # Ruta no encontrada
+    content = page_layout(path)  # Se construye la primera vez y después se reutiliza
+    if content is None:  # Ruta no encontrada
         return html.H2("404"), html.P("Página no encontrada.")  # Mensaje de error 404
+    return content
+
+# --- Callback para avisar a las páginas de los datos nuevos ---
+
+@callback(
+    Output("data-version", "data"),  # Salida: Versión actual de los datos
+    Input("live-interval", "n_intervals"),  # Entrada: Cada comprobación periódica
+    State("data-version", "data"),  # Estado: Versión que ya conocen las páginas
+    prevent_initial_call=True
+)
+def refresh_data_version(_n_intervals, known_version):
+    """
+    Publica la versión actual de los datos solo cuando cambia.
+
+    Las páginas de la liga y de jugadores escuchan `data-version`: si no hay
+    datos nuevos no se ejecuta ningún callback ni se envía nada más.
+
+    :param known_version: Versión que ya muestran las páginas.
+    :return: Versión actual, o `no_update` si no ha cambiado.
+    """
+    version = current().version
+    return no_update if version == known_version else version
 
 # --- Ejecución de la aplicación ---
 
 if __name__ == "__main__":
+    # Los hilos de recarga, de datos en directo y de precalentamiento solo se arrancan al ejecutar
+    # `python app.py` (con gunicorn los arranca `post_fork` en cada worker). El modo debug ejecuta
+    # el script en dos procesos: los hilos van solo en el que sirve la app (el otro vigila el código)
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_watcher()  # Publicar los datos nuevos del libro sin reiniciar la app
+        start_live_feed()  # Ingesta de eventos en directo (solo si hay un origen en LIVE_SOURCE)
+        if os.environ.get("PREWARM_ON_START") == "1":
+            start_prewarm()  # Precalentar en segundo plano las figuras de todas las ventanas del ranking
     app.run_server(debug=True)  # Ejecutar la app en modo debug para desarrollo
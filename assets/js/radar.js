@@ -0,0 +1,106 @@
+// --- Gráfico de radar dibujado en el navegador ---
+//
+// La página /players envía una sola vez la matriz de métricas de todos los
+// jugadores (float32 en base64) a un dcc.Store. A partir de ahí el radar se
+// dibuja aquí, sin pasar por el servidor en cada cambio de selección, y cada
+// cambio solo añade o quita las trazas de los jugadores afectados.
+
+(function () {
+    // Matriz decodificada de la última versión recibida
+    var decoded = { version: null, values: null, index: null };
+
+    // Decodifica la matriz del Store (solo cuando cambia la versión de los datos)
+    function decode(store) {
+        if (decoded.version === store.version) {
+            return decoded;
+        }
+        var binary = window.atob(store.matrix);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        var index = new Map();  // Nombre -> fila de la matriz
+        store.names.forEach(function (name, row) { index.set(name, row); });
+        decoded = { version: store.version, values: new Float32Array(bytes.buffer), index: index };
+        return decoded;
+    }
+
+    // Construye la traza de radar de un jugador (o null si no existe en esta versión)
+    function buildTrace(name, matrix, store, theta, color) {
+        var width = store.labels.length;
+        var row = matrix.index.get(name);
+        if (row === undefined) {
+            return null;
+        }
+        var r = Array.from(matrix.values.subarray(row * width, (row + 1) * width));
+        r.push(r[0]);  // Cerrar el círculo del radar
+        return {
+            type: "scatterpolar",
+            r: r,
+            theta: theta,
+            fill: "toself",
+            name: name,
+            marker: { color: color },
+            opacity: 0.6
+        };
+    }
+
+    // Actualiza la figura de radar a partir de la figura anterior.
+    // Solo se construyen las trazas de los jugadores añadidos; las de los que
+    // siguen seleccionados se reutilizan tal cual (mismo objeto y mismo color),
+    // de modo que Plotly.react solo redibuja lo que ha cambiado.
+    function render(selected, store, previous) {
+        if (!selected || !selected.length || !store) {
+            return { data: [], layout: {} };  // Sin jugadores: gráfico vacío
+        }
+        if (selected.length > store.max_players) {
+            console.warn("Has seleccionado más de " + store.max_players +
+                " jugadores. Solo los primeros " + store.max_players + " se incluirán en el gráfico.");
+            selected = selected.slice(0, store.max_players);
+        }
+
+        var matrix = decode(store);
+
+        // Reutilizar la figura anterior solo si se dibujó con la misma versión de los datos
+        var reuse = previous && previous.layout && previous.layout.meta === store.version;
+        var kept = new Map();  // Nombre -> traza anterior
+        if (reuse) {
+            (previous.data || []).forEach(function (trace) { kept.set(trace.name, trace); });
+        }
+        var theta = reuse && previous.data.length ? previous.data[0].theta
+            : store.labels.concat(store.labels.slice(0, 1));
+
+        // Colores ya usados por las trazas que se conservan
+        var used = new Set();
+        selected.forEach(function (name) {
+            if (kept.has(name)) {
+                used.add(kept.get(name).marker.color);
+            }
+        });
+        var free = store.colors.filter(function (color) { return !used.has(color); });
+
+        var traces = [];
+        selected.forEach(function (name) {
+            var trace = kept.get(name);
+            if (trace === undefined) {
+                var color = free.length ? free.shift() : store.colors[traces.length % store.colors.length];
+                trace = buildTrace(name, matrix, store, theta, color);
+            }
+            if (trace) {
+                traces.push(trace);
+            }
+        });
+
+        var layout = reuse ? previous.layout : {
+            meta: store.version,  // Versión de los datos con la que se dibujó la figura
+            polar: { radialaxis: { visible: true, range: [0, 1] } },
+            showlegend: true,
+            title: { text: "Comparación de Estadísticas de Jugadores" }
+        };
+        return { data: traces, layout: layout };
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        radar: { render: render }
+    });
+})();
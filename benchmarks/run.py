@@ -0,0 +1,292 @@
+"""
+Benchmarks de la carga de datos y de los callbacks con datos sintéticos.
+
+Cada tamaño se mide en un proceso aparte (con cachés en una carpeta temporal)
+para que los resultados no dependan del orden ni de lo que ya esté en memoria.
+Los resultados se guardan en JSON por commit y se pueden comparar con otra
+ejecución para detectar regresiones.
+
+Uso:
+    python -m benchmarks.run [--sizes 1000,10000] [--repeat 5]
+    python -m benchmarks.run --compare .cache/benchmarks/<commit>.json [--threshold 0.25]
+"""
+import argparse  # Para leer los argumentos de la línea de comandos
+import datetime  # Para fechar los resultados
+import itertools  # Para generar versiones y ventanas distintas en cada repetición
+import json  # Para guardar y comparar los resultados
+import os  # Para manejar rutas y variables de entorno
+import platform  # Para registrar la máquina en los resultados
+import statistics  # Para la mediana de los tiempos
+import subprocess  # Para medir cada tamaño en un proceso aparte
+import sys  # Para lanzar el mismo intérprete en los procesos hijos
+import tempfile  # Para las cachés temporales de cada tamaño
+import time  # Para medir los tiempos
+import tracemalloc  # Para medir el pico de memoria
+
+# Carpeta raíz del proyecto (un nivel por encima de este paquete)
+ROOT_FOLDER = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+# --- Configuración ---
+
+# Número de jugadores de los conjuntos sintéticos
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Tamaño máximo para el que se mide la lectura del Excel (escribirlo es muy lento)
+EXCEL_MAX_ROWS = 10_000
+
+# Aumento relativo de la mediana (o del pico de memoria) que se considera regresión
+DEFAULT_THRESHOLD = 0.25
+
+# Diferencias menores que estas se consideran ruido (segundos y bytes)
+NOISE_SECONDS = 0.002
+NOISE_BYTES = 1024 * 1024
+
+# Carpeta donde se guardan los resultados de cada commit
+RESULTS_FOLDER = os.path.join(ROOT_FOLDER, ".cache", "benchmarks")
+
+
+def measure(run, setup=None, repeat=5):
+    """
+    Mide el tiempo y el pico de memoria de una operación.
+
+    Los tiempos se toman sin `tracemalloc` (que ralentiza la ejecución); el
+    pico de memoria se mide en una ejecución adicional.
+
+    :param run: Función que recibe el resultado de `setup` y ejecuta la operación medida.
+    :param setup: Función sin argumentos que prepara cada ejecución (no se mide).
+    :param repeat: Número de ejecuciones cronometradas.
+    :return: Diccionario con la mediana y el mínimo en segundos y el pico en bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        started = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - started)
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    try:
+        run(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"median_s": statistics.median(times), "min_s": min(times), "peak_bytes": peak}
+
+# --- Casos medidos (en el proceso hijo) ---
+
+def bench(rows, repeat, excel_max_rows, workdir):
+    """
+    Mide todos los casos para un conjunto sintético de `rows` jugadores.
+
+    Los casos "cold" publican antes de cada ejecución una versión nueva de los
+    datos, de modo que no se aprovecha ninguna estructura ni figura cacheada.
+
+    :param rows: Número de jugadores.
+    :param repeat: Número de ejecuciones cronometradas por caso.
+    :param excel_max_rows: Tamaño máximo para medir la lectura del Excel.
+    :param workdir: Carpeta temporal para el libro y el almacén.
+    :return: Diccionario caso -> medidas.
+    """
+    import pandas as pd
+    from plotly.io.json import to_json_plotly
+
+    from benchmarks.synthetic import synthetic_players
+    from components.PartitionSelectors import ALL
+    from data.dataset import Snapshot, publish
+    from data.metrics import derive_metrics
+    from data.partitions import add_partition_columns, open_store, season_rank, write_store
+
+    frame = synthetic_players(rows)
+    results = {}
+
+    # Carga de datos: Excel (solo tamaños pequeños), escritura y lectura del almacén, métricas
+    if rows <= excel_max_rows:
+        path = os.path.join(workdir, "jugadores.xlsx")
+        frame.to_excel(path, index=False)
+        results["load_excel"] = measure(lambda _: add_partition_columns(pd.read_excel(path)), repeat=1)
+
+    folders = (os.path.join(workdir, f"store-{i}") for i in itertools.count())
+    results["store_write"] = measure(lambda _: write_store(frame, next(folders), {"sha256": "bench"}),
+                                     repeat=repeat)
+    store = open_store(os.path.join(workdir, "store-0"))
+    results["store_read"] = measure(lambda _: store.read(), repeat=repeat)
+
+    raw = store.read()
+    results["derive_metrics"] = measure(derive_metrics, setup=raw.copy, repeat=repeat)
+
+    # Versiones nuevas de los datos para los casos en frío
+    versions = itertools.count()
+
+    def fresh():
+        return publish(Snapshot(None, f"bench-{next(versions)}", None, store))
+
+    fresh()  # Publicar una versión antes de importar las páginas
+    from page import leage_players_page as league, players_page as players, scatter
+
+    season = max((season for season, _ in store.partitions()), key=season_rank)
+
+    # Ranking de la liga: primera petición, ventanas nuevas y ventana ya cacheada
+    results["league_cold"] = measure(lambda _: league.update_graph_and_label(1, 10, season, ALL),
+                                     setup=fresh, repeat=repeat)
+    windows = itertools.count(1)
+    results["league_window"] = measure(
+        lambda _: league.update_graph_and_label(next(windows) * 10 + 1, 10, season, ALL), repeat=repeat)
+    results["league_cached"] = measure(lambda _: league.update_graph_and_label(1, 10, season, ALL),
+                                       repeat=repeat)
+
+    # Radar: matriz que se envía al navegador (el gráfico se dibuja en el navegador)
+    results["radar_cold"] = measure(lambda _: players.load_radar_matrix(None, None, None), setup=fresh, repeat=repeat)
+
+    # Dispersión: figura nueva y figura ya cacheada
+    results["scatter_cold"] = measure(
+        lambda _: scatter.update_scatter_plot("Minutos Jugados", "Puntos Totales", season, ALL),
+        setup=fresh, repeat=repeat)
+    results["scatter_cached"] = measure(
+        lambda _: scatter.update_scatter_plot("Minutos Jugados", "Puntos Totales", season, ALL), repeat=repeat)
+
+    # Construcción (primera visita a cada ruta) y serialización de los layouts de las páginas
+    factories = [league.layout, players.layout, scatter.layout]
+    results["layout_build"] = measure(lambda _: [factory() for factory in factories], setup=fresh, repeat=repeat)
+    layouts = [factory() for factory in factories]
+    results["layout_serialize"] = measure(lambda _: [to_json_plotly(layout) for layout in layouts], repeat=repeat)
+
+    return results
+
+# --- Ejecución y comparación (en el proceso padre) ---
+
+def run_size(rows, repeat, excel_max_rows):
+    """
+    Mide un tamaño en un proceso hijo con cachés temporales.
+
+    :param rows: Número de jugadores.
+    :param repeat: Número de ejecuciones cronometradas por caso.
+    :param excel_max_rows: Tamaño máximo para medir la lectura del Excel.
+    :return: Diccionario caso -> medidas.
+    """
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+        env = dict(os.environ,
+                   DATASET_CACHE_DIR=os.path.join(workdir, "dataset"),
+                   FIGURE_CACHE_DIR=os.path.join(workdir, "figures"),
+                   DATASET_RELOAD_INTERVAL="0")
+        subprocess.run([sys.executable, "-m", "benchmarks.run", "--child", str(rows),
+                        "--workdir", workdir, "--repeat", str(repeat),
+                        "--excel-max-rows", str(excel_max_rows)],
+                       cwd=ROOT_FOLDER, env=env, check=True)
+        with open(os.path.join(workdir, "result.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+
+def git_commit():
+    """
+    Devuelve el commit actual y si hay cambios sin confirmar.
+
+    :return: Tupla (hash corto o "unknown", True si el árbol tiene cambios).
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_FOLDER,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_FOLDER,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def compare(baseline, result, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara dos ejecuciones y devuelve los casos que han empeorado.
+
+    :param baseline: Resultados de referencia.
+    :param result: Resultados nuevos.
+    :param threshold: Aumento relativo permitido (0.25 = 25 %).
+    :return: Lista de tuplas (tamaño, caso, medida, valor anterior, valor nuevo).
+    """
+    regressions = []
+    for size, cases in result["sizes"].items():
+        for case, values in cases.items():
+            old = baseline["sizes"].get(size, {}).get(case)
+            if old is None:
+                continue
+            for key, noise in (("median_s", NOISE_SECONDS), ("peak_bytes", NOISE_BYTES)):
+                if values[key] > old[key] * (1 + threshold) and values[key] - old[key] > noise:
+                    regressions.append((size, case, key, old[key], values[key]))
+    return regressions
+
+
+def print_table(result):
+    """
+    Muestra los resultados como una tabla de texto.
+
+    :param result: Resultados de una ejecución.
+    """
+    print(f"{'jugadores':>10}  {'caso':<18} {'mediana (ms)':>13} {'mín (ms)':>10} {'pico (MB)':>10}")
+    for size, cases in result["sizes"].items():
+        for case, values in cases.items():
+            print(f"{size:>10}  {case:<18} {values['median_s'] * 1000:>13.2f} "
+                  f"{values['min_s'] * 1000:>10.2f} {values['peak_bytes'] / 2 ** 20:>10.1f}")
+
+
+def main():
+    """
+    Punto de entrada de la línea de comandos.
+
+    :return: Código de salida (1 si hay regresiones respecto a `--compare`).
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks de los callbacks con datos sintéticos.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Números de jugadores separados por comas")
+    parser.add_argument("--repeat", type=int, default=5, help="Ejecuciones cronometradas por caso")
+    parser.add_argument("--excel-max-rows", type=int, default=EXCEL_MAX_ROWS,
+                        help="Tamaño máximo para medir la lectura del Excel")
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados (por defecto, uno por commit)")
+    parser.add_argument("--compare", default=None, help="Resultados de referencia con los que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Aumento relativo que se considera regresión (0.25 = 25 %%)")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--workdir", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Proceso hijo: medir un tamaño y guardar el resultado en la carpeta temporal
+    if args.child is not None:
+        results = bench(args.child, args.repeat, args.excel_max_rows, args.workdir)
+        with open(os.path.join(args.workdir, "result.json"), "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        return 0
+
+    commit, dirty = git_commit()
+    result = {
+        "commit": commit,
+        "dirty": dirty,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for rows in (int(size) for size in args.sizes.split(",")):
+        print(f"Midiendo {rows} jugadores...")
+        result["sizes"][str(rows)] = run_size(rows, args.repeat, args.excel_max_rows)
+
+    output = args.output or os.path.join(RESULTS_FOLDER, f"{commit}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    print_table(result)
+    print(f"Resultados guardados en {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, result, args.threshold)
+        for size, case, key, old, new in regressions:
+            print(f"REGRESIÓN {size} jugadores, {case} ({key}): {old:.4g} -> {new:.4g} (+{new / old - 1:.0%})")
+        if regressions:
+            return 1
+        print(f"Sin regresiones respecto a {baseline['commit']} (umbral {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import numpy as np  # Para generar las estadísticas aleatorias de forma vectorizada
+import pandas as pd  # Para construir el DataFrame con el esquema del libro
+
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de partición
+
+# --- Datos sintéticos con el esquema de Jugadores.xlsx ---
+
+# Nombres y apellidos de ejemplo (con tildes, para ejercitar la búsqueda)
+FIRST_NAMES = ["Juan", "Carlos", "Miguel", "José", "Álvaro", "Íñigo", "Sergio", "Rubén",
+               "Andrés", "Óscar", "Pablo", "Raúl", "Tomás", "Víctor", "Jesús", "Adrián"]
+LAST_NAMES = ["Pérez", "López", "Rodríguez", "García", "Martínez", "Sánchez", "Gómez", "Díaz",
+              "Fernández", "Hernández", "Muñoz", "Álvarez", "Jiménez", "Ruiz", "Galíndo", "Núñez"]
+
+# Temporadas y competiciones entre las que se reparten los jugadores
+SEASONS = ["2021-22", "2022-23", "2023-24"]
+COMPETITIONS = ["Liga", "Copa"]
+
+
+def _made(rng, attempts, rate):
+    """
+    Genera los tiros anotados a partir de los intentados y un porcentaje de acierto medio.
+
+    :param rng: Generador aleatorio de NumPy.
+    :param attempts: Array de tiros intentados.
+    :param rate: Porcentaje de acierto medio (entre 0 y 1).
+    :return: Array de tiros anotados.
+    """
+    rates = np.clip(rng.normal(rate, 0.1, len(attempts)), 0, 1)
+    return rng.binomial(attempts, rates)
+
+
+def _percentage(made, attempts):
+    """
+    Porcentaje de acierto como en el libro: 0 si no hay intentos.
+
+    :param made: Array de tiros anotados.
+    :param attempts: Array de tiros intentados.
+    :return: Array de porcentajes entre 0 y 1.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(attempts > 0, made / attempts, 0.0)
+
+
+def synthetic_players(rows, seed=0):
+    """
+    Genera un DataFrame de jugadores con las mismas columnas que `Jugadores.xlsx`.
+
+    Las estadísticas son coherentes entre sí (los tiros anotados no superan a
+    los intentados, los totales son sumas de sus partes...) y los nombres son
+    únicos. Los jugadores se reparten entre varias temporadas y competiciones.
+
+    :param rows: Número de jugadores.
+    :param seed: Semilla del generador, para obtener siempre los mismos datos.
+    :return: DataFrame con `rows` jugadores.
+    """
+    rng = np.random.default_rng(seed)
+
+    games = rng.integers(1, 27, rows)
+    minutes = np.maximum(1, (games * rng.gamma(2.0, 9.0, rows)).astype(np.int64))
+    scale = minutes / 300  # Las estadísticas acumuladas crecen con los minutos jugados
+
+    tcp2_attempted = rng.poisson(65 * scale)
+    tcp3_attempted = rng.poisson(38 * scale)
+    tcp1_attempted = rng.poisson(32 * scale)
+    tcp2_made = _made(rng, tcp2_attempted, 0.45)
+    tcp3_made = _made(rng, tcp3_attempted, 0.30)
+    tcp1_made = _made(rng, tcp1_attempted, 0.65)
+    offensive = rng.poisson(17 * scale)
+    defensive = rng.poisson(42 * scale)
+
+    names = [f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]} {i}"
+             for i in range(rows)]
+
+    return pd.DataFrame({
+        "Nombre": names,
+        "Nº Partidos jugados": games,
+        "Minutos Jugados": minutes,
+        "Puntos Totales": 2 * tcp2_made + 3 * tcp3_made + tcp1_made,
+        "TCP2 anotados": tcp2_made,
+        "TCP2 Intentados": tcp2_attempted,
+        "TCP2 (%)": _percentage(tcp2_made, tcp2_attempted),
+        "TCP3 anotados": tcp3_made,
+        "TCP3 Intentados": tcp3_attempted,
+        "TCP3 (%)": _percentage(tcp3_made, tcp3_attempted),
+        "Tiros de campo Anotados": tcp2_made + tcp3_made,
+        "Tiros de campo Intentados": tcp2_attempted + tcp3_attempted,
+        "TC (%)": _percentage(tcp2_made + tcp3_made, tcp2_attempted + tcp3_attempted),
+        "Tiros Libres Anotados": tcp1_made,
+        "Tiros libres Intentados": tcp1_attempted,
+        "TCP1 (%)": _percentage(tcp1_made, tcp1_attempted),
+        "Rebotes Ofensivos": offensive,
+        "Rebotes Defensivos": defensive,
+        "Rebotes Totales": offensive + defensive,
+        "Asistencias": rng.poisson(22 * scale),
+        "Recuperaciones": rng.poisson(11 * scale),
+        "Pérdidas": rng.poisson(21 * scale),
+        "Tapones Cometidos": rng.poisson(3.5 * scale),
+        "Tapones Recibidos": rng.poisson(3 * scale),
+        "Faltas Personales Cometidas": rng.poisson(28 * scale),
+        "Faltas Personales Recibidas": rng.poisson(30 * scale),
+        SEASON_COLUMN: np.array(SEASONS, dtype=object)[rng.integers(0, len(SEASONS), rows)],
+        COMPETITION_COLUMN: np.array(COMPETITIONS, dtype=object)[rng.integers(0, len(COMPETITIONS), rows)],
+    })
@@ -63,6 +63,19 @@ sidebar = html.Div(  # Contenedor principal del sidebar
                     className="pe-3",  # Clase CSS para espaciado a la derecha
                 ),
                 
+                # --- Enlace a la página "Correlation" ---
+                dbc.NavLink(
+                    [
+                        # Icono para el enlace
+                        html.I(className="menu-icon tf-icons bx bx-grid-alt"),  
+                        # Texto del enlace
+                        html.Span("Correlation"),
+                    ],
+                    href="/correlation",  # Ruta a la que redirige el enlace
+                    active="exact",  # Marca el enlace como activo si coincide exactamente con la ruta
+                    className="pe-3",  # Clase CSS para espaciado a la derecha
+                ),
+                
                 # --- Enlace a la página "About" ---
                 dbc.NavLink(
                     [
@@ -0,0 +1,57 @@
+from dash import dcc, html  # Importa componentes de Dash para construir la interfaz
+import dash_bootstrap_components as dbc  # Importa componentes Bootstrap para diseño estilizado
+
+from data.partitions import season_rank  # Orden de las temporadas (de la más antigua a la más reciente)
+
+# Valor de los selectores que representa "todas las temporadas / competiciones"
+ALL = "*"
+
+# --- Selectores de temporada y competición ---
+
+def PartitionSelectors(id_prefix, partitions):
+    """
+    Genera una fila con los selectores de temporada y competición.
+
+    Los identificadores de los Dropdown son `<id_prefix>-season` y
+    `<id_prefix>-competition`. Por defecto se selecciona la temporada más
+    reciente y todas sus competiciones.
+
+    :param id_prefix: Prefijo de los identificadores de los componentes.
+    :param partitions: Lista de tuplas (temporada, competición) disponibles.
+    :return: Un componente Dash Row con diseño Bootstrap.
+    """
+    seasons = sorted({season for season, _ in partitions}, key=season_rank)
+    competitions = sorted({competition for _, competition in partitions})
+
+    return dbc.Row([
+        dbc.Col([
+            html.Label("Temporada:"),  # Etiqueta del selector de temporada
+            dcc.Dropdown(
+                id=f"{id_prefix}-season",
+                options=[{'label': "Todas", 'value': ALL}] + [{'label': s, 'value': s} for s in seasons],
+                value=seasons[-1] if seasons else ALL,  # Temporada más reciente
+                clearable=False,  # No permite limpiar la selección
+            ),
+        ], width=3),
+        dbc.Col([
+            html.Label("Competición:"),  # Etiqueta del selector de competición
+            dcc.Dropdown(
+                id=f"{id_prefix}-competition",
+                options=[{'label': "Todas", 'value': ALL}] + [{'label': c, 'value': c} for c in competitions],
+                value=ALL,  # Todas las competiciones
+                clearable=False,  # No permite limpiar la selección
+            ),
+        ], width=3),
+    ], style={"margin-bottom": "1rem"})
+
+
+def selected_partition(season, competition):
+    """
+    Convierte los valores de los selectores en el filtro de `Snapshot.view`.
+
+    :param season: Valor del selector de temporada.
+    :param competition: Valor del selector de competición.
+    :return: Tupla (temporada o None, competición o None).
+    """
+    return (None if season in (None, ALL) else season,
+            None if competition in (None, ALL) else competition)
@@ -3,25 +3,22 @@ import dash_bootstrap_components as dbc  # Importa componentes Bootstrap para di
 
 # --- Componente de la tarjeta personalizada ---
 
-def AverageCardTC1(players_df):
+def AverageCardTC1():
     """
     Genera una tarjeta que muestra el promedio de "TCP1 (%)" (Tiros Libres) para los jugadores seleccionados.
-    
-    :param players_df: DataFrame con los datos de los jugadores seleccionados.
+
+    La tarjeta se construye una sola vez; el callback de la página solo
+    actualiza los textos con los identificadores `tc1-average-value` (promedio)
+    y `tc1-average-stats` (mediana, desviación típica y percentiles).
+
     :return: Un componente Dash Card con diseño Bootstrap.
     """
     
-    # Calcular el promedio de la columna "TCP1 (%)" en el DataFrame proporcionado
-    tcp2_average = players_df["TCP1 (%)"].mean()
-    
-    # Formatear el promedio como texto con dos decimales seguido de un porcentaje
-    average_text = f"{tcp2_average:.2f}%"
-    
     # Crear el contenido de la tarjeta usando un diseño de filas y columnas
     card_content = dbc.Row([
         # Columna con el texto grande del promedio
         dbc.Col(html.Div(
-            average_text,  # Muestra el promedio calculado
+            id="tc1-average-value",  # Texto del promedio, actualizado por el callback
             style={  # Estilo CSS para el texto
                 "font-size": "2.5rem",  # Tamaño grande del texto
                 "font-weight": "bold",  # Negrita
@@ -40,6 +37,15 @@ def AverageCardTC1(players_df):
                     "color": "#5a6e7f",  # Mismo color azul grisáceo
                     "textAlign": "center"  # Texto centrado
                 }
+            ),
+            # Estadísticos adicionales de la ventana (mediana, desviación típica y percentiles)
+            html.Small(
+                id="tc1-average-stats",
+                style={
+                    "font-size": "0.75rem",  # Texto pequeño bajo la etiqueta
+                    "color": "#8592a3",  # Gris más claro que el promedio
+                    "textAlign": "center"  # Texto centrado
+                }
             )
         ]), width="auto", style={  # Estilo CSS adicional para centrar vertical y horizontalmente
             "display": "flex",  # Usa flexbox para disposición
@@ -1,43 +1,24 @@
 from dash import html  # Importa componentes HTML para construir la interfaz
 import dash_bootstrap_components as dbc  # Importa componentes Bootstrap para diseño estilizado
-import pandas as pd  # Importa pandas para manipular y analizar datos en DataFrames
-
-# Cargar datos desde un archivo Excel
-df = pd.read_excel("jugadores.xlsx")
-
-# --- Preprocesamiento de datos ---
-
-# Crear una columna "Ataque" en el DataFrame
-# Calcula una métrica personalizada basada en estadísticas ofensivas y penalizaciones
-df["Ataque"] = (
-    (df["Puntos Totales"] + df["Rebotes Ofensivos"] + df["Asistencias"]) / df["Minutos Jugados"]  # Métricas ofensivas
-    - (df["Tapones Recibidos"] + df["Pérdidas"]) / df["Minutos Jugados"]  # Penalización por métricas negativas
-)
-
-# Limitar los valores de la métrica "Ataque" entre 0 y 1 para mantener consistencia
-df["Ataque"] = df["Ataque"].clip(0, 1)
 
 # --- Componente de la tarjeta personalizada ---
 
-def CardAtaque(players_df):
+def CardAtaque():
     """
     Genera una tarjeta que muestra el promedio de la métrica "Ataque" para los jugadores seleccionados.
-    
-    :param players_df: DataFrame con los datos de los jugadores seleccionados.
+
+    La tarjeta se construye una sola vez; el callback de la página solo
+    actualiza los textos con los identificadores `ataque-value` (promedio)
+    y `ataque-stats` (mediana, desviación típica y percentiles).
+
     :return: Un componente Dash Card con diseño Bootstrap.
     """
     
-    # Calcular el promedio de la columna "Ataque" en el DataFrame proporcionado
-    tcp2_average = players_df["Ataque"].mean()
-    
-    # Formatear el promedio como texto con dos decimales seguido de un porcentaje
-    average_text = f"{tcp2_average:.2f}%"
-    
     # Crear el contenido de la tarjeta usando un diseño de filas y columnas
     card_content = dbc.Row([
         # Columna con el texto grande del promedio
         dbc.Col(html.Div(
-            average_text,  # Muestra el promedio calculado
+            id="ataque-value",  # Texto del promedio, actualizado por el callback
             style={  # Estilo CSS para el texto
                 "font-size": "2.5rem",  # Tamaño grande del texto
                 "font-weight": "bold",  # Negrita
@@ -56,6 +37,15 @@ def CardAtaque(players_df):
                     "color": "#5a6e7f",  # Mismo color azul grisáceo
                     "textAlign": "center"  # Texto centrado
                 }
+            ),
+            # Estadísticos adicionales de la ventana (mediana, desviación típica y percentiles)
+            html.Small(
+                id="ataque-stats",
+                style={
+                    "font-size": "0.75rem",  # Texto pequeño bajo la etiqueta
+                    "color": "#8592a3",  # Gris más claro que el promedio
+                    "textAlign": "center"  # Texto centrado
+                }
             )
         ]), width="auto", style={  # Estilo CSS adicional para centrar vertical y horizontalmente
             "display": "flex",
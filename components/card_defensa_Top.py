@@ -1,44 +1,24 @@
 from dash import html  # Importa componentes HTML para construir la interfaz
 import dash_bootstrap_components as dbc  # Importa componentes Bootstrap para diseño estilizado
-import pandas as pd  # Importa pandas para manipular y analizar datos en DataFrames
-
-# --- Carga y preprocesamiento de datos ---
-
-# Cargar datos desde un archivo Excel
-df = pd.read_excel("jugadores.xlsx")
-
-# Crear una columna "Defensa" en el DataFrame
-# Calcula una métrica personalizada basada en estadísticas defensivas y penalizaciones
-df["Defensa"] = (
-    (df["Recuperaciones"] + df["Rebotes Defensivos"] + df["Tapones Cometidos"] + df["Faltas Personales Recibidas"])
-    / df["Minutos Jugados"]  # Métricas defensivas positivas normalizadas por minutos jugados
-    - df["Faltas Personales Cometidas"] / df["Minutos Jugados"]  # Penalización por métricas negativas
-)
-
-# Limitar los valores de la métrica "Defensa" entre 0 y 1 para mantener consistencia
-df["Defensa"] = df["Defensa"].clip(0, 1)
 
 # --- Componente de la tarjeta personalizada ---
 
-def CardDefensa(players_df):
+def CardDefensa():
     """
     Genera una tarjeta que muestra el promedio de la métrica "Defensa" para los jugadores seleccionados.
-    
-    :param players_df: DataFrame con los datos de los jugadores seleccionados.
+
+    La tarjeta se construye una sola vez; el callback de la página solo
+    actualiza los textos con los identificadores `defensa-value` (promedio)
+    y `defensa-stats` (mediana, desviación típica y percentiles).
+
     :return: Un componente Dash Card con diseño Bootstrap.
     """
     
-    # Calcular el promedio de la columna "Defensa" en el DataFrame proporcionado
-    tcp2_average = players_df["Defensa"].mean()
-    
-    # Formatear el promedio como texto con dos decimales seguido de un porcentaje
-    average_text = f"{tcp2_average:.2f}%"
-    
     # Crear el contenido de la tarjeta usando un diseño de filas y columnas
     card_content = dbc.Row([
         # Columna con el texto grande del promedio
         dbc.Col(html.Div(
-            average_text,  # Muestra el promedio calculado
+            id="defensa-value",  # Texto del promedio, actualizado por el callback
             style={  # Estilo CSS para el texto
                 "font-size": "2.5rem",  # Tamaño grande del texto
                 "font-weight": "bold",  # Negrita
@@ -57,6 +37,15 @@ def CardDefensa(players_df):
                     "color": "#5a6e7f",  # Mismo color azul grisáceo
                     "textAlign": "center"  # Texto centrado
                 }
+            ),
+            # Estadísticos adicionales de la ventana (mediana, desviación típica y percentiles)
+            html.Small(
+                id="defensa-stats",
+                style={
+                    "font-size": "0.75rem",  # Texto pequeño bajo la etiqueta
+                    "color": "#8592a3",  # Gris más claro que el promedio
+                    "textAlign": "center"  # Texto centrado
+                }
             )
         ]), width="auto", style={  # Estilo CSS adicional para centrar vertical y horizontalmente
             "display": "flex",
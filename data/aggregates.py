@@ -0,0 +1,59 @@
+import numpy as np  # Para calcular todos los estadísticos en una sola reducción
+
+from data.index import metric_matrix  # Matriz contigua de métricas por versión
+from data.ranking import clamp_window, rank_order  # Ventanas del ranking precalculado
+
+# --- Agregados de las tarjetas de la liga ---
+
+# Métricas que resumen las tarjetas de la página de la liga
+CARD_METRICS = ["TC (%)", "TCP1 (%)", "Ataque", "Defensa"]
+
+# Percentiles que se calculan junto con el resto de estadísticos
+PERCENTILES = (25, 75)
+
+
+def _reduce(block, columns):
+    """
+    Calcula los estadísticos de todas las columnas del bloque a la vez.
+
+    :param block: Matriz (jugadores x métricas) de la ventana.
+    :param columns: Nombres de las métricas, en el orden de las columnas del bloque.
+    :return: Diccionario métrica -> {"mean", "median", "std", "p25", "p75", "count"}.
+    """
+    if len(block) == 0:
+        nan = float("nan")
+        return {column: dict(mean=nan, median=nan, std=nan, p25=nan, p75=nan, count=0)
+                for column in columns}
+
+    # Una reducción por estadístico sobre todas las métricas (eje 0 = jugadores)
+    means = np.nanmean(block, axis=0)
+    stds = np.nanstd(block, axis=0)
+    quantiles = np.nanpercentile(block, (50,) + PERCENTILES, axis=0)
+    counts = np.count_nonzero(~np.isnan(block), axis=0)
+
+    return {
+        column: dict(mean=float(means[i]), median=float(quantiles[0, i]), std=float(stds[i]),
+                     p25=float(quantiles[1, i]), p75=float(quantiles[2, i]), count=int(counts[i]))
+        for i, column in enumerate(columns)
+    }
+
+
+def window_stats(snapshot, offset, size, columns=CARD_METRICS):
+    """
+    Devuelve los estadísticos de las métricas para una ventana del ranking.
+
+    Los valores de la ventana se obtienen con una sola lectura de la matriz de
+    métricas y se resumen en una única pasada. No se guarda aquí: la página de
+    la liga ya guarda los textos de las tarjetas de cada ventana en su caché.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param offset: Posición inicial de la ventana (0 es el primer puesto).
+    :param size: Número de jugadores de la ventana.
+    :param columns: Métricas a resumir.
+    :return: Diccionario métrica -> estadísticos (media, mediana, desviación típica y percentiles).
+    """
+    start, end = clamp_window(snapshot, offset, size)
+
+    # Una sola lectura de la matriz de métricas para todas las filas de la ventana
+    block = metric_matrix(snapshot, columns)[rank_order(snapshot)[start:end]]
+    return _reduce(block, list(columns))
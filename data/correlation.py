@@ -0,0 +1,195 @@
+import numpy as np  # Para acumular las sumas con productos de matrices
+
+# --- Matriz de correlaciones ---
+
+# Número de pares de columnas que se sugieren por defecto en el gráfico de dispersión
+DEFAULT_PAIRS = 5
+
+
+def numeric_columns(frame):
+    """
+    Devuelve las columnas numéricas del DataFrame (las que se pueden correlacionar).
+
+    :param frame: DataFrame con los datos de los jugadores.
+    :return: Lista de nombres de columna.
+    """
+    return [column for column in frame.columns if frame[column].dtype.kind in "iuf"]
+
+
+class CorrelationSums:
+    """
+    Sumas acumuladas con las que se obtiene la correlación de todos los pares de columnas.
+
+    Para cada par se guardan el número de filas con ambos valores, las sumas,
+    las sumas de cuadrados y la suma de productos, todo con cuatro productos de
+    matrices sobre los datos. Los valores ausentes (NaN) se excluyen por pares,
+    como en `DataFrame.corr`. Añadir o sustituir filas solo requiere sumar (o
+    restar) sus contribuciones, sin volver a recorrer el resto de los datos.
+    """
+
+    def __init__(self, columns, shift):
+        """
+        :param columns: Nombres de las columnas.
+        :param shift: Valor que se resta a cada columna antes de acumular (su media
+            aproximada), para que las sumas no pierdan precisión.
+        """
+        self.columns = list(columns)
+        self.shift = np.asarray(shift, dtype=float)
+        size = len(self.columns)
+        self.count = np.zeros((size, size))  # Filas con ambos valores
+        self.sums = np.zeros((size, size))  # sums[i, j]: suma de la columna i donde j existe
+        self.squares = np.zeros((size, size))  # squares[i, j]: suma de cuadrados de i donde j existe
+        self.products = np.zeros((size, size))  # Suma de productos de cada par
+
+    @classmethod
+    def from_block(cls, columns, block):
+        """
+        Construye las sumas de un bloque de datos en una única pasada.
+
+        :param columns: Nombres de las columnas.
+        :param block: Matriz (filas x columnas) con los valores.
+        :return: Objeto `CorrelationSums`.
+        """
+        block = np.asarray(block, dtype=float)
+        finite = np.where(np.isfinite(block), block, np.nan)
+        with np.errstate(invalid="ignore"):
+            shift = np.nanmean(finite, axis=0) if len(block) else np.zeros(block.shape[1])
+        sums = cls(columns, np.nan_to_num(shift))
+        sums.add(block)
+        return sums
+
+    def _accumulate(self, block, sign):
+        """
+        Suma (o resta) las contribuciones de un bloque de filas.
+
+        :param block: Matriz (filas x columnas).
+        :param sign: 1 para añadir las filas, -1 para quitarlas.
+        """
+        block = np.asarray(block, dtype=float) - self.shift
+        valid = np.isfinite(block)
+        values = np.where(valid, block, 0.0)
+        mask = valid.astype(float)
+        self.count += sign * (mask.T @ mask)
+        self.sums += sign * (values.T @ mask)
+        self.squares += sign * ((values * values).T @ mask)
+        self.products += sign * (values.T @ values)
+
+    def add(self, block):
+        """
+        Añade filas nuevas a las sumas.
+
+        :param block: Matriz (filas x columnas) con las filas añadidas.
+        :return: El mismo objeto.
+        """
+        self._accumulate(block, 1)
+        return self
+
+    def replace(self, old_block, new_block):
+        """
+        Sustituye los valores de unas filas (por ejemplo, jugadores actualizados en directo).
+
+        :param old_block: Matriz con los valores anteriores de las filas.
+        :param new_block: Matriz con los valores nuevos de las mismas filas.
+        :return: El mismo objeto.
+        """
+        self._accumulate(old_block, -1)
+        self._accumulate(new_block, 1)
+        return self
+
+    def copy(self):
+        """
+        Devuelve una copia independiente de las sumas.
+
+        :return: Nuevo objeto `CorrelationSums`.
+        """
+        other = CorrelationSums(self.columns, self.shift)
+        other.count, other.sums = self.count.copy(), self.sums.copy()
+        other.squares, other.products = self.squares.copy(), self.products.copy()
+        return other
+
+    def matrix(self):
+        """
+        Calcula la matriz de correlaciones de Pearson a partir de las sumas.
+
+        :return: Matriz (columnas x columnas); NaN si un par no tiene variación o datos.
+        """
+        n = self.count
+        with np.errstate(divide="ignore", invalid="ignore"):
+            covariance = n * self.products - self.sums * self.sums.T
+            variance_i = n * self.squares - self.sums * self.sums
+            variance_j = variance_i.T
+            result = covariance / np.sqrt(variance_i * variance_j)
+        result[~(n > 1)] = np.nan
+        return np.clip(result, -1, 1)
+
+
+def correlation_sums(snapshot):
+    """
+    Devuelve las sumas de correlación de una versión de los datos (se calculan una sola vez).
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :return: Objeto `CorrelationSums` con todas las columnas numéricas.
+    """
+    def build():
+        columns = numeric_columns(snapshot.frame)
+        return CorrelationSums.from_block(columns, snapshot.frame[columns].to_numpy(dtype=float))
+    return snapshot.memo("correlation_sums", build)
+
+
+def correlation_matrix(snapshot):
+    """
+    Devuelve la matriz de correlaciones de todas las columnas numéricas de una versión.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :return: Tupla (nombres de las columnas, matriz de correlaciones).
+    """
+    def build():
+        sums = correlation_sums(snapshot)
+        return sums.columns, sums.matrix()
+    return snapshot.memo("correlation_matrix", build)
+
+
+def top_pairs(snapshot, count=DEFAULT_PAIRS):
+    """
+    Devuelve los pares de columnas con la correlación más fuerte (en valor absoluto).
+
+    Se descartan los pares de una columna consigo misma y los casi idénticos
+    (|r| ≥ 0.999, como un total y la suma de sus partes), que no aportan nada.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param count: Número de pares.
+    :return: Lista de tuplas (columna X, columna Y, correlación), de más a menos fuerte.
+    """
+    columns, matrix = correlation_matrix(snapshot)
+    upper = np.triu(np.abs(matrix), k=1)  # Cada par una sola vez
+    upper[~np.isfinite(upper) | (upper >= 0.999)] = 0
+    flat = np.flatnonzero(upper)
+    if not len(flat):
+        return []
+    count = min(count, len(flat))
+    best = flat[np.argpartition(-upper.ravel()[flat], count - 1)[:count]]
+    best = best[np.argsort(-upper.ravel()[best], kind="stable")]
+    size = len(columns)
+    return [(columns[i // size], columns[i % size], float(matrix.ravel()[i])) for i in best]
+
+
+def carry_forward(old_snapshot, new_snapshot, rows):
+    """
+    Pasa las sumas de correlación de una versión a la siguiente cuando solo cambian unas filas.
+
+    Si la versión anterior aún no calculó sus sumas no se hace nada: la nueva
+    las calculará completas cuando se pidan.
+
+    :param old_snapshot: Versión anterior.
+    :param new_snapshot: Versión nueva, con las mismas filas y columnas.
+    :param rows: Posiciones de las filas que han cambiado.
+    :return: True si las sumas se han actualizado de forma incremental.
+    """
+    old_sums = old_snapshot.cached("correlation_sums")
+    if old_sums is None:
+        return False
+    columns = old_sums.columns
+    sums = old_sums.copy().replace(old_snapshot.take(rows, columns).to_numpy(dtype=float),
+                                   new_snapshot.take(rows, columns).to_numpy(dtype=float))
+    new_snapshot.memo("correlation_sums", lambda: sums)
+    return True
@@ -0,0 +1,697 @@
+import hashlib  # Para calcular la huella (hash) del libro de Excel
+import json  # Para guardar los metadatos de la caché en disco
+import os  # Para manejar rutas y fechas de modificación de archivos
+import shutil  # Para borrar del disco las versiones antiguas de la caché
+import tempfile  # Para escribir la caché de forma atómica
+import threading  # Para proteger la carga compartida y el hilo de recarga
+import time  # Para la espera entre comprobaciones del vigilante
+import weakref  # Para reiniciar los bloqueos de las versiones tras un fork
+
+import numpy as np  # Para seleccionar las filas de las vistas en el modo compartido
+import pandas as pd  # Para leer el libro de Excel
+
+from data.metrics import derive_metrics, required_columns  # Métricas derivadas
+from data.partitions import (COMPETITION_COLUMN, SEASON_COLUMN, add_partition_columns,
+                             open_store, write_store)  # Almacén particionado
+from data.shared import open_shared, select_rows, write_shared  # Imagen compartida entre procesos
+
+# --- Configuración de rutas ---
+
+# Carpeta raíz del proyecto (un nivel por encima de este paquete)
+ROOT_FOLDER = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+# Nombre del libro de Excel con las estadísticas de los jugadores
+DATA_FILENAME = "jugadores.xlsx"
+
+# Carpeta donde se guarda la caché columnar (se puede cambiar con una variable de entorno)
+CACHE_FOLDER = os.environ.get("DATASET_CACHE_DIR", os.path.join(ROOT_FOLDER, ".cache", "dataset"))
+
+# Segundos entre comprobaciones del libro para la recarga en caliente (0 la desactiva)
+RELOAD_INTERVAL = float(os.environ.get("DATASET_RELOAD_INTERVAL", "30"))
+
+# Modo compartido: todos los procesos proyectan en memoria la misma imagen de los datos
+SHARED_MODE = os.environ.get("DATASET_SHARED") == "1"
+
+# Versiones del libro que se conservan en disco: la vigente y las anteriores que aún
+# pueden estar usando los workers que no han recargado (el resto se borra)
+KEEP_VERSIONS = int(os.environ.get("DATASET_KEEP_VERSIONS", "2"))
+
+# Estructuras derivadas que no dependen de las estadísticas: las versiones con
+# delta (datos en directo) las reutilizan de su versión base
+INHERITED_MEMOS = ("name_index", "search_index", "partitions")
+
+# --- Estado compartido por el proceso ---
+
+_lock = threading.Lock()  # Evita que dos hilos lean el libro a la vez
+_snapshot = None  # Versión de los datos que ven las páginas en este momento
+_watcher = None  # Hilo que vigila los cambios del libro
+_snapshots = weakref.WeakSet()  # Versiones vivas, para reiniciar sus bloqueos tras un fork
+
+
+def _reset_locks():
+    """
+    Reinicia el bloqueo de carga y los de las versiones en el hijo de un `fork`: el hijo
+    solo tiene un hilo y no debe esperar a bloqueos que tomaron otros hilos del padre.
+    """
+    global _lock
+    _lock = threading.Lock()
+    for snapshot in list(_snapshots):
+        snapshot._memo_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
+def data_path():
+    """
+    Devuelve la ruta del libro de Excel con los datos de los jugadores.
+
+    Se puede forzar con la variable de entorno `JUGADORES_XLSX`. Si no, se busca
+    `jugadores.xlsx` en la raíz del proyecto sin distinguir mayúsculas.
+
+    :return: Ruta absoluta del libro de Excel.
+    """
+    if os.environ.get("JUGADORES_XLSX"):
+        return os.path.abspath(os.environ["JUGADORES_XLSX"])
+
+    # Buscar el archivo ignorando mayúsculas ("Jugadores.xlsx" o "jugadores.xlsx")
+    for filename in sorted(os.listdir(ROOT_FOLDER)):
+        if filename.lower() == DATA_FILENAME:
+            return os.path.join(ROOT_FOLDER, filename)
+    return os.path.join(ROOT_FOLDER, DATA_FILENAME)
+
+
+def _file_hash(path):
+    """
+    Calcula el hash SHA-256 del archivo indicado.
+
+    :param path: Ruta del archivo.
+    :return: Hash en hexadecimal.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load(path):
+    """
+    Carga el libro de Excel usando el almacén columnar particionado cuando es posible.
+
+    El almacén se indexa por el hash del archivo. Si la fecha de modificación y
+    el tamaño no han cambiado se reutiliza sin volver a calcular el hash.
+
+    :param path: Ruta del libro de Excel.
+    :return: Tupla (almacén `PartitionStore` o None, DataFrame o None, hash del libro).
+        Si el almacén no se puede escribir se devuelve el DataFrame completo.
+    """
+    stat = os.stat(path)
+    pointer = os.path.join(CACHE_FOLDER, "latest.json")
+
+    # Camino rápido: misma fecha y tamaño que la última carga conocida
+    try:
+        with open(pointer, encoding="utf-8") as f:
+            latest = json.load(f)
+    except (OSError, ValueError):
+        latest = {}
+    if latest.get("path") == path and latest.get("mtime_ns") == stat.st_mtime_ns \
+            and latest.get("size") == stat.st_size:
+        store = open_store(os.path.join(CACHE_FOLDER, latest["sha256"]))
+        if store is not None:
+            return store, None, latest["sha256"]
+
+    # Camino normal: identificar el contenido por su hash
+    sha256 = _file_hash(path)
+    folder = os.path.join(CACHE_FOLDER, sha256)
+    store = open_store(folder)
+    frame = None
+    if store is None:
+        frame = add_partition_columns(pd.read_excel(path))  # Camino lento: leer el Excel con openpyxl
+        try:
+            write_store(frame, folder, {"sha256": sha256, "source": os.path.basename(path)})
+            store, frame = open_store(folder), None
+        except OSError:
+            pass  # El almacén es opcional: si no se puede escribir, seguimos en memoria
+
+    # Recordar la fecha y el tamaño para el camino rápido de la próxima carga
+    try:
+        os.makedirs(CACHE_FOLDER, exist_ok=True)
+        fd, tmp_pointer = tempfile.mkstemp(dir=CACHE_FOLDER, prefix=".tmp-", suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                       "sha256": sha256}, f)
+        os.replace(tmp_pointer, pointer)
+    except OSError:
+        pass  # La caché es opcional: si no se puede escribir, seguimos sin ella
+
+    return store, frame, sha256
+
+
+# --- Versiones inmutables de los datos ---
+
+class Snapshot:
+    """
+    Versión inmutable del conjunto de datos de jugadores.
+
+    Un callback obtiene la versión actual una sola vez con `current()` y trabaja
+    con ella hasta el final, aunque mientras tanto se publique otra versión.
+    Las estructuras derivadas (índices, rankings...) se guardan con `memo` y
+    viven lo mismo que la versión a la que pertenecen.
+
+    Si la versión está respaldada por un almacén particionado, el DataFrame
+    completo solo se lee cuando se pide `frame`; `view` permite leer únicamente
+    una temporada y competición con las columnas necesarias.
+
+    En el modo compartido el DataFrame está proyectado en memoria y ordenado
+    por partición (`ranges`): las vistas de una temporada son cortes sin copia.
+
+    Las versiones efímeras (datos en directo, ver `data.live`) duran pocos
+    segundos: sus figuras no se guardan en la caché en disco. Se publican como
+    un delta (filas y columnas cambiadas) sobre la versión del libro. Sus vistas,
+    columnas (`column`) y filas (`take`) se sirven desde la base más las filas
+    cambiadas: el DataFrame completo solo se construye si algún callback pide `frame`.
+    """
+
+    def __init__(self, frame, version, stat=None, store=None, ranges=None, ephemeral=False, base=None,
+                 delta=None):
+        """
+        :param frame: DataFrame con los datos y las métricas derivadas (None si se lee del almacén).
+        :param version: Identificador de la versión (hash del libro de origen).
+        :param stat: Fecha y tamaño del libro de origen al construir la versión.
+        :param store: Almacén particionado del que se leen los datos (opcional).
+        :param ranges: Rango de filas de cada partición en `frame` (modo compartido).
+        :param ephemeral: Si es True, la versión se sustituirá enseguida por otra (datos en directo).
+        :param base: Versión sobre la que se aplica `delta` (si `frame` es None).
+        :param delta: Tupla (posiciones de fila ordenadas, diccionario columna -> valores en esas filas).
+        """
+        self._frame = frame
+        self.version = version
+        self.stat = stat
+        self.store = store
+        self.ranges = ranges
+        self.ephemeral = ephemeral
+        self.base = base
+        self.delta = delta
+        self._memo = {}
+        self._memo_lock = threading.RLock()  # Reentrante: una estructura puede depender de otra
+        _snapshots.add(self)
+
+    @property
+    def frame(self):
+        """
+        DataFrame completo de la versión, con las métricas derivadas.
+        """
+        if self._frame is None:
+            if self.base is not None:
+                self._frame = self.memo("frame", self._apply_delta)
+            else:
+                self._frame = self.memo("frame", lambda: derive_metrics(self.store.read()))
+        return self._frame
+
+    def _apply_delta(self):
+        """
+        Construye el DataFrame completo aplicando el delta sobre una copia de la versión base.
+
+        :return: DataFrame nuevo; la versión base no se modifica.
+        """
+        frame = self.base.frame.copy()
+        rows, values = self.delta
+        for column, column_values in values.items():
+            if frame[column].dtype != column_values.dtype:
+                frame[column] = frame[column].astype(column_values.dtype)  # Enteros con incrementos decimales
+            frame.iloc[rows, frame.columns.get_loc(column)] = column_values
+        return frame
+
+    def __len__(self):
+        """
+        Número de filas de la versión (en una versión con delta, sin construir el DataFrame).
+        """
+        if self._frame is None and self.base is not None:
+            return len(self.base)
+        return len(self.frame)
+
+    def column(self, name):
+        """
+        Devuelve los valores de una columna como array de NumPy.
+
+        En una versión con delta solo se copia esa columna de la versión base
+        y se sustituyen los valores que han cambiado.
+
+        :param name: Nombre de la columna.
+        :return: Array con un valor por fila (no se debe modificar).
+        """
+        if self._frame is not None or self.base is None:
+            return self.frame[name].to_numpy()
+        rows, values = self.delta
+        if name not in values:
+            return self.base.column(name)
+        column = self.base.column(name).astype(values[name].dtype)  # Copia
+        column[rows] = values[name]
+        return column
+
+    def take(self, rows, columns=None):
+        """
+        Devuelve algunas filas de la versión sin construir el DataFrame completo.
+
+        En una versión con delta, las filas se leen de la versión base y se
+        sustituyen los valores que han cambiado.
+
+        :param rows: Posiciones de las filas.
+        :param columns: Columnas que se devuelven (None para todas).
+        :return: DataFrame nuevo (una copia) con las filas en el orden pedido.
+        """
+        if self.base is None or self._frame is not None:
+            frame = self.frame.iloc[rows]
+            return (frame if columns is None else frame[list(columns)]).copy()
+        frame = self.base.take(rows, columns)
+        delta_rows, values = self.delta
+        found = np.searchsorted(delta_rows, rows)
+        hit = found < len(delta_rows)
+        hit[hit] = delta_rows[found[hit]] == np.asarray(rows)[hit]
+        for column in frame.columns.intersection(list(values)):
+            column_values = frame[column].to_numpy().astype(values[column].dtype)  # Copia
+            column_values[hit] = values[column][found[hit]]
+            frame[column] = column_values
+        return frame
+
+    def partitions(self):
+        """
+        Devuelve las particiones (temporada, competición) disponibles en esta versión.
+
+        :return: Lista ordenada de tuplas (temporada, competición).
+        """
+        def build():
+            if self.store is not None:
+                return self.store.partitions()
+            if self.ranges is not None:
+                return sorted(self.ranges)
+            pairs = self.frame[[SEASON_COLUMN, COMPETITION_COLUMN]].drop_duplicates()
+            return sorted(map(tuple, pairs.to_numpy().tolist()))
+        return self.memo("partitions", build)
+
+    def view(self, season=None, competition=None, columns=None):
+        """
+        Devuelve la versión restringida a una temporada y competición.
+
+        Con un almacén particionado solo se leen las particiones que cumplen el
+        filtro y, si se indican, las columnas pedidas (más las que necesiten sus
+        métricas derivadas). La vista se guarda y se reutiliza mientras viva la versión.
+
+        :param season: Temporada (None para todas).
+        :param competition: Competición (None para todas).
+        :param columns: Columnas que necesita la vista (None para todas).
+        :return: Versión `Snapshot` con los datos de la vista.
+        """
+        if season is None and competition is None and columns is None:
+            return self
+        columns = None if columns is None else tuple(columns)
+
+        def build():
+            if self._frame is None and self.base is not None:
+                return self._delta_view(season, competition, columns)
+            if self.store is not None:
+                raw_columns = None if columns is None else required_columns(columns)
+                frame = derive_metrics(self.store.read(season, competition, raw_columns))
+            elif self.ranges is not None:
+                # Modo compartido: cortes de la imagen proyectada (sin copia si las filas son contiguas);
+                # se conservan todas las columnas porque no ocupan memoria propia
+                rows = select_rows(self.ranges, season, competition)
+                if len(rows) <= 1:
+                    start, stop = rows[0] if rows else (0, 0)
+                    frame = self.frame.iloc[start:stop]
+                else:
+                    frame = self.frame.take(np.concatenate([np.arange(*r) for r in rows]).astype(np.intp))
+                frame.index = pd.RangeIndex(len(frame))  # Posiciones desde 0, sin copiar los datos
+            else:
+                mask = True
+                if season is not None:
+                    mask = mask & (self.frame[SEASON_COLUMN] == season)
+                if competition is not None:
+                    mask = mask & (self.frame[COMPETITION_COLUMN] == competition)
+                frame = self.frame if mask is True else self.frame[mask].reset_index(drop=True)
+                if columns is not None:
+                    frame = frame[list(columns)]
+            version = f"{self.version}/{season or '*'}/{competition or '*'}"
+            return Snapshot(frame, version, ephemeral=self.ephemeral)
+        return self.memo(("view", season, competition, columns), build)
+
+    def _view_rows(self, season, competition):
+        """
+        Devuelve las posiciones (en esta versión) de las filas de una vista, en el orden de la vista.
+
+        Todas las vistas conservan el orden de las filas de la versión completa.
+
+        :param season: Temporada (None para todas).
+        :param competition: Competición (None para todas).
+        :return: Array ordenado de posiciones de fila.
+        """
+        def build():
+            mask = np.ones(len(self.frame), dtype=bool)
+            if season is not None:
+                mask &= (self.frame[SEASON_COLUMN] == season).to_numpy()
+            if competition is not None:
+                mask &= (self.frame[COMPETITION_COLUMN] == competition).to_numpy()
+            return np.flatnonzero(mask)
+        return self.memo(("view_rows", season, competition), build)
+
+    def _delta_view(self, season, competition, columns):
+        """
+        Construye la vista de una versión con delta: la vista de la base más las filas cambiadas de la vista.
+
+        :param season: Temporada (None para todas).
+        :param competition: Competición (None para todas).
+        :param columns: Columnas que necesita la vista (None para todas).
+        :return: Versión `Snapshot` con delta sobre la vista de la versión base.
+        """
+        base = self.base.view(season, competition, columns)
+        rows, values = self.delta
+        if season is not None or competition is not None:
+            positions = self.base._view_rows(season, competition)
+            found = np.searchsorted(positions, rows)
+            inside = found < len(positions)
+            inside[inside] = positions[found[inside]] == rows[inside]
+            rows, values = found[inside], {column: v[inside] for column, v in values.items()}
+        present = set(base.frame.columns)  # En el modo particionado la vista solo lee algunas columnas
+        values = {column: v for column, v in values.items() if column in present}
+        version = f"{self.version}/{season or '*'}/{competition or '*'}"
+        view = Snapshot(None, version, ephemeral=self.ephemeral, base=base, delta=(rows, values))
+        return view.inherit(base, INHERITED_MEMOS)
+
+    def memo(self, key, builder):
+        """
+        Devuelve una estructura derivada de esta versión, construyéndola la primera vez.
+
+        :param key: Clave de la estructura derivada.
+        :param builder: Función sin argumentos que construye la estructura.
+        :return: Estructura derivada asociada a la clave.
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        with self._memo_lock:
+            if key not in self._memo:
+                self._memo[key] = builder()
+            return self._memo[key]
+
+    def cached(self, key):
+        """
+        Devuelve una estructura derivada solo si ya se construyó.
+
+        :param key: Clave de la estructura derivada.
+        :return: La estructura, o None si aún no existe.
+        """
+        return self._memo.get(key)
+
+    def inherit(self, other, keys):
+        """
+        Reutiliza estructuras derivadas de otra versión que siguen siendo válidas en esta.
+
+        Por ejemplo, el índice de nombres no cambia si solo cambian las estadísticas.
+
+        :param other: Versión de la que se copian las estructuras.
+        :param keys: Claves de `memo` que se reutilizan (las que no existan se ignoran).
+        :return: Esta misma versión.
+        """
+        with other._memo_lock:
+            inherited = {key: other._memo[key] for key in keys if key in other._memo}
+        with self._memo_lock:
+            self._memo.update(inherited)
+        return self
+
+
+def memo_keys():
+    """
+    Devuelve las estructuras derivadas ya construidas en las versiones vivas del proceso.
+
+    :return: Conjunto de tuplas (identificador de la versión en memoria, clave de `memo`).
+    """
+    return {(id(snapshot), key) for snapshot in list(_snapshots) for key in list(snapshot._memo)}
+
+
+def new_memos(before, names):
+    """
+    Devuelve las estructuras derivadas construidas desde `memo_keys()` cuyo nombre está en `names`.
+
+    Sirve para devolver al proceso principal lo que calculó una tarea en un
+    proceso hijo (ver `utils.background`), que se pierde al terminar el hijo.
+
+    :param before: Resultado de `memo_keys()` antes de empezar.
+    :param names: Nombres de las estructuras (la clave o su primer elemento, como "sorted_values").
+    :return: Diccionario versión -> {clave: estructura}.
+    """
+    found = {}
+    for snapshot in list(_snapshots):
+        for key, value in list(snapshot._memo.items()):
+            name = key[0] if isinstance(key, tuple) else key
+            if name in names and (id(snapshot), key) not in before:
+                found.setdefault(snapshot.version, {})[key] = value
+    return found
+
+
+def adopt_memos(memos):
+    """
+    Incorpora a las versiones vivas del proceso las estructuras derivadas calculadas en otro.
+
+    Las versiones que ya tienen una estructura la conservan; las que no existen
+    en este proceso se ignoran (se calcularán aquí si alguien las pide).
+
+    :param memos: Diccionario versión -> {clave: estructura} devuelto por `new_memos`.
+    """
+    if not memos:
+        return
+    for snapshot in list(_snapshots):
+        entries = memos.get(snapshot.version)
+        if entries:
+            with snapshot._memo_lock:
+                for key, value in entries.items():
+                    snapshot._memo.setdefault(key, value)
+
+
+def _file_stat(path):
+    """
+    Devuelve la fecha de modificación y el tamaño del archivo.
+
+    :param path: Ruta del archivo.
+    :return: Tupla (mtime en nanosegundos, tamaño en bytes).
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _build_snapshot(path):
+    """
+    Carga el libro y calcula las métricas derivadas en una versión nueva.
+
+    :param path: Ruta del libro de Excel.
+    :return: Nueva versión `Snapshot`.
+    """
+    stat = _file_stat(path)
+    store, frame, sha256 = _load(path)
+    _mark_used(sha256)
+    if SHARED_MODE:
+        return _shared_snapshot(store, frame, sha256, stat)
+    if frame is not None:
+        derive_metrics(frame)
+    return Snapshot(frame, sha256[:12], stat, store)
+
+
+def _mark_used(sha256):
+    """
+    Actualiza la fecha de los archivos en disco de una versión para que cuente como la más reciente.
+
+    :param sha256: Hash del libro.
+    """
+    for name in (sha256, f"{sha256}.shared"):
+        try:
+            os.utime(os.path.join(CACHE_FOLDER, name))
+        except OSError:
+            pass  # La versión no tiene almacén (o imagen) en disco
+
+
+def _stored_versions():
+    """
+    Devuelve las versiones guardadas en disco y la última vez que se usaron.
+
+    :return: Diccionario hash del libro -> fecha de uso (la más reciente de su almacén y su imagen).
+    """
+    used = {}
+    try:
+        names = os.listdir(CACHE_FOLDER)
+    except OSError:
+        return used
+    for name in names:
+        sha256 = name[:-len(".shared")] if name.endswith(".shared") else name
+        if len(sha256) != 64 or name.startswith("."):
+            continue  # Archivos temporales y `latest.json`
+        try:
+            used[sha256] = max(used.get(sha256, 0), os.path.getmtime(os.path.join(CACHE_FOLDER, name)))
+        except OSError:
+            pass
+    return used
+
+
+def recent_versions(keep=KEEP_VERSIONS):
+    """
+    Devuelve las versiones usadas más recientemente, que se conservan en disco.
+
+    Las demás cachés en disco (figuras, precalentamiento) borran lo que no pertenezca a ellas.
+
+    :param keep: Número de versiones que se conservan.
+    :return: Conjunto de identificadores de versión (hash abreviado, como `Snapshot.version`).
+    """
+    used = _stored_versions()
+    return {sha256[:12] for sha256 in sorted(used, key=used.get, reverse=True)[:keep]}
+
+
+def prune_versions(keep=KEEP_VERSIONS):
+    """
+    Borra del disco los almacenes e imágenes compartidas de las versiones antiguas.
+
+    Se conservan las `keep` versiones usadas más recientemente: un worker que
+    aún no ha recargado puede seguir leyendo la anterior. Las imágenes ya
+    proyectadas en memoria siguen siendo válidas aunque se borre su archivo.
+
+    :param keep: Número de versiones que se conservan.
+    """
+    used = _stored_versions()
+    for sha256 in sorted(used, key=used.get, reverse=True)[keep:]:
+        for name in (sha256, f"{sha256}.shared"):
+            shutil.rmtree(os.path.join(CACHE_FOLDER, name), ignore_errors=True)
+
+
+def _shared_snapshot(store, frame, sha256, stat):
+    """
+    Construye la versión del modo compartido a partir de la imagen proyectada en memoria.
+
+    El primer proceso que carga una versión escribe la imagen (datos completos
+    con las métricas derivadas); el resto la proyecta sin volver a calcular nada.
+
+    :param store: Almacén particionado (o None).
+    :param frame: DataFrame leído del libro si no hay almacén (o None).
+    :param sha256: Hash del libro.
+    :param stat: Fecha y tamaño del libro.
+    :return: Nueva versión `Snapshot`.
+    """
+    folder = os.path.join(CACHE_FOLDER, f"{sha256}.shared")
+    shared = open_shared(folder)
+    if shared is None:
+        frame = derive_metrics(store.read() if frame is None else frame)
+        try:
+            write_shared(frame, folder)
+            shared = open_shared(folder)
+        except OSError:
+            return Snapshot(frame, sha256[:12], stat)  # Sin imagen: datos propios del proceso
+    frame, ranges = shared
+    return Snapshot(frame, sha256[:12], stat, ranges=ranges)
+
+
+def current():
+    """
+    Devuelve la versión de los datos publicada en este momento.
+
+    La primera llamada carga el libro; las siguientes devuelven la versión vigente.
+
+    :return: Versión actual `Snapshot`.
+    """
+    global _snapshot
+    if _snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                _snapshot = _build_snapshot(data_path())
+                prune_versions()
+    return _snapshot
+
+
+def publish(snapshot, replaces=None):
+    """
+    Publica una versión de los datos construida fuera del libro de Excel.
+
+    Sirve para datos sintéticos (benchmarks), generados por otros procesos o
+    recibidos en directo. Igual que en la recarga, la sustitución es una única
+    asignación atómica.
+
+    :param snapshot: Nueva versión `Snapshot` que verán las páginas.
+    :param replaces: Si se indica, solo se publica si la versión vigente sigue siendo
+        esta (evita pisar una recarga del libro publicada mientras tanto).
+    :return: La misma versión publicada, o None si la versión vigente había cambiado.
+    """
+    global _snapshot
+    with _lock:
+        if replaces is not None and _snapshot is not replaces:
+            return None
+        _snapshot = snapshot
+    return snapshot
+
+
+def reload_if_changed():
+    """
+    Comprueba si el libro ha cambiado y, en tal caso, publica una versión nueva.
+
+    La versión nueva se construye completa antes de sustituir a la anterior, de
+    modo que la publicación es una única asignación atómica.
+
+    :return: True si se ha publicado una versión nueva.
+    """
+    global _snapshot
+    path = data_path()
+    old = current()
+    if _file_stat(path) == old.stat:
+        return False
+
+    new = _build_snapshot(path)
+    with _lock:
+        if new.version == _snapshot.version:
+            _snapshot.stat = new.stat  # Mismo contenido (p. ej. solo cambió la fecha)
+            return False
+        _snapshot = new
+    prune_versions()
+    print(f"Datos de jugadores recargados: versión {new.version}")
+    return True
+
+
+def _watch(interval):
+    """
+    Bucle del hilo vigilante: comprueba el libro cada `interval` segundos.
+
+    :param interval: Segundos entre comprobaciones.
+    """
+    while True:
+        time.sleep(interval)
+        try:
+            reload_if_changed()
+        except Exception as error:  # El libro puede estar a medio escribir: se reintenta
+            print(f"No se pudo recargar el libro de jugadores: {error}")
+
+
+def start_watcher(interval=None):
+    """
+    Arranca (una sola vez por proceso) el hilo que recarga los datos en caliente.
+
+    :param interval: Segundos entre comprobaciones; por defecto `RELOAD_INTERVAL`.
+    :return: Hilo vigilante, o None si la recarga está desactivada.
+    """
+    global _watcher
+    interval = RELOAD_INTERVAL if interval is None else interval
+    if interval <= 0:
+        return None
+    with _lock:
+        if _watcher is None or not _watcher.is_alive():  # Tras un fork el hilo del padre no existe
+            _watcher = threading.Thread(target=_watch, args=(interval,),
+                                        name="dataset-watcher", daemon=True)
+            _watcher.start()
+    return _watcher
+
+
+def load_players():
+    """
+    Devuelve el DataFrame de jugadores de la versión actual.
+
+    El libro se lee una sola vez por proceso; las siguientes llamadas devuelven
+    el mismo DataFrame hasta que se publique una versión nueva.
+
+    :return: DataFrame con los datos de los jugadores.
+    """
+    return current().frame
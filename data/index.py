@@ -0,0 +1,81 @@
+import numpy as np  # Para guardar las métricas en una matriz contigua
+
+from data.partitions import SEASON_COLUMN, season_rank  # Temporada de cada fila y su orden
+
+# --- Índice de jugadores por nombre ---
+
+# Métricas que se muestran en el gráfico de radar
+RADAR_METRICS = ['TCP2 (%)', 'TCP3 (%)', 'TCP1 (%)', 'Ataque', 'Defensa']
+
+
+def name_index(snapshot):
+    """
+    Devuelve un diccionario nombre -> posición de fila para una versión de los datos.
+
+    Se construye una sola vez por versión. Con varias temporadas un jugador
+    aparece en varias filas: se usa la de su temporada más reciente según
+    `season_rank` (y, si en ella jugó varias competiciones, la primera de esa
+    temporada), igual que en los datos en directo. Para buscar en una temporada o competición concreta
+    se pasa la vista correspondiente (`snapshot.view(temporada, competición)`).
+
+    :param snapshot: Versión (o vista) de los datos obtenida con `current()`.
+    :return: Diccionario con la posición de cada jugador en el DataFrame.
+    """
+    def build():
+        frame = snapshot.frame
+        names = frame["Nombre"].to_numpy()
+        if SEASON_COLUMN not in frame.columns:
+            ranks = np.zeros(len(names), dtype=np.intp)  # Vista sin la columna de temporada: la primera fila
+        else:
+            # Orden de cada temporada (una vez por etiqueta, no por fila); el mismo año en
+            # dos formatos tiene el mismo orden
+            labels, codes = np.unique(frame[SEASON_COLUMN].to_numpy().astype(str), return_inverse=True)
+            keys = [season_rank(label) for label in labels]
+            order = {key: rank for rank, key in enumerate(sorted(set(keys)))}
+            ranks = np.array([order[key] for key in keys], dtype=np.intp)[codes]
+        index, latest = {}, {}
+        for position, (name, rank) in enumerate(zip(names, ranks.tolist())):
+            if name not in index or rank > latest[name]:
+                index[name], latest[name] = position, rank
+        return index
+    return snapshot.memo("name_index", build)
+
+
+def metric_matrix(snapshot, columns=RADAR_METRICS):
+    """
+    Devuelve las columnas indicadas como una matriz NumPy contigua (jugadores x métricas).
+
+    En una versión con delta (datos en directo) se parte de la matriz de la
+    versión base y solo se sustituyen las filas cambiadas.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param columns: Columnas numéricas que forman la matriz.
+    :return: Matriz `float64` con una fila por jugador.
+    """
+    columns = tuple(columns)
+
+    def build():
+        if snapshot.base is None:
+            return np.ascontiguousarray(snapshot.frame[list(columns)].to_numpy(dtype=float))
+        matrix = metric_matrix(snapshot.base, columns).copy()
+        rows, values = snapshot.delta
+        for j, column in enumerate(columns):
+            if column in values:
+                matrix[rows, j] = values[column]
+        return matrix
+    return snapshot.memo(("metric_matrix", columns), build)
+
+
+def lookup(snapshot, names, columns=RADAR_METRICS):
+    """
+    Busca varios jugadores a la vez y devuelve sus métricas en una única operación.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param names: Nombres de los jugadores a buscar.
+    :param columns: Columnas numéricas a devolver.
+    :return: Tupla (nombres encontrados, matriz con una fila por jugador encontrado).
+    """
+    index = name_index(snapshot)
+    found = [name for name in names if name in index]  # Los nombres desconocidos se ignoran
+    positions = np.fromiter((index[name] for name in found), dtype=np.intp, count=len(found))
+    return found, metric_matrix(snapshot, columns)[positions]
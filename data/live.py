@@ -0,0 +1,353 @@
+import json  # Para leer los eventos (una línea JSON por evento)
+import os  # Para leer la configuración y seguir el archivo de eventos
+import queue  # Para pasar los eventos del lector al hilo que los aplica
+import socketserver  # Para recibir eventos por un socket TCP (sustituto del feed real)
+import threading  # Para leer y aplicar los eventos en segundo plano
+import time  # Para la espera entre lotes de eventos
+
+import numpy as np  # Para actualizar solo las filas afectadas
+
+from data.correlation import carry_forward  # Correlaciones actualizadas solo con las filas cambiadas
+from data.dataset import INHERITED_MEMOS, Snapshot, current, publish  # Versiones de los datos compartidos
+from data.index import name_index  # Fila de cada jugador en su temporada más reciente
+from data.metrics import dependents, derive_metrics  # Métricas derivadas (Ataque, Defensa, PER)
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de partición
+
+# --- Configuración de los datos en directo ---
+
+# Origen de los eventos: ruta de un archivo JSON lines o "tcp://host:puerto" (vacío lo desactiva)
+LIVE_SOURCE = os.environ.get("LIVE_SOURCE", "")
+
+# Segundos entre publicaciones: los eventos recibidos mientras tanto se aplican en un solo lote
+LIVE_BATCH_INTERVAL = float(os.environ.get("LIVE_BATCH_INTERVAL", "1"))
+
+# Milisegundos entre comprobaciones de versión desde el navegador (dcc.Interval)
+LIVE_REFRESH_MS = int(os.environ.get("LIVE_REFRESH_MS", "3000"))
+
+# Incrementos de las columnas del libro para cada tipo de evento del box score
+EVENTS = {
+    "tiro2_anotado": {"Puntos Totales": 2, "TCP2 anotados": 1, "TCP2 Intentados": 1,
+                      "Tiros de campo Anotados": 1, "Tiros de campo Intentados": 1},
+    "tiro2_fallado": {"TCP2 Intentados": 1, "Tiros de campo Intentados": 1},
+    "tiro3_anotado": {"Puntos Totales": 3, "TCP3 anotados": 1, "TCP3 Intentados": 1,
+                      "Tiros de campo Anotados": 1, "Tiros de campo Intentados": 1},
+    "tiro3_fallado": {"TCP3 Intentados": 1, "Tiros de campo Intentados": 1},
+    "tiro_libre_anotado": {"Puntos Totales": 1, "Tiros Libres Anotados": 1, "Tiros libres Intentados": 1},
+    "tiro_libre_fallado": {"Tiros libres Intentados": 1},
+    "rebote_ofensivo": {"Rebotes Ofensivos": 1, "Rebotes Totales": 1},
+    "rebote_defensivo": {"Rebotes Defensivos": 1, "Rebotes Totales": 1},
+    "asistencia": {"Asistencias": 1},
+    "recuperacion": {"Recuperaciones": 1},
+    "perdida": {"Pérdidas": 1},
+    "tapon_cometido": {"Tapones Cometidos": 1},
+    "tapon_recibido": {"Tapones Recibidos": 1},
+    "falta_cometida": {"Faltas Personales Cometidas": 1},
+    "falta_recibida": {"Faltas Personales Recibidas": 1},
+    "minutos": {"Minutos Jugados": 1},  # Con "cantidad" = minutos jugados desde el último evento
+    "partido": {"Nº Partidos jugados": 1},  # El jugador empieza un partido nuevo
+}
+
+# Porcentajes del libro que se recalculan a partir de sus columnas (anotados, intentados)
+RATIO_COLUMNS = {
+    "TCP2 (%)": ("TCP2 anotados", "TCP2 Intentados"),
+    "TCP3 (%)": ("TCP3 anotados", "TCP3 Intentados"),
+    "TC (%)": ("Tiros de campo Anotados", "Tiros de campo Intentados"),
+    "TCP1 (%)": ("Tiros Libres Anotados", "Tiros libres Intentados"),
+}
+
+_RESET = object()  # Marca en la cola: volver a los datos del libro (el archivo se truncó o se reinició)
+
+
+def event_deltas(event):
+    """
+    Convierte un evento en los incrementos de las columnas del libro.
+
+    Formatos admitidos (una línea JSON por evento):
+    `{"jugador": "Juan Pérez", "evento": "tiro3_anotado"}`,
+    `{"jugador": "Juan Pérez", "evento": "minutos", "cantidad": 2}` o
+    `{"jugador": "Juan Pérez", "estadisticas": {"Asistencias": 1}}`.
+    Opcionalmente, "temporada" y "competicion" eligen la fila del jugador.
+
+    :param event: Diccionario con el evento.
+    :return: Diccionario columna -> incremento, o None si el evento no es válido.
+    """
+    if "estadisticas" in event:
+        deltas = event["estadisticas"]
+    elif event.get("evento") in EVENTS:
+        amount = event.get("cantidad", 1)
+        deltas = {column: value * amount for column, value in EVENTS[event["evento"]].items()}
+    else:
+        return None
+    if not isinstance(deltas, dict) or not all(isinstance(v, (int, float)) for v in deltas.values()):
+        return None
+    return deltas
+
+
+class LiveFeed:
+    """
+    Ingesta de eventos del box score en directo.
+
+    Un hilo lee los eventos (archivo que crece o socket) y otro los aplica por
+    lotes cada `interval` segundos. Cada lote suma los incrementos solo en las
+    filas de los jugadores afectados, recalcula sus porcentajes y métricas
+    derivadas (sin tocar el resto) y publica una versión efímera de los datos.
+    Las versiones publicadas nunca se modifican: cada lote publica un delta
+    nuevo (las filas cambiadas desde la versión del libro) sobre ella.
+
+    Si el libro de Excel cambia (recarga en caliente), los eventos siguientes se
+    aplican sobre la versión nueva del libro.
+    """
+
+    def __init__(self, source, interval=LIVE_BATCH_INTERVAL):
+        """
+        :param source: Ruta del archivo de eventos o "tcp://host:puerto".
+        :param interval: Segundos entre lotes.
+        """
+        self.source = source
+        self.interval = interval
+        self.applied = 0  # Eventos aplicados
+        self.skipped = 0  # Eventos inválidos o de jugadores desconocidos
+        self._queue = queue.Queue()
+        self._base = None  # Versión del libro sobre la que se acumulan los eventos
+        self._published = None  # Última versión publicada por este feed
+        self._delta = None  # (filas, columna -> valores) cambiados desde la versión del libro
+        self._rows = None  # (nombre, temporada, competición) -> fila
+        self._latest = None  # nombre -> fila de su temporada más reciente
+        self._sequence = 0  # Número de lote (no se reinicia: las versiones nunca se repiten)
+        self._threads = []
+
+    # --- Aplicación de los eventos ---
+
+    def _rebase(self, snapshot):
+        """
+        Empieza a acumular eventos sobre una versión del libro.
+
+        :param snapshot: Versión de los datos; si es efímera, se vuelve a la del libro.
+        """
+        if snapshot.ephemeral and self._base is not None:
+            snapshot = self._base
+        frame = snapshot.frame
+        self._rows = {}
+        names = frame["Nombre"].to_numpy()
+        partitions = zip(frame[SEASON_COLUMN].to_numpy(), frame[COMPETITION_COLUMN].to_numpy())
+        for row, (name, (season, competition)) in enumerate(zip(names, partitions)):
+            self._rows.setdefault((name, season, competition), row)
+        self._latest = name_index(snapshot)  # Misma fila que el radar: la de su temporada más reciente
+        self._base = self._published = snapshot
+        self._delta = (np.empty(0, dtype=np.intp), {})
+
+    def _row(self, event):
+        """
+        Devuelve la fila del jugador del evento.
+
+        :param event: Diccionario con el evento.
+        :return: Posición de la fila, o None si el jugador no existe.
+        """
+        name = event.get("jugador")
+        if "temporada" in event or "competicion" in event:
+            return self._rows.get((name, event.get("temporada"), event.get("competicion")))
+        return self._latest.get(name)
+
+    def apply(self, events):
+        """
+        Aplica un lote de eventos y publica una versión nueva de los datos.
+
+        El coste no depende del número de jugadores: las sumas, los porcentajes
+        y las métricas derivadas solo se calculan para las filas afectadas, y la
+        versión se publica como un delta sobre la del libro (sin copiar el
+        DataFrame, que en el modo compartido sigue proyectado en memoria).
+
+        :param events: Lista de diccionarios con los eventos.
+        :return: Versión publicada, o None si ningún evento era válido.
+        """
+        snapshot = current()
+        if snapshot is not self._published:
+            self._rebase(snapshot)  # Primer lote o recarga del libro
+
+        # Acumular los incrementos por columna y fila
+        totals, columns = {}, set(self._base.frame.columns)
+        for event in events:
+            row, deltas = self._row(event), event_deltas(event)
+            if row is None or deltas is None or not columns.issuperset(deltas):
+                self.skipped += 1
+                continue
+            for column, value in deltas.items():
+                per_row = totals.setdefault(column, {})
+                per_row[row] = per_row.get(row, 0) + value
+            self.applied += 1
+        if not totals:
+            return None
+
+        # Filas afectadas con sus valores actuales (copia solo de esas filas)
+        rows = np.array(sorted(set().union(*totals.values())), dtype=np.intp)
+        affected = self._published.take(rows)
+        for column, per_row in totals.items():
+            increments = np.array([per_row.get(row, 0) for row in rows])
+            values = affected[column].to_numpy()
+            affected[column] = values.astype(np.result_type(values, increments)) + increments
+
+        # Porcentajes y métricas derivadas solo de las filas afectadas
+        changed = set(totals)
+        for ratio, (made, attempted) in RATIO_COLUMNS.items():
+            if ratio in affected.columns and (made in changed or attempted in changed):
+                made_values = affected[made].to_numpy(dtype=float)
+                attempted_values = affected[attempted].to_numpy(dtype=float)
+                affected[ratio] = np.divide(made_values, attempted_values, out=np.zeros(len(rows)),
+                                            where=attempted_values > 0)  # Sin intentos: 0, como en el libro
+                changed.add(ratio)
+        derive_metrics(affected, changed)
+        changed = [column for column in affected.columns if column in changed | dependents(changed)]
+
+        # Delta acumulado desde la versión del libro: filas y columnas cambiadas en algún lote
+        delta_rows, delta_values = self._delta
+        merged_rows = np.union1d(delta_rows, rows)
+        merged = self._published.take(merged_rows, sorted(set(delta_values).union(changed)))
+        positions = np.searchsorted(merged_rows, rows)
+        for column in changed:
+            values = merged[column].to_numpy()
+            values = values.astype(np.result_type(values, affected[column].to_numpy()))  # Copia
+            values[positions] = affected[column].to_numpy()
+            merged[column] = values
+        delta = (merged_rows, {column: merged[column].to_numpy() for column in merged.columns})
+
+        self._sequence += 1
+        snapshot = Snapshot(None, f"{self._base.version}+{self._sequence}", self._base.stat,
+                            ranges=self._base.ranges, ephemeral=True, base=self._base, delta=delta)
+        snapshot.inherit(self._base, INHERITED_MEMOS)
+        carry_forward(self._published, snapshot, rows)
+        if publish(snapshot, replaces=self._published) is None:
+            return None  # Se recargó el libro mientras tanto: el siguiente lote parte de él
+        self._published, self._delta = snapshot, delta
+        return snapshot
+
+    def _run(self):
+        """
+        Bucle del hilo que aplica los eventos por lotes.
+        """
+        while True:
+            batch = [self._queue.get()]  # Esperar al primer evento
+            time.sleep(self.interval)  # Reunir los eventos que lleguen mientras tanto
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _RESET in batch:
+                batch = batch[len(batch) - batch[::-1].index(_RESET):]  # Solo los eventos tras el reinicio
+                if self._base is not None:
+                    self._rebase(self._base)
+                    publish(self._base)
+            try:
+                if batch:
+                    self.apply(batch)
+            except Exception as error:  # Un lote erróneo no debe detener el directo
+                print(f"No se pudieron aplicar los eventos en directo: {error}")
+
+    # --- Lectura de los eventos ---
+
+    def _put_line(self, line):
+        """
+        Interpreta una línea del feed y la deja en la cola.
+
+        :param line: Texto de la línea (JSON).
+        """
+        line = line.strip()
+        if not line:
+            return
+        try:
+            event = json.loads(line)
+        except ValueError:
+            self.skipped += 1
+            return
+        if isinstance(event, dict):
+            self._queue.put(event)
+        else:
+            self.skipped += 1
+
+    def _tail(self, path, poll=0.2):
+        """
+        Sigue un archivo de eventos que solo crece (como `tail -f`), desde el principio.
+
+        Las líneas incompletas se esperan hasta que terminan. Si el archivo se
+        trunca (partido nuevo), se vuelve a los datos del libro y se lee desde el principio.
+
+        :param path: Ruta del archivo.
+        :param poll: Segundos entre comprobaciones cuando no hay datos nuevos.
+        """
+        while not os.path.exists(path):
+            time.sleep(poll)
+        with open(path, "rb") as f:  # En binario: `tell` es la posición real en bytes
+            pending = b""
+            while True:
+                chunk = f.readline()
+                if chunk:
+                    pending += chunk
+                    if pending.endswith(b"\n"):
+                        self._put_line(pending.decode("utf-8", errors="replace"))
+                        pending = b""
+                    continue
+                if os.path.getsize(path) < f.tell():
+                    f.seek(0)
+                    pending = b""
+                    self._queue.put(_RESET)
+                time.sleep(poll)
+
+    def _serve(self, address):
+        """
+        Recibe eventos por TCP: cada conexión envía líneas JSON.
+
+        :param address: Dirección "host:puerto" en la que se escucha.
+        """
+        host, port = address.rsplit(":", 1)
+        feed = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    feed._put_line(line.decode("utf-8", errors="replace"))
+
+        server = socketserver.ThreadingTCPServer((host, int(port)), Handler)
+        server.daemon_threads = True
+        server.serve_forever()
+
+    def start(self):
+        """
+        Arranca los hilos de lectura y aplicación (una sola vez por proceso).
+
+        :return: El mismo objeto.
+        """
+        if self._threads and all(thread.is_alive() for thread in self._threads):
+            return self
+        if self._base is not None:
+            self._queue.put(_RESET)  # Tras un fork: el archivo se vuelve a leer desde el principio
+        if self.source.startswith("tcp://"):
+            reader = threading.Thread(target=self._serve, args=(self.source[len("tcp://"):],),
+                                      name="live-reader", daemon=True)
+        else:
+            reader = threading.Thread(target=self._tail, args=(self.source,), name="live-reader", daemon=True)
+        applier = threading.Thread(target=self._run, name="live-applier", daemon=True)
+        self._threads = [reader, applier]
+        applier.start()
+        reader.start()
+        return self
+
+
+_feed = None  # Ingesta en directo del proceso
+_feed_lock = threading.Lock()
+
+
+def start_live_feed(source=None):
+    """
+    Arranca (una sola vez por proceso) la ingesta de eventos en directo.
+
+    :param source: Origen de los eventos; por defecto, `LIVE_SOURCE`.
+    :return: Objeto `LiveFeed`, o None si no hay origen configurado.
+    """
+    global _feed
+    source = source or LIVE_SOURCE
+    if not source:
+        return None
+    with _feed_lock:
+        if _feed is None:
+            _feed = LiveFeed(source)
+        return _feed.start()
@@ -0,0 +1,177 @@
+import numpy as np  # Para evaluar las métricas sobre arrays sin crear Series intermedias
+
+# --- Registro de métricas derivadas ---
+
+# Métricas registradas, por nombre y en orden de declaración
+METRICS = {}
+
+
+class Metric:
+    """
+    Métrica derivada declarada a partir de otras columnas del DataFrame.
+
+    Las entradas pueden ser columnas del libro o el nombre de otras métricas
+    registradas; el registro se encarga de evaluarlas en el orden correcto.
+    """
+
+    def __init__(self, name, inputs, function):
+        """
+        :param name: Nombre de la columna que se crea en el DataFrame.
+        :param inputs: Lista de columnas (o métricas) de las que depende.
+        :param function: Función que recibe los arrays de entrada y devuelve el array resultado.
+        """
+        self.name = name
+        self.inputs = list(inputs)
+        self.function = function
+
+
+def metric(name, inputs):
+    """
+    Decorador que registra una métrica derivada.
+
+    :param name: Nombre de la columna que se crea en el DataFrame.
+    :param inputs: Columnas (o métricas) de las que depende, en el orden de los argumentos.
+    :return: Decorador que registra la función y la devuelve sin cambios.
+    """
+    def register(function):
+        METRICS[name] = Metric(name, inputs, function)
+        _order.cache = None  # El orden de evaluación debe recalcularse
+        return function
+    return register
+
+
+def _order():
+    """
+    Devuelve las métricas registradas ordenadas según sus dependencias.
+
+    :return: Lista de objetos `Metric` en un orden de evaluación válido.
+    """
+    if _order.cache is None:
+        ordered, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependencia circular en la métrica '{name}'")
+            visiting.add(name)
+            for dependency in METRICS[name].inputs:
+                if dependency in METRICS:
+                    visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(METRICS[name])
+
+        for name in METRICS:
+            visit(name)
+        _order.cache = ordered
+    return _order.cache
+
+
+_order.cache = None
+
+
+def dependents(columns):
+    """
+    Devuelve los nombres de las métricas afectadas por un cambio en las columnas indicadas.
+
+    :param columns: Columnas que han cambiado.
+    :return: Conjunto con las métricas que dependen (directa o indirectamente) de ellas.
+    """
+    changed = set(columns)
+    affected = set()
+    for item in _order():
+        if changed.intersection(item.inputs) or affected.intersection(item.inputs):
+            affected.add(item.name)
+    return affected
+
+
+def required_columns(columns):
+    """
+    Devuelve las columnas del libro necesarias para obtener las columnas indicadas.
+
+    Las métricas derivadas se sustituyen (recursivamente) por sus entradas.
+
+    :param columns: Columnas que se quieren obtener (del libro o métricas derivadas).
+    :return: Lista de columnas del libro, sin repetidos.
+    """
+    required, pending = [], list(columns)
+    while pending:
+        column = pending.pop(0)
+        if column in METRICS:
+            pending.extend(METRICS[column].inputs)
+        elif column not in required:
+            required.append(column)
+    return required
+
+
+def derive_metrics(df, changed=None):
+    """
+    Evalúa las métricas registradas sobre el DataFrame en una única pasada ordenada.
+
+    :param df: DataFrame con las estadísticas de los jugadores (se modifica en el sitio).
+    :param changed: Columnas que han cambiado desde la última evaluación. Si se
+        indica, solo se recalculan las métricas que dependen de ellas; si es None,
+        se calculan todas. Las métricas cuyas entradas no están en el DataFrame
+        (por ejemplo, al leer solo algunas columnas) se omiten.
+    :return: El mismo DataFrame con las columnas derivadas.
+    """
+    pending = None if changed is None else dependents(changed)
+
+    # Ignorar las divisiones entre cero (jugadores sin minutos): el resultado queda en NaN/inf
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for item in _order():
+            if pending is not None and item.name not in pending:
+                continue
+            if not all(column in df.columns for column in item.inputs):
+                continue  # Faltan entradas: la métrica no se necesita en esta vista
+            arrays = [df[column].to_numpy() for column in item.inputs]
+            df[item.name] = item.function(*arrays)
+
+    return df
+
+
+# --- Declaración de las métricas ---
+
+@metric("Ataque", ["Puntos Totales", "Rebotes Ofensivos", "Asistencias",
+                   "Tapones Recibidos", "Pérdidas", "Minutos Jugados"])
+def ataque(puntos, rebotes_ofensivos, asistencias, tapones_recibidos, perdidas, minutos):
+    """
+    Métrica ofensiva: aportaciones positivas menos penalizaciones, por minuto jugado,
+    limitada entre 0 y 1.
+    """
+    result = np.add(puntos, rebotes_ofensivos, dtype=float)  # Único array nuevo; el resto se hace en el sitio
+    result += asistencias
+    result -= tapones_recibidos
+    result -= perdidas
+    result /= minutos
+    return np.clip(result, 0, 1, out=result)
+
+
+@metric("Defensa", ["Recuperaciones", "Rebotes Defensivos", "Tapones Cometidos",
+                    "Faltas Personales Recibidas", "Faltas Personales Cometidas", "Minutos Jugados"])
+def defensa(recuperaciones, rebotes_defensivos, tapones_cometidos, faltas_recibidas,
+            faltas_cometidas, minutos):
+    """
+    Métrica defensiva: aportaciones positivas menos faltas cometidas, por minuto jugado,
+    limitada entre 0 y 1.
+    """
+    result = np.add(recuperaciones, rebotes_defensivos, dtype=float)
+    result += tapones_cometidos
+    result += faltas_recibidas
+    result -= faltas_cometidas
+    result /= minutos
+    return np.clip(result, 0, 1, out=result)
+
+
+@metric("PER Aproximado", ["TCP1 (%)", "TCP2 (%)", "TCP3 (%)", "Ataque", "Defensa"])
+def per_aproximado(tcp1, tcp2, tcp3, ataque, defensa):
+    """
+    Métrica compuesta: promedio de los porcentajes de tiro y de las métricas de Ataque y Defensa.
+    """
+    result = np.add(tcp1, tcp2, dtype=float)
+    result += tcp3
+    result += ataque
+    result += defensa
+    result /= 5
+    return result
@@ -0,0 +1,138 @@
+import numpy as np  # Para ordenar una vez y buscar con searchsorted
+
+# --- Normalización de las métricas ---
+
+# Escalas disponibles: valores originales, percentil (0 a 1) y puntuación z
+VALUES = "valores"
+PERCENTILE = "percentil"
+ZSCORE = "z"
+
+# Etiquetas de las escalas para los selectores de las páginas
+SCALE_LABELS = {VALUES: "Valores", PERCENTILE: "Percentiles", ZSCORE: "Puntuación z"}
+
+
+def sorted_values(snapshot, column):
+    """
+    Devuelve los valores de una columna ordenados (sin NaN); se ordenan una sola vez por versión.
+
+    En una versión con delta (datos en directo) se quitan del array de la
+    versión base los valores anteriores de las filas cambiadas y se insertan
+    los nuevos, sin volver a ordenar.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Columna numérica.
+    :return: Array `float64` ordenado de menor a mayor.
+    """
+    def build():
+        rows, changed = snapshot.delta if snapshot.base is not None else (None, {})
+        if column in changed:
+            reference = sorted_values(snapshot.base, column)
+            old = snapshot.base.column(column).astype(float)[rows]
+            old = np.sort(old[~np.isnan(old)])
+            new = changed[column].astype(float)
+            new = np.sort(new[~np.isnan(new)])
+            kept = np.delete(reference, np.searchsorted(reference, old, side="left")
+                             + _repeat_offsets(old))
+            return np.insert(kept, np.searchsorted(kept, new), new)
+        if snapshot.base is not None:
+            return sorted_values(snapshot.base, column)
+        values = snapshot.frame[column].to_numpy(dtype=float)
+        return np.sort(values[~np.isnan(values)])
+    return snapshot.memo(("sorted_values", column), build)
+
+
+def _repeat_offsets(values):
+    """
+    Devuelve, para un array ordenado, cuántas veces aparece antes cada valor repetido.
+
+    Sirve para quitar de un array ordenado varios valores iguales (uno por aparición).
+
+    :param values: Array ordenado.
+    :return: Array de enteros (0 para la primera aparición de cada valor).
+    """
+    return np.arange(len(values)) - np.searchsorted(values, values, side="left")
+
+
+def column_moments(snapshot, column):
+    """
+    Devuelve la media y la desviación típica de una columna (una sola vez por versión).
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Columna numérica.
+    :return: Tupla (media, desviación típica); la desviación es 1 si la columna es constante.
+    """
+    def build():
+        values = sorted_values(snapshot, column)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return 0.0, 1.0
+        std = float(values.std())
+        return float(values.mean()), std if std > 0 else 1.0
+    return snapshot.memo(("column_moments", column), build)
+
+
+def _column_values(snapshot, column, values):
+    """
+    Devuelve los valores que se normalizan: los indicados o la columna completa.
+
+    :param snapshot: Versión de los datos.
+    :param column: Columna numérica.
+    :param values: Valores a normalizar (o None para toda la columna).
+    :return: Array `float64`.
+    """
+    if values is None:
+        return snapshot.column(column).astype(float, copy=False)
+    return np.asarray(values, dtype=float)
+
+
+def percentile_ranks(snapshot, column, values=None):
+    """
+    Devuelve el percentil (entre 0 y 1) de cada valor dentro de la columna de la versión.
+
+    Los empates reciben el percentil medio de su grupo. El coste es una búsqueda
+    binaria por valor sobre el array ya ordenado: no se ordena nada por petición.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Columna numérica de referencia.
+    :param values: Valores a convertir (por ejemplo, los de unos jugadores); None para toda la columna.
+    :return: Array de percentiles (NaN donde el valor es NaN).
+    """
+    reference = sorted_values(snapshot, column)
+    values = _column_values(snapshot, column, values)
+    if not len(reference):
+        return np.full(values.shape, np.nan)
+    below = np.searchsorted(reference, values, side="left")
+    below_or_equal = np.searchsorted(reference, values, side="right")
+    ranks = (below + below_or_equal) / (2 * len(reference))
+    ranks[np.isnan(values)] = np.nan
+    return ranks
+
+
+def z_scores(snapshot, column, values=None):
+    """
+    Devuelve la puntuación z de cada valor respecto a la columna de la versión.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Columna numérica de referencia.
+    :param values: Valores a convertir; None para toda la columna.
+    :return: Array de puntuaciones z.
+    """
+    mean, std = column_moments(snapshot, column)
+    return (_column_values(snapshot, column, values) - mean) / std
+
+
+def normalize(snapshot, column, values=None, scale=PERCENTILE):
+    """
+    Convierte valores de una columna a la escala indicada.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Columna numérica de referencia.
+    :param values: Valores a convertir; None para toda la columna.
+    :param scale: `VALUES`, `PERCENTILE` o `ZSCORE`.
+    :return: Array con los valores en la escala pedida.
+    """
+    if scale == PERCENTILE:
+        return percentile_ranks(snapshot, column, values)
+    if scale == ZSCORE:
+        return z_scores(snapshot, column, values)
+    return _column_values(snapshot, column, values)
@@ -0,0 +1,179 @@
+import json  # Para guardar los metadatos del almacén
+import os  # Para manejar las rutas de las particiones
+import shutil  # Para eliminar directorios temporales
+import tempfile  # Para escribir el almacén de forma atómica
+from urllib.parse import quote  # Para usar los valores de partición como nombres de carpeta
+
+import numpy as np  # Para guardar y leer las columnas en formato .npy
+import pandas as pd  # Para construir los DataFrames leídos
+
+# --- Almacén columnar particionado por temporada y competición ---
+
+# Columnas por las que se particionan los datos
+SEASON_COLUMN = "Temporada"
+COMPETITION_COLUMN = "Competición"
+
+# Valores que se usan cuando el libro no incluye las columnas de partición
+DEFAULT_SEASON = os.environ.get("DATASET_DEFAULT_SEASON", "Actual")
+DEFAULT_COMPETITION = os.environ.get("DATASET_DEFAULT_COMPETITION", "WorldCup")
+
+# Versión del formato del almacén; cambiarla invalida los almacenes antiguos
+STORE_FORMAT = 2
+
+
+def season_rank(season):
+    """
+    Clave para ordenar las temporadas de la más antigua a la más reciente.
+
+    Las temporadas se comparan por su año de inicio, así que "2023-24" y
+    "2023-2024" son la misma y cualquier formato ordena bien. La temporada por
+    defecto (`DEFAULT_SEASON`, la de un libro sin columna de temporada) es la
+    actual y va la última; las etiquetas sin año van las primeras.
+
+    :param season: Etiqueta de la temporada.
+    :return: Tupla comparable (usar como `key` de `sorted` o `max`).
+    """
+    season = str(season)
+    if season == DEFAULT_SEASON:
+        return 2, 0, season
+    year = season[:4]
+    if year.isdigit():
+        return 1, int(year), ""
+    return 0, 0, season
+
+
+def add_partition_columns(frame):
+    """
+    Asegura que el DataFrame tenga las columnas de temporada y competición (como texto).
+
+    :param frame: DataFrame leído del libro (se modifica en el sitio).
+    :return: El mismo DataFrame.
+    """
+    for column, default in ((SEASON_COLUMN, DEFAULT_SEASON), (COMPETITION_COLUMN, DEFAULT_COMPETITION)):
+        if column in frame.columns:
+            frame[column] = frame[column].fillna(default).astype(str)
+        else:
+            frame[column] = default
+    return frame
+
+
+def _partition_folder(season, competition):
+    """
+    Devuelve la ruta relativa de una partición (estilo `temporada=.../competicion=...`).
+
+    :param season: Temporada de la partición.
+    :param competition: Competición de la partición.
+    :return: Ruta relativa de la carpeta de la partición.
+    """
+    return os.path.join(f"temporada={quote(season, safe='')}", f"competicion={quote(competition, safe='')}")
+
+
+def write_store(frame, folder, meta):
+    """
+    Guarda el DataFrame particionado por temporada y competición, un `.npy` por columna.
+
+    La escritura se hace en una carpeta temporal que después se renombra, de
+    modo que otro proceso nunca ve un almacén a medio escribir.
+
+    :param frame: DataFrame con las columnas de partición (ver `add_partition_columns`).
+    :param folder: Carpeta final del almacén.
+    :param meta: Metadatos del archivo de origen (hash y nombre).
+    """
+    parent = os.path.dirname(folder)
+    os.makedirs(parent, exist_ok=True)
+    tmp_folder = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        columns = [{"name": column, "kind": "str" if frame[column].dtype == object else "num"}
+                   for column in frame.columns]
+
+        partitions = []
+        groups = frame.groupby([SEASON_COLUMN, COMPETITION_COLUMN], sort=True).indices
+        for (season, competition), rows in groups.items():
+            partition = _partition_folder(season, competition)
+            os.makedirs(os.path.join(tmp_folder, partition))
+            for i, column in enumerate(columns):
+                values = frame[column["name"]].to_numpy()[rows]
+                if column["kind"] == "str":
+                    values = values.astype(str)  # Texto como unicode de NumPy (sin pickle)
+                np.save(os.path.join(tmp_folder, partition, f"{i:03d}.npy"), values, allow_pickle=False)
+            partitions.append({"season": season, "competition": competition,
+                               "folder": partition, "rows": len(rows)})
+
+        with open(os.path.join(tmp_folder, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(dict(meta, format=STORE_FORMAT, columns=columns, partitions=partitions),
+                      f, ensure_ascii=False)
+
+        os.replace(tmp_folder, folder)
+    except OSError:
+        # Otro proceso ya escribió el mismo almacén: nos quedamos con el suyo
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        if open_store(folder) is None:
+            raise
+
+
+def open_store(folder):
+    """
+    Abre un almacén particionado existente.
+
+    :param folder: Carpeta del almacén.
+    :return: Objeto `PartitionStore`, o None si no existe o tiene otro formato.
+    """
+    try:
+        with open(os.path.join(folder, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return PartitionStore(folder, meta) if meta.get("format") == STORE_FORMAT else None
+
+
+class PartitionStore:
+    """
+    Almacén columnar de solo lectura particionado por temporada y competición.
+
+    Permite leer solo las particiones y columnas que necesita cada vista, de modo
+    que la memoria y el tiempo de carga dependen del fragmento consultado y no
+    del archivo completo.
+    """
+
+    def __init__(self, folder, meta):
+        """
+        :param folder: Carpeta del almacén.
+        :param meta: Metadatos leídos de `meta.json`.
+        """
+        self.folder = folder
+        self.meta = meta
+        self.columns = [column["name"] for column in meta["columns"]]
+
+    def partitions(self):
+        """
+        Devuelve las particiones disponibles.
+
+        :return: Lista de tuplas (temporada, competición).
+        """
+        return [(p["season"], p["competition"]) for p in self.meta["partitions"]]
+
+    def read(self, season=None, competition=None, columns=None):
+        """
+        Lee las filas de las particiones que cumplen el filtro, solo con las columnas pedidas.
+
+        :param season: Temporada a leer (None para todas).
+        :param competition: Competición a leer (None para todas).
+        :param columns: Columnas a leer (None para todas).
+        :return: DataFrame con las filas y columnas seleccionadas.
+        """
+        wanted = set(self.columns if columns is None else columns)
+        selected = [p for p in self.meta["partitions"]
+                    if (season is None or p["season"] == season)
+                    and (competition is None or p["competition"] == competition)]
+
+        data = {}
+        for i, column in enumerate(self.meta["columns"]):
+            if column["name"] not in wanted:
+                continue  # Columna no pedida: no se lee del disco
+            parts = [np.load(os.path.join(self.folder, p["folder"], f"{i:03d}.npy"), allow_pickle=False)
+                     for p in selected]
+            values = np.concatenate(parts) if parts else np.array([], dtype=object if column["kind"] == "str" else float)
+            if column["kind"] == "str":
+                values = values.astype(object)  # Volver al tipo `object` que usa pandas para texto
+            data[column["name"]] = values
+        return pd.DataFrame(data)
@@ -0,0 +1,92 @@
+import numpy as np  # Para calcular y guardar el orden del ranking
+
+# --- Ranking de jugadores ---
+
+# Métrica por la que se ordena el ranking de la liga
+RANKING_METRIC = "PER Aproximado"
+
+# Número de jugadores de la ventana cuando no se indica otro (por ejemplo, si se vacía el selector)
+DEFAULT_WINDOW_SIZE = 10
+
+
+def rank_order(snapshot, column=RANKING_METRIC):
+    """
+    Devuelve las posiciones de fila ordenadas de mayor a menor valor de la métrica.
+
+    El orden se calcula una sola vez por versión de los datos. Los valores
+    ausentes (NaN) quedan al final, como en `sort_values`. En una versión con
+    delta (datos en directo) solo se recolocan las filas cambiadas dentro del
+    orden de la versión base.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param column: Métrica por la que se ordena.
+    :return: Array de posiciones de fila; el elemento i es el jugador con puesto i + 1.
+    """
+    def build():
+        if snapshot.base is not None:
+            return _patched_order(snapshot, column)
+        values = snapshot.frame[column].to_numpy(dtype=float)
+        return np.argsort(-values, kind="stable")  # Orden estable: los empates mantienen su orden
+    return snapshot.memo(("rank_order", column), build)
+
+
+def _patched_order(snapshot, column):
+    """
+    Calcula el orden de una versión con delta a partir del orden de su versión base.
+
+    Las filas cambiadas se quitan del orden base y se insertan con una búsqueda
+    binaria en su nuevo puesto; el resultado es el mismo que ordenar de nuevo.
+
+    :param snapshot: Versión con delta.
+    :param column: Métrica por la que se ordena.
+    :return: Array de posiciones de fila.
+    """
+    order = rank_order(snapshot.base, column)
+    rows, values = snapshot.delta
+    if column not in values or not len(rows):
+        return order
+
+    # Orden base sin las filas cambiadas, con sus claves (valores negados: de menor a mayor)
+    kept = order[~np.isin(order, rows)]
+    keys = -snapshot.base.column(column).astype(float)[kept]
+
+    # Puesto de cada fila cambiada: tras las de mayor valor y, a igual valor, por posición
+    new_keys = -values[column].astype(float)
+    moved = np.lexsort((rows, new_keys))  # NaN al final, como en argsort
+    positions = np.empty(len(rows), dtype=np.intp)
+    for i in moved:
+        left = np.searchsorted(keys, new_keys[i], side="left")
+        right = np.searchsorted(keys, new_keys[i], side="right")
+        positions[i] = left + np.searchsorted(kept[left:right], rows[i])  # Empates: orden de fila
+    return np.insert(kept, positions[moved], rows[moved])
+
+
+def clamp_window(snapshot, offset, size):
+    """
+    Ajusta una ventana del ranking a los límites de la versión de los datos.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param offset: Posición inicial (0 es el primer puesto).
+    :param size: Número de jugadores de la ventana (None usa `DEFAULT_WINDOW_SIZE`).
+    :return: Tupla (posición inicial, posición final exclusiva) dentro de los límites.
+    """
+    total = len(snapshot)
+    size = max(int(DEFAULT_WINDOW_SIZE if size is None else size), 1)
+    offset = min(max(int(offset or 0), 0), max(total - 1, 0))
+    return offset, min(offset + size, total)
+
+
+def rank_window(snapshot, offset, size, column=RANKING_METRIC):
+    """
+    Devuelve los jugadores de una ventana del ranking sin volver a ordenar.
+
+    El coste es proporcional al tamaño de la ventana, no al número de jugadores.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param offset: Posición inicial (0 es el primer puesto).
+    :param size: Número de jugadores de la ventana.
+    :param column: Métrica por la que se ordena.
+    :return: DataFrame con los jugadores de la ventana, de mayor a menor valor.
+    """
+    start, end = clamp_window(snapshot, offset, size)
+    return snapshot.take(rank_order(snapshot, column)[start:end])
@@ -0,0 +1,70 @@
+import numpy as np  # Para agrupar los puntos en celdas de forma vectorizada
+
+# --- Muestreo por densidad para gráficos con muchos puntos ---
+
+
+def density_sample(x, y, max_points, outlier_z=3.0, seed=0):
+    """
+    Elige una muestra representativa de puntos conservando la forma de la nube.
+
+    Los puntos se agrupan en una rejilla 2D y de cada celda se conserva como
+    máximo un número fijo de puntos, de modo que las zonas poco pobladas se
+    mantienen completas y las muy densas se reducen. Los valores atípicos
+    (|z| > `outlier_z` en cualquiera de los ejes) se conservan siempre.
+
+    :param x: Array con los valores del eje X.
+    :param y: Array con los valores del eje Y.
+    :param max_points: Número aproximado de puntos que se desea conservar.
+    :param outlier_z: Umbral de la puntuación z a partir del cual un punto es atípico.
+    :param seed: Semilla para que la muestra sea la misma en cada llamada.
+    :return: Array ordenado con las posiciones de los puntos conservados.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))  # Los puntos sin valor no se dibujan
+    if len(valid) <= max_points:
+        return valid
+
+    xv, yv = x[valid], y[valid]
+
+    # Valores atípicos: se conservan siempre
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.maximum(np.abs((xv - xv.mean()) / xv.std()), np.abs((yv - yv.mean()) / yv.std()))
+    outliers = np.nan_to_num(z) > outlier_z
+
+    # Asignar cada punto a una celda de una rejilla de `bins` x `bins`
+    bins = max(int(np.sqrt(max_points)), 1)
+    bx = _bin(xv, bins)
+    by = _bin(yv, bins)
+    cells = bx * bins + by
+
+    # Puntos por celda para que el total se acerque a `max_points`
+    occupied = len(np.unique(cells))
+    per_cell = max(max_points // occupied, 1)
+
+    # Orden aleatorio (reproducible) y después estable por celda: los primeros de cada celda forman la muestra
+    shuffled = np.random.default_rng(seed).permutation(len(cells))
+    order = shuffled[np.argsort(cells[shuffled], kind="stable")]
+    sorted_cells = cells[order]
+    starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    rank_in_cell = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+
+    keep = np.zeros(len(cells), dtype=bool)
+    keep[order[rank_in_cell < per_cell]] = True
+    keep |= outliers
+    return valid[keep]
+
+
+def _bin(values, bins):
+    """
+    Asigna cada valor a una de `bins` celdas equiespaciadas entre el mínimo y el máximo.
+
+    :param values: Array de valores finitos.
+    :param bins: Número de celdas.
+    :return: Array de enteros con el número de celda de cada valor.
+    """
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros(len(values), dtype=np.int64)
+    scaled = (values - low) * (bins / (high - low))
+    return np.minimum(scaled.astype(np.int64), bins - 1)
@@ -0,0 +1,137 @@
+import bisect  # Para buscar prefijos en la lista ordenada de palabras
+import unicodedata  # Para eliminar tildes y diacríticos de los nombres
+
+import numpy as np  # Para puntuar a todos los candidatos de una vez
+
+from data.index import name_index  # Índice de jugadores por nombre
+
+# --- Búsqueda de jugadores por nombre ---
+
+# Número de resultados que se devuelven por defecto
+DEFAULT_LIMIT = 20
+
+# Puntos extra cuando una palabra de la búsqueda es prefijo de una palabra del nombre
+PREFIX_BONUS = 2
+
+# Puntos extra cuando el nombre completo empieza por la búsqueda
+FULL_PREFIX_BONUS = 3
+
+
+def fold(text):
+    """
+    Normaliza un texto para buscar sin distinguir tildes ni mayúsculas.
+
+    :param text: Texto original (por ejemplo, "Galíndo").
+    :return: Texto en minúsculas, sin diacríticos y con espacios simples ("galindo").
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def _trigrams(text):
+    """
+    Devuelve los trigramas de un texto normalizado, con un espacio de relleno a cada lado.
+
+    :param text: Texto normalizado con `fold`.
+    :return: Conjunto de trigramas.
+    """
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+    """
+    Índice de búsqueda de nombres por trigramas y prefijos, insensible a tildes.
+
+    Se construye una sola vez por versión de los datos. Cada consulta solo
+    recorre las listas de los trigramas que contiene, no todos los nombres.
+    """
+
+    def __init__(self, names):
+        """
+        :param names: Nombres de los jugadores (sin repetidos).
+        """
+        self.names = list(names)
+        self.folded = [fold(name) for name in self.names]
+        self.lengths = np.fromiter((len(text) for text in self.folded), dtype=np.int64,
+                                   count=len(self.folded))
+
+        # Listas invertidas: trigrama -> posiciones de los nombres que lo contienen
+        postings = {}
+        for position, text in enumerate(self.folded):
+            for trigram in _trigrams(text):
+                postings.setdefault(trigram, []).append(position)
+        self.postings = {trigram: np.array(positions, dtype=np.int64)
+                         for trigram, positions in postings.items()}
+
+        # Palabras ordenadas (palabra, posición) para buscar prefijos con bisect
+        self.tokens = sorted((token, position) for position, text in enumerate(self.folded)
+                             for token in text.split())
+        self.token_keys = [token for token, _ in self.tokens]
+
+    def _prefix_matches(self, prefix):
+        """
+        Devuelve las posiciones de los nombres con alguna palabra que empieza por `prefix`.
+
+        :param prefix: Prefijo normalizado.
+        :return: Array de posiciones (puede contener repetidos).
+        """
+        start = bisect.bisect_left(self.token_keys, prefix)
+        end = bisect.bisect_left(self.token_keys, prefix + "\uffff")
+        return np.fromiter((position for _, position in self.tokens[start:end]), dtype=np.int64,
+                           count=end - start)
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        Devuelve los nombres que mejor coinciden con la búsqueda, ordenados por relevancia.
+
+        La puntuación suma los trigramas compartidos con la búsqueda y añade
+        puntos cuando las palabras de la búsqueda son prefijos de las del nombre.
+
+        :param query: Texto buscado por el usuario.
+        :param limit: Número máximo de resultados.
+        :return: Lista de nombres originales (con sus tildes).
+        """
+        text = fold(query)
+        if not text or not self.names:
+            return []
+
+        trigrams = _trigrams(text)
+        lists = [self.postings[trigram] for trigram in trigrams if trigram in self.postings]
+        size = len(self.names)
+        scores = np.zeros(size, dtype=np.int64)
+        if lists:
+            scores += np.bincount(np.concatenate(lists), minlength=size)
+
+        # Bonificaciones por prefijo de palabra y por prefijo del nombre completo
+        prefix_hits = np.zeros(size, dtype=bool)
+        for token in text.split():
+            matches = self._prefix_matches(token)
+            scores[np.unique(matches)] += PREFIX_BONUS
+            prefix_hits[matches] = True
+        for position in np.unique(self._prefix_matches(text.split()[0])):
+            if self.folded[position].startswith(text):
+                scores[position] += FULL_PREFIX_BONUS
+
+        # Descartar coincidencias débiles: menos de la mitad de los trigramas y sin prefijo
+        candidates = np.flatnonzero((scores * 2 >= len(trigrams)) | prefix_hits)
+        if len(candidates) == 0:
+            return []
+
+        # Elegir los mejores sin ordenar todos los candidatos; desempate por nombre más corto
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        order = np.lexsort((self.lengths[candidates], -scores[candidates]))
+        return [self.names[position] for position in candidates[order]]
+
+
+def search_index(snapshot):
+    """
+    Devuelve el índice de búsqueda de una versión de los datos (se construye una sola vez).
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :return: Objeto `SearchIndex` con los nombres de los jugadores.
+    """
+    return snapshot.memo("search_index", lambda: SearchIndex(name_index(snapshot)))
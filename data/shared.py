@@ -0,0 +1,120 @@
+import json  # Para guardar los metadatos de la imagen compartida
+import os  # Para manejar las rutas de la imagen
+import shutil  # Para eliminar directorios temporales
+import tempfile  # Para escribir la imagen de forma atómica
+
+import numpy as np  # Para guardar y proyectar (mmap) los bloques de columnas
+import pandas as pd  # Para construir el DataFrame sobre los bloques proyectados
+
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de partición
+
+# --- Imagen de los datos compartida entre procesos (memoria proyectada) ---
+
+# Versión del formato de la imagen; cambiarla invalida las imágenes antiguas
+SHARED_FORMAT = 1
+
+
+def write_shared(frame, folder):
+    """
+    Guarda el DataFrame completo (con las métricas derivadas) como imagen compartida.
+
+    Las filas se ordenan por temporada y competición para que cada partición
+    sea un rango contiguo. Las columnas numéricas se guardan en dos bloques 2D
+    (enteros y reales) que los procesos proyectan en memoria sin copiarlos;
+    el texto se guarda columna a columna.
+
+    :param frame: DataFrame con las columnas de partición y las métricas derivadas.
+    :param folder: Carpeta final de la imagen.
+    """
+    parent = os.path.dirname(folder)
+    os.makedirs(parent, exist_ok=True)
+    tmp_folder = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        frame = frame.sort_values([SEASON_COLUMN, COMPETITION_COLUMN], kind="stable")
+        int_columns = [c for c in frame.columns if frame[c].dtype.kind in "iub"]
+        float_columns = [c for c in frame.columns if frame[c].dtype.kind == "f"]
+        text_columns = [c for c in frame.columns if c not in int_columns and c not in float_columns]
+
+        # Bloques (columnas x filas): cada columna es una fila contigua del bloque
+        np.save(os.path.join(tmp_folder, "int64.npy"),
+                np.ascontiguousarray(frame[int_columns].to_numpy(dtype=np.int64).T))
+        np.save(os.path.join(tmp_folder, "float64.npy"),
+                np.ascontiguousarray(frame[float_columns].to_numpy(dtype=np.float64).T))
+        for i, column in enumerate(text_columns):
+            np.save(os.path.join(tmp_folder, f"text-{i:03d}.npy"), frame[column].to_numpy().astype(str),
+                    allow_pickle=False)
+
+        # Rango de filas de cada partición
+        partitions = []
+        seasons, competitions = frame[SEASON_COLUMN].to_numpy(), frame[COMPETITION_COLUMN].to_numpy()
+        start = 0
+        for stop in range(1, len(frame) + 1):
+            if stop == len(frame) or (seasons[stop], competitions[stop]) != (seasons[start], competitions[start]):
+                partitions.append({"season": seasons[start], "competition": competitions[start],
+                                   "start": start, "stop": stop})
+                start = stop
+
+        with open(os.path.join(tmp_folder, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"format": SHARED_FORMAT, "int_columns": int_columns, "float_columns": float_columns,
+                       "text_columns": text_columns, "partitions": partitions}, f, ensure_ascii=False)
+
+        os.replace(tmp_folder, folder)
+    except OSError:
+        # Otro proceso ya escribió la misma imagen: nos quedamos con la suya
+        shutil.rmtree(tmp_folder, ignore_errors=True)
+        if open_shared(folder) is None:
+            raise
+
+
+def open_shared(folder):
+    """
+    Proyecta en memoria (solo lectura) una imagen compartida.
+
+    Los bloques numéricos no se copian: todos los procesos que abren la misma
+    imagen comparten sus páginas en la caché del sistema operativo. Solo las
+    columnas de texto se convierten a objetos de Python en cada proceso.
+
+    :param folder: Carpeta de la imagen.
+    :return: Tupla (DataFrame, diccionario (temporada, competición) -> (inicio, fin)),
+        o None si la imagen no existe o tiene otro formato.
+    """
+    try:
+        with open(os.path.join(folder, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("format") != SHARED_FORMAT:
+        return None
+
+    ints = np.load(os.path.join(folder, "int64.npy"), mmap_mode="r")
+    floats = np.load(os.path.join(folder, "float64.npy"), mmap_mode="r")
+    frame = pd.concat([
+        pd.DataFrame(ints.T, columns=meta["int_columns"], copy=False),
+        pd.DataFrame(floats.T, columns=meta["float_columns"], copy=False),
+    ], axis=1, copy=False)
+    for i, column in enumerate(meta["text_columns"]):
+        values = np.load(os.path.join(folder, f"text-{i:03d}.npy"), allow_pickle=False)
+        frame.insert(i, column, values.astype(object))  # El texto va primero, como "Nombre" en el libro
+
+    ranges = {(p["season"], p["competition"]): (p["start"], p["stop"]) for p in meta["partitions"]}
+    return frame, ranges
+
+
+def select_rows(ranges, season=None, competition=None):
+    """
+    Devuelve los rangos de filas de las particiones que cumplen el filtro, fusionando los contiguos.
+
+    :param ranges: Diccionario (temporada, competición) -> (inicio, fin).
+    :param season: Temporada (None para todas).
+    :param competition: Competición (None para todas).
+    :return: Lista ordenada de tuplas (inicio, fin).
+    """
+    selected = sorted(bounds for (s, c), bounds in ranges.items()
+                      if (season is None or s == season) and (competition is None or c == competition))
+    merged = []
+    for start, stop in selected:
+        if merged and merged[-1][1] == start:
+            merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
@@ -0,0 +1,111 @@
+import numpy as np  # Para calcular las distancias de todos los jugadores de una vez
+
+from data.index import RADAR_METRICS, metric_matrix, name_index  # Métricas del radar por jugador
+
+# --- Búsqueda de jugadores similares ---
+
+# Número de jugadores similares que se devuelven por defecto
+DEFAULT_NEIGHBOURS = 4
+
+
+class SimilarityIndex:
+    """
+    Índice de vecinos más cercanos sobre las métricas del radar.
+
+    Cada métrica se normaliza (puntuación z) para que todas pesen lo mismo,
+    con independencia de su escala. Las distancias a todos los jugadores se
+    calculan de una vez con NumPy y los k más cercanos se eligen con
+    `argpartition`, sin ordenar el resto: con pocas métricas, esta búsqueda
+    exhaustiva tarda milisegundos incluso con cientos de miles de jugadores.
+    """
+
+    def __init__(self, names, matrix, metrics):
+        """
+        :param names: Nombres de los jugadores, uno por fila de la matriz.
+        :param matrix: Matriz (jugadores x métricas) con los valores originales.
+        :param metrics: Nombres de las métricas (columnas de la matriz).
+        """
+        self.names = names
+        self.metrics = list(metrics)
+        self.rows = {name: row for row, name in enumerate(names)}
+
+        matrix = np.asarray(matrix, dtype=float)
+        with np.errstate(invalid="ignore"):
+            mean = np.nanmean(matrix, axis=0) if len(matrix) else np.zeros(matrix.shape[1])
+            std = np.nanstd(matrix, axis=0) if len(matrix) else np.ones(matrix.shape[1])
+        std[~(std > 0)] = 1  # Métricas constantes: no aportan distancia
+        normalized = (matrix - mean) / std
+        normalized[~np.isfinite(normalized)] = 0  # Valores ausentes: en la media
+        self.matrix = np.ascontiguousarray(normalized, dtype=np.float32)
+
+    def weights(self, weights=None):
+        """
+        Convierte los pesos indicados en un array con un peso por métrica.
+
+        :param weights: Diccionario métrica -> peso, lista de pesos o None (todos iguales).
+        :return: Array `float32` de pesos no negativos.
+        """
+        if weights is None:
+            return np.ones(len(self.metrics), dtype=np.float32)
+        if isinstance(weights, dict):
+            weights = [weights.get(metric, 0) for metric in self.metrics]
+        return np.clip(np.asarray(weights, dtype=np.float32), 0, None)
+
+    def neighbours(self, name, k=DEFAULT_NEIGHBOURS, weights=None):
+        """
+        Devuelve los k jugadores más parecidos a uno dado.
+
+        :param name: Nombre del jugador de referencia.
+        :param k: Número de jugadores similares.
+        :param weights: Peso de cada métrica (ver `weights`).
+        :return: Lista de tuplas (nombre, similitud entre 0 y 1), de más a menos parecido.
+            Vacía si el jugador no existe.
+        """
+        row = self.rows.get(name)
+        if row is None or k <= 0:
+            return []
+        weights = self.weights(weights)
+
+        # Distancia euclídea ponderada al cuadrado de todos los jugadores al de referencia
+        difference = self.matrix - self.matrix[row]
+        difference *= difference
+        distances = difference @ weights
+        distances[row] = np.inf  # El propio jugador no cuenta
+
+        k = min(k, len(distances) - 1)
+        if k <= 0:
+            return []
+        nearest = np.argpartition(distances, k - 1)[:k]  # Los k menores, sin ordenar el resto
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        total = float(weights.sum()) or 1.0
+        return [(self.names[i], float(1 / (1 + np.sqrt(distances[i] / total)))) for i in nearest]
+
+
+def similarity_index(snapshot, metrics=RADAR_METRICS):
+    """
+    Devuelve el índice de similitud de una versión de los datos (se construye una sola vez).
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param metrics: Métricas con las que se comparan los jugadores.
+    :return: Objeto `SimilarityIndex` con un jugador por nombre.
+    """
+    metrics = tuple(metrics)
+
+    def build():
+        index = name_index(snapshot)
+        rows = np.fromiter(index.values(), dtype=np.intp, count=len(index))
+        return SimilarityIndex(list(index), metric_matrix(snapshot, metrics)[rows], metrics)
+    return snapshot.memo(("similarity_index", metrics), build)
+
+
+def similar_players(snapshot, name, k=DEFAULT_NEIGHBOURS, weights=None):
+    """
+    Devuelve los jugadores más parecidos a uno dado según las métricas del radar.
+
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param name: Nombre del jugador de referencia.
+    :param k: Número de jugadores similares.
+    :param weights: Diccionario métrica -> peso (por defecto, todas pesan lo mismo).
+    :return: Lista de tuplas (nombre, similitud), de más a menos parecido.
+    """
+    return similarity_index(snapshot).neighbours(name, k, weights)
@@ -2,20 +2,10 @@ from dash import Dash, html, dcc, callback, Output, Input
 import dash_bootstrap_components as dbc
 import plotly.express as px
 import plotly.graph_objects as go
-import pandas as pd
+from data.dataset import load_players
 
-# Cargar datos
-df = pd.read_excel("jugadores.xlsx")
-
-# Crear columnas de ataque y defensa
-df["Ataque"] = ((df["Puntos Totales"] + df["Rebotes Ofensivos"] + df["Asistencias"]) / df["Minutos Jugados"]) - ((df["Tapones Recibidos"] + df["Pérdidas"]) / df["Minutos Jugados"])
-df["Defensa"] = ((df["Recuperaciones"] + df["Rebotes Defensivos"] + df["Tapones Cometidos"] + df["Faltas Personales Recibidas"]) / df["Minutos Jugados"]) - (df["Faltas Personales Cometidas"] / df["Minutos Jugados"])
-
-# Limitar los valores de "Ataque" y "Defensa" entre 0 y 1
-df["Ataque"] = df["Ataque"].clip(0, 1)
-df["Defensa"] = df["Defensa"].clip(0, 1)
-
-df['PER Aproximado'] = (df["TCP1 (%)"] + df["TCP2 (%)"] + df["TCP3 (%)"] + df["Ataque"] + df["Defensa"]) / 5
+# Cargar datos (con las métricas Ataque, Defensa y PER Aproximado ya calculadas)
+df = load_players()
 
 # Inicializar la aplicación
 app = Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
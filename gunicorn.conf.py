@@ -0,0 +1,40 @@
+# Configuración de gunicorn: `gunicorn app:server` la lee automáticamente
+import multiprocessing  # Para calcular el número de workers por defecto
+import os  # Para leer la configuración desde variables de entorno
+
+# Modo compartido: los workers proyectan en memoria la misma imagen de los datos
+os.environ.setdefault("DATASET_SHARED", "1")
+
+# Dirección y número de workers (limitados por CPU: los datos no se duplican por worker)
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8050")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+
+# Cargar la aplicación una sola vez en el proceso maestro antes de crear los workers
+preload_app = True
+
+
+def on_starting(server):
+    """
+    Prepara la imagen compartida de los datos en el proceso maestro, antes de crear los workers.
+    """
+    from data.dataset import current
+    current()
+
+
+def post_fork(server, worker):
+    """
+    Arranca en cada worker los hilos que recargan los datos y aplican los eventos en directo
+    (los hilos no sobreviven al fork). `app.py` no los arranca al importarse, así que el
+    proceso maestro no tiene hilos ni abre el socket en directo. Con varios workers, el origen en directo debe ser un
+    archivo: cada worker lo lee por su cuenta.
+
+    Con `PREWARM_ON_START=1` también se lanza el precalentamiento: solo lo ejecuta el
+    primer worker que crea el bloqueo de la versión, nunca el proceso maestro.
+    """
+    from data.dataset import start_watcher
+    from data.live import start_live_feed
+    start_watcher()
+    start_live_feed()
+    if os.environ.get("PREWARM_ON_START") == "1":
+        from prewarm import start_prewarm
+        start_prewarm()
@@ -0,0 +1,30 @@
+from dash import html  # Componentes HTML para construir la página
+import dash_bootstrap_components as dbc  # Para el diseño y estilo con Bootstrap
+
+# --- Layout de la página "Acerca de" ---
+
+def layout():
+    """
+    Construye el layout de la página "Acerca de".
+
+    :return: Contenedor con la descripción del dashboard y de cada página.
+    """
+    return dbc.Container([  # Contenedor principal de la página
+        html.H1("Acerca de"),  # Título de la página
+        html.P(
+            "Dashboard interactivo para analizar las estadísticas de los jugadores de baloncesto "
+            "del WorldCup, desarrollado con Dash y Plotly."
+        ),
+
+        # Descripción de cada página de la aplicación
+        html.Ul([
+            html.Li([html.B("Leage Results: "),
+                     "ranking de jugadores por PER Aproximado con las tarjetas de tiros, ataque y defensa."]),
+            html.Li([html.B("Players: "),
+                     "comparación de hasta cinco jugadores en un gráfico de radar."]),
+            html.Li([html.B("Scatter: "),
+                     "relación entre dos estadísticas cualesquiera de los jugadores."]),
+            html.Li([html.B("Correlation: "),
+                     "matriz de correlaciones entre todas las estadísticas numéricas."]),
+        ]),
+    ], style={"padding-top": "40px"})  # Separar el contenido de la parte superior
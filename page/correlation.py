@@ -0,0 +1,106 @@
+import os  # Para leer la configuración desde variables de entorno
+
+from dash import html, dcc, Output, Input  # Componentes principales de Dash
+import dash_bootstrap_components as dbc  # Para el diseño y estilo con Bootstrap
+import numpy as np  # Para redondear la matriz de correlaciones
+import plotly.graph_objects as go  # Para el mapa de calor
+from data.dataset import current  # Versión actual de los datos compartidos
+from data.correlation import correlation_matrix  # Matriz de correlaciones por versión
+from components.PartitionSelectors import PartitionSelectors, selected_partition  # Selectores de temporada y competición
+from utils.payload import compact_figure  # Figuras más pequeñas para el navegador
+from utils.cache import FIGURE_CACHE_FOLDER, FigureCache  # Caché de figuras compartida en disco
+from utils.background import background_callback  # Callbacks costosos en segundo plano
+
+# --- Layout de la página ---
+
+def layout():
+    """
+    Construye el layout de la página de correlaciones.
+
+    :return: Contenedor con los selectores de temporada y competición y el mapa de calor.
+    """
+    return dbc.Container([  # Contenedor principal de la página
+        html.H1("Correlaciones entre estadísticas"),  # Título de la página
+        html.P(
+            "Correlación de Pearson entre todas las estadísticas numéricas de los jugadores. "
+            "Los pares más relacionados se sugieren también en la página de dispersión.",
+            className="text-muted"
+        ),
+        PartitionSelectors("correlation", current().partitions()),  # Selectores de temporada y competición
+        html.Span(id="correlation-progress", className="text-muted"),  # Progreso mientras se calcula la matriz
+        dcc.Graph(id="correlation-heatmap", style={"height": "80vh"}),  # Mapa de calor
+    ], style={"padding-top": "40px"})  # Separar el contenido de la parte superior
+
+# --- Mapa de calor ---
+
+# Caché de los mapas de calor, indexada por versión de la vista de los datos
+CORRELATION_CACHE = FigureCache(
+    max_bytes=int(os.environ.get("CORRELATION_CACHE_MB", "16")) * 1024 * 1024,
+    folder=os.path.join(FIGURE_CACHE_FOLDER, "correlation"),
+    name="correlation",
+    version=lambda key: key,  # La clave es la versión de la vista
+)
+
+def correlation_heatmap(snapshot):
+    """
+    Construye el mapa de calor de la matriz de correlaciones de una versión de los datos.
+
+    :param snapshot: Vista de los datos.
+    :return: Mapa de calor como objeto `go.Figure`.
+    """
+    columns, matrix = correlation_matrix(snapshot)
+    fig = go.Figure(go.Heatmap(
+        z=np.round(matrix, 2),  # Dos decimales bastan para leer el mapa
+        x=columns,
+        y=columns,
+        zmin=-1, zmax=1, zmid=0,  # Escala centrada en cero
+        colorscale="RdBu",  # Rojo: correlación negativa, azul: positiva
+        hovertemplate="%{y} · %{x}<br>r = %{z:.2f}<extra></extra>",
+    ))
+    fig.update_layout(
+        title="Matriz de correlaciones",  # Título del gráfico
+        yaxis=dict(autorange="reversed"),  # La diagonal de arriba a la izquierda a abajo a la derecha
+        xaxis=dict(tickangle=-45),  # Etiquetas inclinadas para que quepan
+        plot_bgcolor="white",
+    )
+    return compact_figure(fig)  # Plantilla reducida
+
+# --- Callback para actualizar el mapa de calor ---
+
+def correlation_cached(season=None, competition=None):
+    """
+    Indica si el mapa de calor de la vista ya está en la caché.
+
+    :return: True si no hace falta calcular la matriz en segundo plano.
+    """
+    return CORRELATION_CACHE.contains(current().view(*selected_partition(season, competition)).version)
+
+# La primera vez que se pide una vista se recorren todas sus filas: se hace en segundo plano
+@background_callback(
+    Output("correlation-heatmap", "figure"),  # Salida: Mapa de calor
+    Input("correlation-season", "value"),  # Entrada: Temporada seleccionada
+    Input("correlation-competition", "value"),  # Entrada: Competición seleccionada
+    progress=[Output("correlation-progress", "children")],  # Texto con la fase en curso
+    running=[(Output("correlation-progress", "hidden"), False, True)],  # Visible solo mientras se calcula
+    inline=correlation_cached,
+)
+def update_correlation_heatmap(season=None, competition=None, set_progress=None):
+    """
+    Actualiza el mapa de calor según la temporada y la competición seleccionadas.
+
+    La matriz se calcula una sola vez por versión de la vista y la figura se
+    guarda en la caché.
+
+    :param season: Temporada seleccionada (por defecto, todas).
+    :param competition: Competición seleccionada (por defecto, todas).
+    :param set_progress: Función para informar del progreso (solo en segundo plano).
+    :return: Mapa de calor.
+    """
+    report = set_progress or (lambda text: None)
+    snapshot = current().view(*selected_partition(season, competition))
+
+    def build():
+        report(f"Calculando las correlaciones de {len(snapshot.frame)} jugadores…")
+        return correlation_heatmap(snapshot)
+
+    return CORRELATION_CACHE.get_or_build(snapshot.version, build, persist=not snapshot.ephemeral)
@@ -1,39 +1,37 @@
-from dash import dcc, html, Input, Output, callback  # Componentes principales de Dash para construir el dashboard y manejar interactividad
+import os  # Para leer la configuración desde variables de entorno
+
+from dash import dcc, html, Input, Output, State, callback, ctx  # Componentes principales de Dash para construir el dashboard y manejar interactividad
 import dash_bootstrap_components as dbc  # Componentes estilizados con Bootstrap para diseño
 import plotly.express as px  # Biblioteca para crear gráficos interactivos
-import pandas as pd  # Biblioteca para manipulación de datos con DataFrames
+from data.dataset import current  # Versión actual de los datos compartidos
+from data.ranking import DEFAULT_WINDOW_SIZE, clamp_window, rank_window  # Ventanas del ranking precalculado
+from data.aggregates import CARD_METRICS, window_stats  # Estadísticos de las tarjetas por ventana
+from components.PartitionSelectors import PartitionSelectors, selected_partition  # Selectores de temporada y competición
 from components.card_TC_average_Top import AverageCardTC  # Componente para mostrar el promedio de Tiros de Campo
 from components.card_TC1_average_Top import AverageCardTC1  # Componente para el promedio de Tiros Libres
 from components.card_ataque_Top import CardAtaque  # Componente para métricas de Ataque
 from components.card_defensa_Top import CardDefensa  # Componente para métricas de Defensa
+from utils.payload import compact_figure  # Figuras más pequeñas para el navegador
+from utils.cache import FIGURE_CACHE_FOLDER, FigureCache  # Caché de figuras compartida en disco
+from utils.export import export_url  # Enlaces de descarga de los datos
 
-# --- Carga y preprocesamiento de datos ---
-
-# Leer los datos del archivo Excel
-df = pd.read_excel("jugadores.xlsx")
-
-# Crear una columna "Ataque" calculada como una métrica personalizada ofensiva
-df["Ataque"] = (
-    (df["Puntos Totales"] + df["Rebotes Ofensivos"] + df["Asistencias"]) / df["Minutos Jugados"]
-    - (df["Tapones Recibidos"] + df["Pérdidas"]) / df["Minutos Jugados"]
-)
+# --- Configuración del ranking ---
 
-# Crear una columna "Defensa" calculada como una métrica personalizada defensiva
-df["Defensa"] = (
-    (df["Recuperaciones"] + df["Rebotes Defensivos"] + df["Tapones Cometidos"] + df["Faltas Personales Recibidas"]) 
-    / df["Minutos Jugados"]
-    - (df["Faltas Personales Cometidas"]) / df["Minutos Jugados"]
-)
+# Tamaños de ventana disponibles para el ranking de jugadores
+WINDOW_SIZES = [DEFAULT_WINDOW_SIZE, 25, 50, 100]
 
-# Limitar los valores de las métricas "Ataque" y "Defensa" entre 0 y 1
-df["Ataque"] = df["Ataque"].clip(0, 1)
-df["Defensa"] = df["Defensa"].clip(0, 1)
+# Columnas que necesita la página (solo se leen estas del almacén de datos)
+LEAGUE_COLUMNS = ["Nombre", "PER Aproximado", *CARD_METRICS]
 
-# Calcular una métrica compuesta "PER Aproximado" como el promedio de varias métricas clave
-df['PER Aproximado'] = (df["TCP1 (%)"] + df["TCP2 (%)"] + df["TCP3 (%)"] + df["Ataque"] + df["Defensa"]) / 5
+def league_view(season, competition):
+    """
+    Devuelve la vista de los datos para la temporada y competición seleccionadas.
 
-# Ordenar el DataFrame por "PER Aproximado" en orden descendente
-df = df.sort_values(by='PER Aproximado', ascending=False).reset_index(drop=True)
+    :param season: Valor del selector de temporada.
+    :param competition: Valor del selector de competición.
+    :return: Versión `Snapshot` con solo las filas y columnas que usa la página.
+    """
+    return current().view(*selected_partition(season, competition), columns=LEAGUE_COLUMNS)
 
 # Define una paleta de colores personalizada basada en el esquema viridis
 viridis_colors = [
@@ -44,58 +42,167 @@ viridis_colors = [
 
 # --- Layout del dashboard ---
 
-leage_players = dbc.Container([
-    # Fila para las tarjetas de estadísticas clave
-    dbc.Row([
-        dbc.Col(id='tc-average-container', width="auto"),  # Contenedor para promedio de Tiros de Campo
-        dbc.Col(id='tc1-average-container', width="auto"),  # Contenedor para promedio de Tiros Libres
-        dbc.Col(id='ataque-container', width="auto"),  # Contenedor para métricas de Ataque
-        dbc.Col(id='defensa-container', width="auto")  # Contenedor para métricas de Defensa
-    ], style={"margin-bottom": "1rem"}),  # Espaciado inferior
-
-    # Fila con el Dropdown para seleccionar el rango de jugadores
-    dbc.Row([
-        dbc.Col(
-            dcc.Dropdown(
-                id='dropdown-top-n',  # ID del componente Dropdown
-                options=[  # Opciones generadas dinámicamente basadas en el número de jugadores
-                    {'label': f'Top {i-9} - {i}', 'value': i} for i in range(10, len(df)+10, 10)
-                ],
-                value=10,  # Valor predeterminado
+def layout():
+    """
+    Construye el layout de la página de la liga.
+
+    :return: Contenedor con los selectores, las tarjetas, los controles del ranking y el gráfico.
+    """
+    return dbc.Container([
+        # Fila con los selectores de temporada y competición
+        PartitionSelectors('league', current().partitions()),
+
+        # Fila para las tarjetas de estadísticas clave
+        dbc.Row([
+            dbc.Col(AverageCardTC(), id='tc-average-container', width="auto"),  # Promedio de Tiros de Campo
+            dbc.Col(AverageCardTC1(), id='tc1-average-container', width="auto"),  # Promedio de Tiros Libres
+            dbc.Col(CardAtaque(), id='ataque-container', width="auto"),  # Métricas de Ataque
+            dbc.Col(CardDefensa(), id='defensa-container', width="auto")  # Métricas de Defensa
+        ], style={"margin-bottom": "1rem"}),  # Espaciado inferior
+
+        # Fila con los controles para elegir la ventana del ranking (puesto inicial y tamaño)
+        dbc.Row([
+            dbc.Col(dbc.Button("Anteriores", id='rank-prev', color="secondary", outline=True), width="auto"),
+            dbc.Col(dbc.InputGroup([
+                dbc.InputGroupText("Desde el puesto"),
+                dbc.Input(id='rank-start', type="number", min=1, step=1, value=1, debounce=True),  # Puesto inicial
+            ]), width="auto"),
+            dbc.Col(dcc.Dropdown(
+                id='rank-size',  # Número de jugadores de la ventana
+                options=[{'label': f'{size} jugadores', 'value': size} for size in WINDOW_SIZES],
+                value=WINDOW_SIZES[0],  # Valor predeterminado
                 clearable=False,  # No permite limpiar la selección
-                style={"width": "50%", "margin-top": "1rem"}  # Estilo personalizado
-            ), width=12)  # Ocupar toda la fila
-    ], style={"margin-bottom": "1rem"}),  # Espaciado inferior
+                style={"width": "12rem"}
+            ), width="auto"),
+            dbc.Col(dbc.Button("Siguientes", id='rank-next', color="secondary", outline=True), width="auto"),
+            dbc.Col(html.Span(id='rank-total', className="text-muted"), width="auto"),  # Total de jugadores
+            dbc.Col(dbc.Button("Exportar CSV", id='league-export', color="secondary", outline=True,
+                               external_link=True), width="auto"),  # Descarga de la ventana del ranking
+        ], align="center", style={"margin-top": "1rem", "margin-bottom": "1rem"}),  # Espaciado
+
+        # Gráfico interactivo para visualizar jugadores por rango
+        dcc.Graph(id='graph-top-players'),
+    ], style={"padding-top": "3rem"})  # Padding superior
+
+# Caché de las salidas de cada ventana (gráfico y textos), compartida en disco entre procesos
+LEAGUE_CACHE = FigureCache(
+    max_bytes=int(os.environ.get("LEAGUE_CACHE_MB", "32")) * 1024 * 1024,
+    folder=os.path.join(FIGURE_CACHE_FOLDER, "league"),
+    name="league",
+)
+
+# --- Textos de las tarjetas ---
+
+# Tarjetas de la página: prefijo de sus identificadores y métrica que resumen
+CARDS = [
+    ('tc-average', "TC (%)"),  # Tiros de Campo
+    ('tc1-average', "TCP1 (%)"),  # Tiros Libres
+    ('ataque', "Ataque"),  # Ataque
+    ('defensa', "Defensa"),  # Defensa
+]
+
+def card_texts(stats):
+    """
+    Convierte los estadísticos de la ventana en los textos de las tarjetas.
+
+    :param stats: Estadísticos por métrica devueltos por `window_stats`.
+    :return: Lista con el texto del promedio y el de los estadísticos de cada tarjeta.
+    """
+    texts = []
+    for _, column in CARDS:
+        values = stats[column]
+        texts.append(f"{values['mean']:.2f}%")  # Promedio con dos decimales
+        texts.append(
+            f"Mediana {values['median']:.2f} · σ {values['std']:.2f} · "
+            f"P25–P75 {values['p25']:.2f}–{values['p75']:.2f}"
+        )
+    return texts
+
+# --- Callback para desplazar la ventana del ranking ---
+
+@callback(
+    Output('rank-start', 'value'),  # Actualiza el puesto inicial
+    [
+        Input('rank-prev', 'n_clicks'),  # Botón "Anteriores"
+        Input('rank-next', 'n_clicks'),  # Botón "Siguientes"
+    ],
+    [
+        State('rank-start', 'value'),  # Puesto inicial actual
+        State('rank-size', 'value'),  # Tamaño de la ventana
+        State('league-season', 'value'),  # Temporada seleccionada
+        State('league-competition', 'value'),  # Competición seleccionada
+    ],
+    prevent_initial_call=True
+)
+def move_rank_window(_prev_clicks, _next_clicks, start, size, season, competition):
+    """
+    Desplaza la ventana del ranking una página hacia atrás o hacia delante.
 
-    # Gráfico interactivo para visualizar jugadores por rango
-    dcc.Graph(id='graph-top-players'),
-], style={"padding-top": "3rem"})  # Padding superior
+    :param start: Puesto inicial actual (empezando en 1).
+    :param size: Número de jugadores de la ventana.
+    :param season: Temporada seleccionada.
+    :param competition: Competición seleccionada.
+    :return: Nuevo puesto inicial, ajustado a los límites del ranking.
+    """
+    size = size or DEFAULT_WINDOW_SIZE  # Selector vacío: tamaño por defecto
+    step = size if ctx.triggered_id == 'rank-next' else -size
+    offset, _ = clamp_window(league_view(season, competition), (start or 1) - 1 + step, size)
+    return offset + 1
 
 # --- Callback para actualizar el gráfico y las tarjetas ---
 
 @callback(
     [
         Output('graph-top-players', 'figure'),  # Actualiza el gráfico de jugadores
-        Output('tc-average-container', 'children'),  # Actualiza la tarjeta de Tiros de Campo
-        Output('tc1-average-container', 'children'),  # Actualiza la tarjeta de Tiros Libres
-        Output('ataque-container', 'children'),  # Actualiza la tarjeta de Ataque
-        Output('defensa-container', 'children')  # Actualiza la tarjeta de Defensa
+        # Actualiza solo los textos de las tarjetas (promedio y estadísticos de cada una)
+        *[Output(f'{prefix}-{part}', 'children') for prefix, _ in CARDS for part in ('value', 'stats')],
+        Output('rank-total', 'children')  # Actualiza el total de jugadores del ranking
     ],
-    [Input('dropdown-top-n', 'value')]  # Escucha cambios en el valor seleccionado del Dropdown
+    [
+        Input('rank-start', 'value'),  # Escucha cambios en el puesto inicial
+        Input('rank-size', 'value'),  # Escucha cambios en el tamaño de la ventana
+        Input('league-season', 'value'),  # Escucha cambios en la temporada
+        Input('league-competition', 'value'),  # Escucha cambios en la competición
+        Input('data-version', 'data')  # Escucha las versiones nuevas de los datos (directo)
+    ]
 )
-def update_graph_and_label(top_n):
+def update_graph_and_label(start, size, season=None, competition=None, _data_version=None):
     """
-    Actualiza el gráfico y las tarjetas según el rango seleccionado en el Dropdown.
+    Actualiza el gráfico y las tarjetas según la ventana del ranking seleccionada.
 
-    :param top_n: Número máximo de jugadores seleccionados en el rango.
-    :return: Gráfico actualizado y componentes de las tarjetas.
+    :param start: Puesto inicial de la ventana (empezando en 1).
+    :param size: Número de jugadores de la ventana.
+    :param season: Temporada seleccionada (por defecto, todas).
+    :param competition: Competición seleccionada (por defecto, todas).
+    :return: Gráfico actualizado, textos de las tarjetas y total de jugadores.
     """
-    # Determinar el rango de jugadores
-    start_idx = top_n - 10  # Índice inicial del rango
-    end_idx = min(top_n, len(df))  # Índice final (no exceder el número total de jugadores)
-    
-    # Seleccionar los jugadores dentro del rango especificado
-    top_players = df.iloc[start_idx:end_idx].sort_values(by='PER Aproximado', ascending=True)
+    # Tomar la vista de los datos una sola vez para todo el callback
+    snapshot = league_view(season, competition)
+
+    # Determinar el rango de jugadores dentro de los límites del ranking
+    start_idx, end_idx = clamp_window(snapshot, (start or 1) - 1, size)
+
+    # Servir el gráfico y las tarjetas desde la caché si esta ventana ya se construyó
+    # (las versiones en directo duran segundos: no se guardan en disco)
+    return LEAGUE_CACHE.get_or_build(
+        (snapshot.version, start_idx, end_idx),
+        lambda: league_window(snapshot, start_idx, end_idx),
+        persist=not snapshot.ephemeral
+    )
+
+def league_window(snapshot, start_idx, end_idx):
+    """
+    Construye el gráfico y los textos de las tarjetas de una ventana del ranking.
+
+    :param snapshot: Vista de los datos obtenida con `league_view`.
+    :param start_idx: Posición inicial de la ventana (0 es el primer puesto).
+    :param end_idx: Posición final (exclusiva) de la ventana.
+    :return: Tupla con el gráfico, los textos de las tarjetas y el total de jugadores.
+    """
+    size = end_idx - start_idx
+
+    # Seleccionar los jugadores de la ventana (ya ordenados) e invertirlos para el gráfico
+    top_players = rank_window(snapshot, start_idx, size).iloc[::-1]
     
     # Crear el gráfico de barras horizontal usando Plotly Express
     fig = px.bar(
@@ -109,11 +216,31 @@ def update_graph_and_label(top_n):
         orientation="h"  # Orientación horizontal
     )
 
-    # Actualizar las tarjetas usando componentes existentes y los jugadores seleccionados
+    # Estadísticos de la ventana para las tarjetas (calculados en una sola pasada)
+    stats = window_stats(snapshot, start_idx, size)
+
     return (
-        fig,
-        AverageCardTC(top_players),  # Tarjeta para Tiros de Campo
-        AverageCardTC1(top_players),  # Tarjeta para Tiros Libres
-        CardAtaque(top_players),  # Tarjeta para Ataque
-        CardDefensa(top_players)  # Tarjeta para Defensa
+        compact_figure(fig),  # Valores redondeados y plantilla reducida
+        *card_texts(stats),  # Textos de las tarjetas
+        f"de {len(snapshot)} jugadores"  # Total de jugadores del ranking
     )
+
+# --- Callback para el enlace de exportación ---
+
+@callback(
+    Output('league-export', 'href'),  # Actualiza el enlace de descarga
+    [
+        Input('rank-start', 'value'),  # Puesto inicial
+        Input('rank-size', 'value'),  # Tamaño de la ventana
+        Input('league-season', 'value'),  # Temporada seleccionada
+        Input('league-competition', 'value')  # Competición seleccionada
+    ]
+)
+def league_export_link(start, size, season=None, competition=None):
+    """
+    Construye el enlace para descargar en CSV la ventana del ranking que se está viendo.
+
+    :return: Ruta de la exportación con los parámetros de la ventana.
+    """
+    return export_url("league", season=season, competition=competition, start=start or 1,
+                      size=size or DEFAULT_WINDOW_SIZE)
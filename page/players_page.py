@@ -1,128 +1,260 @@
-from dash import html, dcc, callback, Output, Input  # Componentes principales de Dash
+import base64  # Para codificar la matriz de métricas que se envía al navegador
+import os  # Para manejar la carpeta de la caché en disco
+
+from dash import html, dcc, callback, clientside_callback, ClientsideFunction, Output, Input, State, ctx, no_update  # Componentes principales de Dash
 import dash_bootstrap_components as dbc  # Para el diseño y estilo con Bootstrap
-import plotly.graph_objects as go  # Para gráficos personalizados como gráficos de radar
-import pandas as pd  # Para manipular datos con DataFrames
+import numpy as np  # Para construir la matriz compacta de métricas
+from data.dataset import current  # Versión actual de los datos compartidos
+from data.search import search_index  # Búsqueda de jugadores insensible a tildes
+from data.index import RADAR_METRICS, metric_matrix, name_index  # Índice de jugadores por nombre
+from data.similarity import similar_players  # Búsqueda de jugadores similares
+from data.normalization import PERCENTILE, SCALE_LABELS, VALUES, percentile_ranks  # Escala de percentiles
+from utils.cache import FIGURE_CACHE_FOLDER, FigureCache  # Caché compartida en disco
+from utils.export import export_url  # Enlaces de descarga de los datos
 
-# --- Carga y preprocesamiento de datos ---
+# Paleta de colores accesibles para los gráficos
+COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']  # Azul, naranja, verde, rojo, púrpura
 
-# Cargar datos desde un archivo Excel
-df = pd.read_excel("jugadores.xlsx")
+# --- Matriz compacta de métricas para el navegador ---
 
-# Crear una columna "Ataque" basada en métricas ofensivas y penalizaciones
-df["Ataque"] = (
-    (df["Puntos Totales"] + df["Rebotes Ofensivos"] + df["Asistencias"]) / df["Minutos Jugados"]
-    - (df["Tapones Recibidos"] + df["Pérdidas"]) / df["Minutos Jugados"]
-)
+# Número máximo de jugadores que se comparan en el radar
+MAX_PLAYERS = 5
 
-# Crear una columna "Defensa" basada en métricas defensivas y penalizaciones
-df["Defensa"] = (
-    (df["Recuperaciones"] + df["Rebotes Defensivos"] + df["Tapones Cometidos"] + df["Faltas Personales Recibidas"])
-    / df["Minutos Jugados"]
-    - (df["Faltas Personales Cometidas"]) / df["Minutos Jugados"]
+# Etiquetas de las categorías que se muestran en el radar
+CATEGORY_LABELS = ['Tiros de 2', 'Tiros de 3', 'Tiros Libres', 'Ataque', 'Defensa']
+
+# Matriz ya codificada de cada versión, compartida en disco entre procesos
+RADAR_CACHE = FigureCache(
+    max_bytes=int(os.environ.get("RADAR_CACHE_MB", "32")) * 1024 * 1024,
+    folder=os.path.join(FIGURE_CACHE_FOLDER, "radar"),
+    name="radar",
 )
 
-# Limitar las métricas "Ataque" y "Defensa" para que estén entre 0 y 1
-df["Ataque"] = df["Ataque"].clip(0, 1)
-df["Defensa"] = df["Defensa"].clip(0, 1)
+def radar_payload(snapshot, scale=VALUES):
+    """
+    Prepara las métricas del radar de todos los jugadores para enviarlas al navegador.
 
-# Calcular el "PER Aproximado" como una métrica compuesta basada en varias estadísticas clave
-df['PER Aproximado'] = (
-    df["TCP1 (%)"] + df["TCP2 (%)"] + df["TCP3 (%)"] + df["Ataque"] + df["Defensa"]
-) / 5
+    La matriz (jugadores x métricas) se envía como `float32` codificado en base64,
+    mucho más compacto que una lista JSON de números. Se construye una sola vez
+    por versión de los datos y escala.
 
-# Paleta de colores accesibles para los gráficos
-COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']  # Azul, naranja, verde, rojo, púrpura
+    :param snapshot: Versión de los datos obtenida con `current()`.
+    :param scale: `VALUES` o `PERCENTILE`.
+    :return: Diccionario serializable con la versión, los nombres y la matriz codificada.
+    """
+    def build():
+        index = name_index(snapshot)
+        names = list(index)  # Un nombre por jugador, en el orden de sus filas
+        rows = np.fromiter(index.values(), dtype=np.intp, count=len(index))
+        matrix = metric_matrix(snapshot, RADAR_METRICS)[rows]
+        if scale == PERCENTILE:
+            matrix = radar_percentiles(snapshot, matrix)
+        matrix = matrix.astype("<f4")
+        return {
+            "version": payload_version(snapshot, scale),
+            "names": names,
+            "labels": CATEGORY_LABELS,
+            "colors": COLORS,
+            "max_players": MAX_PLAYERS,
+            "matrix": base64.b64encode(matrix.tobytes()).decode("ascii"),
+        }
+    return snapshot.memo(("radar_payload", scale), build)
+
+def radar_percentiles(snapshot, matrix):
+    """
+    Convierte una matriz de métricas del radar en percentiles (0 a 1) de cada métrica.
 
-# --- Función para generar un gráfico de radar ---
+    Así todas las métricas del radar son comparables: los porcentajes de tiro y
+    las métricas de Ataque y Defensa no tienen la misma distribución.
 
-def radar_chart(player_names, category_labels=None):
+    :param snapshot: Versión de los datos de referencia.
+    :param matrix: Matriz (jugadores x métricas) con los valores originales.
+    :return: Nueva matriz con el percentil de cada valor.
     """
-    Genera un gráfico de radar que compara estadísticas de jugadores seleccionados.
-    
-    :param player_names: Lista de nombres de jugadores a incluir en el gráfico.
-    :param category_labels: Etiquetas de las categorías del gráfico.
-    :return: Gráfico de radar como objeto `go.Figure`.
-    """
-    categories = ['TCP2 (%)', 'TCP3 (%)', 'TCP1 (%)', 'Ataque', 'Defensa']  # Estadísticas para el radar
-    fig = go.Figure()  # Crear una figura vacía
-
-    # Iterar sobre los jugadores seleccionados
-    for i, player_name in enumerate(player_names):
-        # Filtrar datos del jugador actual
-        player_data = df[df['Nombre'] == player_name]
-        if player_data.empty:  # Saltar si no hay datos para el jugador
-            continue
-
-        # Obtener los valores de las métricas seleccionadas y cerrar el círculo del radar
-        values = player_data[categories].values.flatten().tolist()
-        values += values[:1]  # Añadir el primer valor al final para cerrar el gráfico
-
-        # Ajustar etiquetas de las categorías
-        category_labels = category_labels or categories
-        category_labels += category_labels[:1]
-
-        # Añadir una traza para el jugador al gráfico de radar
-        fig.add_trace(go.Scatterpolar(
-            r=values,  # Valores de las métricas
-            theta=category_labels,  # Etiquetas de las categorías
-            fill='toself',  # Rellenar el área bajo la línea
-            name=player_name,  # Nombre del jugador
-            marker=dict(color=COLORS[i % len(COLORS)]),  # Usar un color accesible
-            opacity=0.6  # Transparencia para el relleno
-        ))
-
-    # Configurar el diseño del gráfico
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,  # Mostrar líneas radiales
-                range=[0, 1]  # Establecer el rango del eje radial
-            )
-        ),
-        showlegend=True,  # Mostrar la leyenda con los nombres de los jugadores
-        title="Comparación de Estadísticas de Jugadores"  # Título del gráfico
-    )
+    return np.column_stack([percentile_ranks(snapshot, metric, matrix[:, j])
+                            for j, metric in enumerate(RADAR_METRICS)]) if len(matrix) else matrix
 
-    return fig
+def payload_version(snapshot, scale):
+    """
+    Identificador de la matriz que se envía al navegador: versión de los datos y escala.
+
+    :param snapshot: Versión de los datos.
+    :param scale: Escala de la matriz.
+    :return: Texto con la versión y la escala.
+    """
+    return f"{snapshot.version}/{scale}"
 
 # --- Layout de la página ---
 
-players_page_content = dbc.Container([  # Contenedor principal de la página
-    html.H1("Gráfica de jugadores"),  # Título de la página
+def layout():
+    """
+    Construye el layout de la página de comparación de jugadores.
+
+    :return: Contenedor con el buscador de jugadores, el radar y la matriz de métricas.
+    """
+    return dbc.Container([  # Contenedor principal de la página
+        html.H1("Gráfica de jugadores"),  # Título de la página
     
-    # Dropdown para seleccionar jugadores
-    dcc.Dropdown(
-        id='player-dropdown',  # ID del componente
-        options=[{'label': name, 'value': name} for name in df['Nombre'].unique()],  # Opciones basadas en los nombres de los jugadores
-        multi=True,  # Permitir seleccionar múltiples jugadores
-        placeholder="Selecciona hasta 5 jugadores"  # Texto de ayuda
-    ),
+        # Dropdown para seleccionar jugadores
+        dcc.Dropdown(
+            id='player-dropdown',  # ID del componente
+            options=[],  # Las opciones se buscan en el servidor según lo que escribe el usuario
+            multi=True,  # Permitir seleccionar múltiples jugadores
+            placeholder="Escribe para buscar hasta 5 jugadores"  # Texto de ayuda
+        ),
+
+        # Fila para completar la comparación con los jugadores más parecidos al primero
+        dbc.Row([
+            dbc.Col(dcc.Checklist(
+                id="similar-metrics",  # Métricas con las que se mide el parecido
+                options=[{'label': f" {label}", 'value': metric}
+                         for label, metric in zip(CATEGORY_LABELS, RADAR_METRICS)],
+                value=list(RADAR_METRICS),  # Por defecto, todas las métricas del radar
+                inline=True,
+                inputStyle={"margin-left": "0.75rem"}
+            ), width="auto"),
+            dbc.Col(dbc.Button("Añadir similares", id="similar-button", color="secondary", outline=True),
+                    width="auto"),
+            dbc.Col(html.Span(id="similar-info", className="text-muted"), width="auto"),  # Similitud de cada uno
+        ], align="center", style={"margin-top": "1rem"}),
+
+        # Escala del radar: valores originales o percentil de cada métrica entre todos los jugadores
+        dcc.RadioItems(
+            id="radar-scale",
+            options=[{'label': f" {SCALE_LABELS[scale]}", 'value': scale} for scale in (VALUES, PERCENTILE)],
+            value=VALUES,  # Valor predeterminado
+            inline=True,
+            inputStyle={"margin-left": "0.75rem"},
+            style={"margin-top": "0.5rem"}
+        ),
     
-    # Gráfico de radar
-    dcc.Graph(id="radar-chart"),  # Gráfico interactivo que se actualizará dinámicamente
-], style={"padding-top": "40px"})  # Separar el contenido de la parte superior
+        # Gráfico de radar
+        dcc.Graph(id="radar-chart"),  # Gráfico que se dibuja en el navegador a partir de la matriz
+        dbc.Button("Exportar CSV", id="radar-export", color="secondary", outline=True,
+                   external_link=True),  # Descarga de las métricas de los jugadores comparados
+
+        # Matriz de métricas de todos los jugadores (se guarda en la sesión del navegador)
+        dcc.Store(id="radar-matrix", storage_type="session"),
+    ], style={"padding-top": "40px"})  # Separar el contenido de la parte superior
+
+# --- Callback para buscar jugadores en el servidor ---
+
+def search_players(search_value, selected):
+    """
+    Busca jugadores por nombre (sin distinguir tildes) y devuelve las mejores coincidencias.
 
-# --- Callback para actualizar el gráfico de radar ---
+    Los jugadores ya seleccionados se incluyen siempre para que el Dropdown no los pierda.
 
+    :param search_value: Texto escrito en el Dropdown.
+    :param selected: Lista de jugadores seleccionados.
+    :return: Opciones del Dropdown.
+    """
+    selected = selected or []
+    options = [{'label': name, 'value': name} for name in selected]
+    if not search_value:
+        return options
+
+    for name in search_index(current()).search(search_value):
+        if name not in selected:
+            # El texto de búsqueda se añade a `search` para que el filtro del navegador,
+            # que sí distingue tildes, no oculte coincidencias como "Galindo" / "Galíndo"
+            options.append({'label': name, 'value': name, 'search': f"{name} {search_value}"})
+    return options
+
+def add_similar_players(selected, metrics):
+    """
+    Completa la selección con los jugadores más parecidos al primero seleccionado.
+
+    :param selected: Lista de jugadores seleccionados (el primero es la referencia).
+    :param metrics: Métricas del radar con las que se mide el parecido (todas pesan lo mismo).
+    :return: Tupla (nueva selección o `no_update`, texto con la similitud de cada jugador).
+    """
+    if not selected:
+        return no_update, "Selecciona primero un jugador."
+    if not metrics:
+        return no_update, "Elige al menos una métrica."
+    reference = selected[0]
+    similar = similar_players(current(), reference, MAX_PLAYERS - 1, {metric: 1 for metric in metrics})
+    if not similar:
+        return no_update, f"No se encontraron jugadores parecidos a {reference}."
+    text = ", ".join(f"{name} ({score:.0%})" for name, score in similar)
+    return [reference] + [name for name, _ in similar], f"Parecidos a {reference}: {text}"
+
+# El Dropdown tiene un solo callback para sus opciones y su valor: los jugadores similares
+# se añaden a la vez a la selección y a las opciones
 @callback(
-    Output("radar-chart", "figure"),  # Salida: Gráfico de radar
-    Input("player-dropdown", "value")  # Entrada: Jugadores seleccionados desde el Dropdown
+    Output("player-dropdown", "options"),  # Salida: Opciones del Dropdown
+    Output("player-dropdown", "value"),  # Salida: Jugadores seleccionados (al añadir similares)
+    Output("similar-info", "children"),  # Salida: Similitud de los jugadores añadidos
+    Input("player-dropdown", "search_value"),  # Entrada: Texto que escribe el usuario
+    Input("similar-button", "n_clicks"),  # Entrada: Botón "Añadir similares"
+    State("player-dropdown", "value"),  # Estado: Jugadores ya seleccionados
+    State("similar-metrics", "value")  # Estado: Métricas elegidas para la similitud
 )
-def update_radar_chart(player_name):
+def update_player_selection(search_value, _similar_clicks, selected, metrics):
     """
-    Callback que actualiza el gráfico de radar en función de los jugadores seleccionados.
-    
-    :param player_name: Lista de nombres de los jugadores seleccionados.
-    :return: Figura del gráfico de radar actualizada.
+    Actualiza las opciones del Dropdown al buscar y la selección al pedir jugadores similares.
+
+    :param search_value: Texto escrito en el Dropdown.
+    :param selected: Lista de jugadores seleccionados.
+    :param metrics: Métricas elegidas para medir el parecido.
+    :return: Opciones del Dropdown, selección y texto de similitud.
     """
-    if player_name:  # Si hay jugadores seleccionados
-        # Validar que no se seleccionen más de 5 jugadores
-        if len(player_name) > 5:
-            player_name = player_name[:5]  # Limitar la lista a los primeros 5 jugadores
-            print("Has seleccionado más de 5 jugadores. Solo los primeros 5 se incluirán en el gráfico.")
+    if ctx.triggered_id == "similar-button":
+        value, info = add_similar_players(selected, metrics)
+        options = search_players(None, selected if value is no_update else value)
+        return options, value, info
+    return search_players(search_value, selected), no_update, no_update
+
+# --- Callback para enviar la matriz de métricas al navegador ---
 
-        # Generar el gráfico de radar con los jugadores seleccionados
-        return radar_chart(player_name, category_labels=['Tiros de 2', 'Tiros de 3', 'Tiros Libres', 'Ataque', 'Defensa'])
+@callback(
+    Output("radar-matrix", "data"),  # Salida: Matriz de métricas guardada en el navegador
+    Input("radar-matrix", "id"),  # Entrada: Se ejecuta una vez al cargar la página
+    Input("data-version", "data"),  # Entrada: Versión nueva de los datos (directo)
+    Input("radar-scale", "value"),  # Entrada: Escala del radar (valores o percentiles)
+    State("radar-matrix", "data")  # Estado: Matriz que el navegador ya tiene guardada
+)
+def load_radar_matrix(_store_id, _data_version, scale, stored=None):
+    """
+    Envía la matriz de métricas al navegador solo si no tiene ya la versión actual.
 
-    # Si no hay jugadores seleccionados, devolver un gráfico vacío
-    return go.Figure()
+    Se ejecuta al cargar la página, al cambiar la escala y cada vez que se publica
+    una versión nueva de los datos.
+
+    :param scale: Escala de la matriz (por defecto, valores originales).
+    :param stored: Matriz guardada en la sesión del navegador (o None).
+    :return: Matriz de la versión actual, o `no_update` si el navegador ya la tiene.
+    """
+    snapshot = current()
+    scale = scale or VALUES
+    if stored and stored.get("version") == payload_version(snapshot, scale):
+        return no_update  # El navegador ya tiene esta versión: no se reenvía nada
+    return RADAR_CACHE.get_or_build((snapshot.version, scale), lambda: radar_payload(snapshot, scale),
+                                    persist=not snapshot.ephemeral)
+
+# --- Callback en el navegador para actualizar el gráfico de radar ---
+
+# El radar se dibuja en el navegador (assets/js/radar.js) sin pasar por el servidor
+clientside_callback(
+    ClientsideFunction(namespace="radar", function_name="render"),
+    Output("radar-chart", "figure"),  # Salida: Gráfico de radar
+    Input("player-dropdown", "value"),  # Entrada: Jugadores seleccionados desde el Dropdown
+    Input("radar-matrix", "data"),  # Entrada: Matriz de métricas de todos los jugadores
+    State("radar-chart", "figure")  # Estado: Figura anterior, para reutilizar sus trazas
+)
+
+# --- Callback para el enlace de exportación ---
+
+@callback(
+    Output("radar-export", "href"),  # Salida: Enlace de descarga
+    Input("player-dropdown", "value"),  # Entrada: Jugadores seleccionados
+    Input("radar-scale", "value")  # Entrada: Escala del radar
+)
+def radar_export_link(selected, scale):
+    """
+    Construye el enlace para descargar en CSV las métricas de los jugadores comparados.
+
+    :return: Ruta de la exportación con los jugadores y la escala.
+    """
+    return export_url("radar", player=(selected or [])[:MAX_PLAYERS], scale=scale)
@@ -0,0 +1,91 @@
+import importlib  # Para importar el módulo de cada página a partir de su nombre
+import threading  # Para que dos peticiones simultáneas no construyan la misma página
+
+from data.dataset import current  # Versión actual de los datos compartidos
+
+# --- Registro de páginas ---
+
+# Páginas registradas, por ruta
+PAGES = {}
+
+_lock = threading.Lock()  # Protege la construcción y la caché de los layouts
+
+
+class Page:
+    """
+    Página de la aplicación: ruta, módulo y función que construye su layout.
+
+    El layout se construye la primera vez que se visita la ruta y se guarda.
+    Si la página usa los datos de los jugadores (selectores, columnas...), se
+    vuelve a construir cuando se publica una versión nueva de los datos.
+    """
+
+    def __init__(self, path, module, factory="layout", uses_data=True):
+        """
+        :param path: Ruta de la página (por ejemplo, "/scatter").
+        :param module: Nombre del módulo que define la página.
+        :param factory: Nombre de la función del módulo que devuelve el layout.
+        :param uses_data: Si es True, el layout se construye con la versión actual de los datos.
+        """
+        self.path = path
+        self.module = module
+        self.factory = factory
+        self.uses_data = uses_data
+        self._layout = None
+        self._version = None
+
+    def layout(self):
+        """
+        Devuelve el layout de la página, construyéndolo si aún no existe o si cambiaron los datos.
+
+        :return: Componente Dash con el contenido de la página.
+        """
+        version = current().version if self.uses_data else None
+        if self._layout is None or self._version != version:
+            with _lock:
+                if self._layout is None or self._version != version:
+                    self._layout = getattr(importlib.import_module(self.module), self.factory)()
+                    self._version = version
+        return self._layout
+
+
+def register_page(path, module, factory="layout", uses_data=True):
+    """
+    Registra una página en una ruta.
+
+    El módulo se importa en el momento para que sus callbacks queden
+    registrados antes de la primera petición (Dash no admite callbacks nuevos
+    después). Importarlo es barato: los datos y el layout no se cargan hasta
+    que se visita la ruta.
+
+    :param path: Ruta de la página.
+    :param module: Nombre del módulo que define la página.
+    :param factory: Nombre de la función del módulo que devuelve el layout.
+    :param uses_data: Si es True, el layout depende de la versión de los datos.
+    :return: Objeto `Page` registrado.
+    """
+    importlib.import_module(module)
+    PAGES[path] = Page(path, module, factory, uses_data)
+    return PAGES[path]
+
+
+def page_layout(path):
+    """
+    Devuelve el layout de la página registrada en una ruta.
+
+    :param path: Ruta pedida.
+    :return: Layout de la página, o None si no hay ninguna página en esa ruta.
+    """
+    page = PAGES.get(path)
+    return page.layout() if page is not None else None
+
+
+def preload_pages():
+    """
+    Construye ya el layout de todas las páginas (modo "eager").
+
+    Útil antes de crear los workers (por ejemplo, con `gunicorn --preload`)
+    para que todos compartan los datos y layouts ya construidos.
+    """
+    for page in PAGES.values():
+        page.layout()
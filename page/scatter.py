@@ -1,97 +1,153 @@
-from dash import Dash, html, dcc, callback, Output, Input  # Importa componentes de Dash
+import os  # Para leer la configuración desde variables de entorno
+
+from dash import Dash, html, dcc, callback, ctx, no_update, Output, Input, ALL  # Importa componentes de Dash
 import dash_bootstrap_components as dbc  # Biblioteca para diseño basado en Bootstrap
 import plotly.express as px  # Para crear gráficos interactivos
-import pandas as pd  # Biblioteca para manipulación de datos
-
-# --- Carga y preprocesamiento de datos ---
+from data.dataset import current  # Versión actual de los datos compartidos
+from components.PartitionSelectors import PartitionSelectors, selected_partition  # Selectores de temporada y competición
+from data.sampling import density_sample  # Muestreo por densidad para muchos puntos
+from data.partitions import season_rank  # Orden de las temporadas (la más reciente por defecto)
+from data.normalization import SCALE_LABELS, VALUES, normalize  # Escalas de los ejes (percentil, z)
+from data.correlation import top_pairs  # Pares de estadísticas más relacionados
+from utils.payload import compact_figure  # Figuras más pequeñas para el navegador
+from utils.cache import FIGURE_CACHE_FOLDER, FigureCache  # Caché de figuras compartida en disco
+from utils.export import export_url  # Enlaces de descarga de los datos
+from utils.background import background_callback  # Callbacks costosos en segundo plano
 
-# Cargar datos desde un archivo Excel
-df = pd.read_excel("jugadores.xlsx")
+# --- Layout de la aplicación ---
 
-# Crear columnas calculadas para métricas personalizadas (Ataque y Defensa)
-df["Ataque"] = (
-    (df["Puntos Totales"] + df["Rebotes Ofensivos"] + df["Asistencias"]) / df["Minutos Jugados"]  # Métricas ofensivas
-    - (df["Tapones Recibidos"] + df["Pérdidas"]) / df["Minutos Jugados"]  # Penalización por métricas negativas
-)
-df["Defensa"] = (
-    (df["Recuperaciones"] + df["Rebotes Defensivos"] + df["Tapones Cometidos"] + df["Faltas Personales Recibidas"])
-    / df["Minutos Jugados"]  # Métricas defensivas positivas
-    - df["Faltas Personales Cometidas"] / df["Minutos Jugados"]  # Penalización por métricas negativas
-)
+def layout():
+    """
+    Construye el layout de la página de dispersión.
 
-# Limitar las métricas "Ataque" y "Defensa" para que estén entre 0 y 1
-df["Ataque"] = df["Ataque"].clip(0, 1)
-df["Defensa"] = df["Defensa"].clip(0, 1)
+    Las opciones de los ejes son las columnas numéricas de la temporada más reciente.
 
-# Calcular el "PER Aproximado" como promedio de varias métricas
-df["PER Aproximado"] = (
-    df["TCP1 (%)"] + df["TCP2 (%)"] + df["TCP3 (%)"] + df["Ataque"] + df["Defensa"]
-) / 5
+    :return: Contenedor con los selectores y el gráfico de dispersión.
+    """
+    # Particiones disponibles y vista de la temporada más reciente
+    snapshot = current()
+    partitions = snapshot.partitions()
+    df = snapshot.view(max((season for season, _ in partitions), key=season_rank) if partitions else None).frame
 
-# --- Layout de la aplicación ---
+    # Columnas numéricas que se pueden elegir como ejes del gráfico
+    axis_columns = list(df.select_dtypes("number").columns)
 
-scatter = dbc.Container(  # Contenedor principal de la página
-    [
-        html.Hr(),  # Separador horizontal
-        html.H2("Análisis de dispersión de atributos"),  # Título de la página
-        dbc.Row([  # Fila con dos dropdowns para seleccionar ejes X e Y
-            dbc.Col(
-                [
-                    html.Label("Eje X:"),  # Etiqueta para el dropdown del eje X
-                    dcc.Dropdown(
-                        id="scatter-x-dropdown",  # ID del componente
-                        options=[{'label': col, 'value': col} for col in df.columns if col not in ["Nombre"]],
-                        value="Minutos Jugados",  # Valor predeterminado
-                        clearable=False,  # No permite limpiar la selección
-                    ),
-                ],
-                width=6,  # La columna ocupa 6 unidades de ancho
-            ),
-            dbc.Col(
-                [
-                    html.Label("Eje Y:"),  # Etiqueta para el dropdown del eje Y
-                    dcc.Dropdown(
-                        id="scatter-y-dropdown",  # ID del componente
-                        options=[{'label': col, 'value': col} for col in df.columns if col not in ["Nombre"]],
-                        value="Puntos Totales",  # Valor predeterminado
-                        clearable=False,  # No permite limpiar la selección
-                    ),
-                ],
-                width=6,  # La columna ocupa 6 unidades de ancho
+    return dbc.Container(  # Contenedor principal de la página
+        [
+            html.Hr(),  # Separador horizontal
+            html.H2("Análisis de dispersión de atributos"),  # Título de la página
+            PartitionSelectors("scatter", partitions),  # Selectores de temporada y competición
+            dbc.Row([  # Fila con dos dropdowns para seleccionar ejes X e Y
+                dbc.Col(
+                    [
+                        html.Label("Eje X:"),  # Etiqueta para el dropdown del eje X
+                        dcc.Dropdown(
+                            id="scatter-x-dropdown",  # ID del componente
+                            options=[{'label': col, 'value': col} for col in axis_columns],
+                            value="Minutos Jugados",  # Valor predeterminado
+                            clearable=False,  # No permite limpiar la selección
+                        ),
+                    ],
+                    width=6,  # La columna ocupa 6 unidades de ancho
+                ),
+                dbc.Col(
+                    [
+                        html.Label("Eje Y:"),  # Etiqueta para el dropdown del eje Y
+                        dcc.Dropdown(
+                            id="scatter-y-dropdown",  # ID del componente
+                            options=[{'label': col, 'value': col} for col in axis_columns],
+                            value="Puntos Totales",  # Valor predeterminado
+                            clearable=False,  # No permite limpiar la selección
+                        ),
+                    ],
+                    width=6,  # La columna ocupa 6 unidades de ancho
+                ),
+            ]),
+            html.Div([  # Sugerencias: los pares de ejes con la correlación más fuerte
+                html.Label("Pares más relacionados:", className="me-2"),
+                html.Span(id="scatter-suggestions"),
+            ], style={"margin-top": "1rem"}),
+            dcc.RadioItems(  # Escala de los ejes: valores originales, percentiles o puntuación z
+                id="scatter-scale",
+                options=[{'label': f" {label}", 'value': scale} for scale, label in SCALE_LABELS.items()],
+                value=VALUES,  # Valor predeterminado
+                inline=True,
+                inputStyle={"margin-left": "0.75rem"},
+                style={"margin-top": "1rem"},
             ),
-        ]),
-        dcc.Graph(id="scatter-plot"),  # Gráfico interactivo que se actualizará dinámicamente
-    ],
-    style={"backgroundColor": "#f0f0f0", "padding": "20px"},  # Estilo del contenedor
-)
+            html.Span(id="scatter-progress", className="text-muted"),  # Progreso mientras se construye el gráfico
+            dcc.Graph(id="scatter-plot"),  # Gráfico interactivo que se actualizará dinámicamente
+            dbc.Button("Exportar CSV", id="scatter-export", color="secondary", outline=True,
+                       external_link=True),  # Descarga de todos los jugadores de la vista
+        ],
+        style={"backgroundColor": "#f0f0f0", "padding": "20px"},  # Estilo del contenedor
+    )
 
-# --- Callback para actualizar el gráfico ---
+# --- Función para generar el gráfico de dispersión ---
 
-@callback(
-    Output("scatter-plot", "figure"),  # Salida: Figura del gráfico
-    [
-        Input("scatter-x-dropdown", "value"),  # Entrada: Valor seleccionado en el dropdown del eje X
-        Input("scatter-y-dropdown", "value"),  # Entrada: Valor seleccionado en el dropdown del eje Y
-    ],
+# Número de puntos a partir del cual se usa WebGL y se dibuja una muestra por densidad
+LARGE_DATA_THRESHOLD = int(os.environ.get("SCATTER_LARGE_THRESHOLD", "5000"))
+
+# Caché de figuras ya construidas, indexada por (eje X, eje Y, versión de los datos)
+SCATTER_CACHE = FigureCache(
+    max_bytes=int(os.environ.get("SCATTER_CACHE_MB", "64")) * 1024 * 1024,
+    folder=os.path.join(FIGURE_CACHE_FOLDER, "scatter"),  # Compartida en disco entre procesos
+    name="scatter",
+    version=lambda key: key[2],  # Clave (eje X, eje Y, versión de la vista[, escala])
 )
-def update_scatter_plot(x_axis, y_axis):
+
+def scaled_frame(snapshot, x_axis, y_axis, scale):
     """
-    Actualiza el gráfico de dispersión según los ejes seleccionados por el usuario.
+    Devuelve los datos del gráfico con los ejes convertidos a la escala indicada.
 
-    :param x_axis: Columna seleccionada para el eje X.
-    :param y_axis: Columna seleccionada para el eje Y.
-    :return: Figura actualizada del gráfico de dispersión.
+    Los percentiles y las puntuaciones z se calculan respecto a la vista (temporada
+    y competición elegidas) con los arrays ordenados una sola vez por versión.
+
+    :param snapshot: Vista de los datos.
+    :param x_axis: Columna del eje X.
+    :param y_axis: Columna del eje Y.
+    :param scale: Escala de los ejes (`VALUES`, `PERCENTILE` o `ZSCORE`).
+    :return: DataFrame con las columnas que usa el gráfico.
     """
+    df = snapshot.frame
+    if scale in (None, VALUES):
+        return df
+    df = df[list(dict.fromkeys(["Nombre", "PER Aproximado", x_axis, y_axis]))].copy()
+    for axis in {x_axis, y_axis}:
+        df[axis] = normalize(snapshot, axis, scale=scale)
+    return df
+
+def scatter_figure(df, x_axis, y_axis, scale=VALUES):
+    """
+    Construye el gráfico de dispersión para los ejes indicados.
+
+    :param df: DataFrame con los datos de los jugadores (ya en la escala de los ejes).
+    :param x_axis: Columna para el eje X.
+    :param y_axis: Columna para el eje Y.
+    :param scale: Escala de los ejes, para los títulos.
+    :return: Gráfico de dispersión como objeto `go.Figure`.
+    """
+    # Modo para muchos datos: dibujar con WebGL una muestra que conserve la densidad y los atípicos
+    title = f"Relación entre {x_axis} y {y_axis}"
+    if scale not in (None, VALUES):
+        title += f" ({SCALE_LABELS[scale].lower()})"
+    large_data = len(df) > LARGE_DATA_THRESHOLD
+    if large_data:
+        sample = density_sample(df[x_axis].to_numpy(), df[y_axis].to_numpy(), LARGE_DATA_THRESHOLD)
+        title += f" (muestra de {len(sample)} de {len(df)} jugadores)"
+        df = df.iloc[sample]
+
     # Crear gráfico de dispersión con Plotly Express
     fig = px.scatter(
         df,  # DataFrame con los datos
         x=x_axis,  # Eje X
         y=y_axis,  # Eje Y
-        title=f"Relación entre {x_axis} y {y_axis}",  # Título dinámico
+        title=title,  # Título dinámico
         labels={x_axis: x_axis, y_axis: y_axis},  # Etiquetas dinámicas para los ejes
         color="PER Aproximado",  # Colorea los puntos según el valor de PER Aproximado
         color_continuous_scale="blues",  # Escala de colores
         hover_name="Nombre",  # Muestra el nombre del jugador al pasar el ratón
+        render_mode="webgl" if large_data else "svg",  # WebGL (Scattergl) para muchos puntos
     )
 
     # Personalizar el diseño del gráfico
@@ -134,9 +190,134 @@ def update_scatter_plot(x_axis, y_axis):
         ),  # Texto emergente al pasar el ratón
     )
 
-    return fig
+    return compact_figure(fig)  # Valores redondeados y plantilla reducida
 
-# --- Iniciar la aplicación ---
+# --- Callback para actualizar el gráfico ---
+
+def scatter_cache_key(snapshot, x_axis, y_axis, scale):
+    """
+    Clave de la figura en la caché (la escala de valores conserva la clave original).
+
+    :param snapshot: Vista de los datos.
+    :param x_axis: Columna del eje X.
+    :param y_axis: Columna del eje Y.
+    :param scale: Escala de los ejes.
+    :return: Tupla con los ejes, la versión de la vista y, si no son valores, la escala.
+    """
+    if scale == VALUES:
+        return (x_axis, y_axis, snapshot.version)
+    return (x_axis, y_axis, snapshot.version, scale)
+
+def scatter_cached(x_axis, y_axis, season=None, competition=None, scale=VALUES):
+    """
+    Indica si la figura ya está en la caché (entonces no hace falta una tarea en segundo plano).
 
-if __name__ == "__main__":
-    scatter.run_server(debug=True)  # Ejecutar la aplicación en modo debug
+    :return: True si la figura de estos argumentos ya se construyó.
+    """
+    snapshot = current().view(*selected_partition(season, competition))
+    return SCATTER_CACHE.contains(scatter_cache_key(snapshot, x_axis, y_axis, scale or VALUES))
+
+# Con todos los jugadores, construir la figura puede tardar: se hace en segundo plano y, si
+# el usuario cambia otra vez los ejes antes de que termine, la tarea anterior se cancela
+@background_callback(
+    Output("scatter-plot", "figure"),  # Salida: Figura del gráfico
+    [
+        Input("scatter-x-dropdown", "value"),  # Entrada: Valor seleccionado en el dropdown del eje X
+        Input("scatter-y-dropdown", "value"),  # Entrada: Valor seleccionado en el dropdown del eje Y
+        Input("scatter-season", "value"),  # Entrada: Temporada seleccionada
+        Input("scatter-competition", "value"),  # Entrada: Competición seleccionada
+        Input("scatter-scale", "value"),  # Entrada: Escala de los ejes
+    ],
+    progress=[Output("scatter-progress", "children")],  # Texto con la fase en curso
+    running=[(Output("scatter-progress", "hidden"), False, True)],  # Visible solo mientras se construye
+    inline=scatter_cached,
+)
+def update_scatter_plot(x_axis, y_axis, season=None, competition=None, scale=VALUES, set_progress=None):
+    """
+    Actualiza el gráfico de dispersión según los ejes seleccionados por el usuario.
+
+    :param x_axis: Columna seleccionada para el eje X.
+    :param y_axis: Columna seleccionada para el eje Y.
+    :param season: Temporada seleccionada (por defecto, todas).
+    :param competition: Competición seleccionada (por defecto, todas).
+    :param scale: Escala de los ejes (por defecto, valores originales).
+    :param set_progress: Función para informar del progreso (solo en segundo plano).
+    :return: Figura actualizada del gráfico de dispersión.
+    """
+    report = set_progress or (lambda text: None)
+    scale = scale or VALUES
+    # Tomar la vista de los datos (solo la temporada y competición elegidas) una sola vez
+    snapshot = current().view(*selected_partition(season, competition))
+
+    def build():
+        report("Preparando los datos…")
+        df = scaled_frame(snapshot, x_axis, y_axis, scale)
+        report(f"Dibujando {len(df)} jugadores…")
+        return scatter_figure(df, x_axis, y_axis, scale)
+
+    # Servir la figura desde la caché si ya se construyó para estos ejes y esta versión
+    return SCATTER_CACHE.get_or_build(scatter_cache_key(snapshot, x_axis, y_axis, scale), build,
+                                      persist=not snapshot.ephemeral)
+
+# --- Callbacks para sugerir pares de ejes ---
+
+@callback(
+    Output("scatter-suggestions", "children"),  # Salida: Botones con los pares sugeridos
+    Input("scatter-season", "value"),  # Entrada: Temporada seleccionada
+    Input("scatter-competition", "value"),  # Entrada: Competición seleccionada
+)
+def suggest_pairs(season=None, competition=None):
+    """
+    Sugiere los pares de estadísticas con la correlación más fuerte en la vista seleccionada.
+
+    La matriz de correlaciones se calcula una sola vez por versión de los datos
+    (la misma que usa la página de correlaciones).
+
+    :param season: Temporada seleccionada (por defecto, todas).
+    :param competition: Competición seleccionada (por defecto, todas).
+    :return: Lista de botones, uno por par.
+    """
+    snapshot = current().view(*selected_partition(season, competition))
+    return [
+        dbc.Button(
+            f"{x_axis} · {y_axis} (r = {r:.2f})",
+            id={"type": "scatter-pair", "x": x_axis, "y": y_axis},  # El par viaja en el identificador
+            size="sm", color="secondary", outline=True, className="me-2 mb-2",
+        )
+        for x_axis, y_axis, r in top_pairs(snapshot)
+    ]
+
+@callback(
+    Output("scatter-x-dropdown", "value"),  # Salida: Eje X
+    Output("scatter-y-dropdown", "value"),  # Salida: Eje Y
+    Input({"type": "scatter-pair", "x": ALL, "y": ALL}, "n_clicks"),  # Entrada: Botones de los pares
+    prevent_initial_call=True
+)
+def apply_suggested_pair(_clicks):
+    """
+    Selecciona en los ejes el par sugerido que se ha pulsado.
+
+    :return: Columnas de los ejes X e Y, o `no_update` si no se ha pulsado ningún botón
+        (por ejemplo, al crear los botones).
+    """
+    if not ctx.triggered or not ctx.triggered[0]["value"]:
+        return no_update, no_update
+    return ctx.triggered_id["x"], ctx.triggered_id["y"]
+
+# --- Callback para el enlace de exportación ---
+
+@callback(
+    Output("scatter-export", "href"),  # Salida: Enlace de descarga
+    Input("scatter-x-dropdown", "value"),  # Entrada: Eje X
+    Input("scatter-y-dropdown", "value"),  # Entrada: Eje Y
+    Input("scatter-season", "value"),  # Entrada: Temporada seleccionada
+    Input("scatter-competition", "value"),  # Entrada: Competición seleccionada
+    Input("scatter-scale", "value"),  # Entrada: Escala de los ejes
+)
+def scatter_export_link(x_axis, y_axis, season=None, competition=None, scale=VALUES):
+    """
+    Construye el enlace para descargar en CSV los datos del gráfico (todos los jugadores, no la muestra).
+
+    :return: Ruta de la exportación con los ejes, la vista y la escala.
+    """
+    return export_url("scatter", x=x_axis, y=y_axis, season=season, competition=competition, scale=scale)
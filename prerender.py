@@ -0,0 +1,435 @@
+"""
+Prerenderizado estático de las páginas.
+
+Genera, para la versión actual de los datos, una versión estática y reducida
+de cada ruta con sus figuras ya incluidas. El resultado se puede servir desde
+una CDN o desde cualquier servidor estático sin ejecutar Python. Todas las
+URL son relativas a la página, así que se puede publicar en `<salida>/current/`
+o bajo cualquier subruta.
+
+    <salida>/<versión>/index.html                      Liga (temporada más reciente)
+    <salida>/<versión>/league/<tamaño>/<inicio>.json   Ventanas del ranking
+    <salida>/<versión>/players/radar-matrix.json       Métricas del radar de todos los jugadores
+    <salida>/<versión>/<ruta>/index.html               Resto de páginas
+    <salida>/<versión>/assets/                         plotly.js y el script del radar
+    <salida>/current.json (y el enlace <salida>/current) Versión publicada
+
+Las páginas no reproducen el layout de Dash: muestran el estado por defecto de
+cada ruta con HTML mínimo y los estilos de Bootstrap. Los botones del ranking
+cargan las ventanas precalculadas y el radar se dibuja en el navegador con el
+mismo script que la aplicación (`assets/js/radar.js`).
+
+Las figuras salen de la caché compartida en disco, así que conviene ejecutar
+antes `prewarm.py`.
+
+Uso:
+    python prerender.py [--out .cache/static] [--sizes 10,25] [--force] [--serve 8000]
+"""
+import argparse  # Para leer los argumentos de la línea de comandos
+import functools  # Para servir la carpeta generada con http.server
+import html as html_escape  # Para escapar los textos del HTML
+import http.server  # Servidor estático local (por ejemplo, para pruebas)
+import json  # Para guardar las figuras y las ventanas del ranking
+import os  # Para crear las carpetas y publicar la versión
+import shutil  # Para copiar los recursos estáticos
+import sys  # Para añadir la carpeta del proyecto al path
+import time  # Para medir la duración del prerenderizado
+
+# Permitir ejecutar el script desde cualquier carpeta
+module_path = os.path.dirname(os.path.abspath(__file__))
+if module_path not in sys.path:
+    sys.path.append(module_path)
+
+import dash_bootstrap_components as dbc  # Hoja de estilos de Bootstrap
+from plotly.offline import get_plotlyjs  # plotly.js para dibujar las figuras sin Dash
+
+from components.PartitionSelectors import ALL, selected_partition  # Valores de los selectores
+from data.correlation import top_pairs  # Pares de estadísticas más relacionados
+from data.dataset import current  # Versión actual de los datos compartidos
+from data.partitions import season_rank  # Orden de las temporadas
+
+# --- Configuración ---
+
+# Carpeta de salida por defecto
+DEFAULT_OUTPUT = os.environ.get("PRERENDER_DIR", os.path.join(module_path, ".cache", "static"))
+
+# Script del radar de la aplicación (la página estática lo usa tal cual)
+RADAR_SCRIPT = os.path.join(module_path, "assets", "js", "radar.js")
+
+# Título de las páginas (el mismo que el de la aplicación)
+TITLE = "Basket Analytics"
+
+# Páginas generadas: ruta de la aplicación -> (carpeta, texto del menú)
+PAGES = {
+    "/": ("", "Liga"),
+    "/players": ("players/", "Jugadores"),
+    "/scatter": ("scatter/", "Dispersión"),
+    "/correlation": ("correlation/", "Correlaciones"),
+}
+
+# Ejes por defecto de la página de dispersión (los mismos que su layout)
+SCATTER_AXES = ("Minutos Jugados", "Puntos Totales")
+
+# --- Documento HTML ---
+
+def _json(value):
+    """
+    Serializa un valor para guardarlo o incluirlo dentro de un `<script>`.
+
+    :param value: Valor serializable (figuras, textos...).
+    :return: Texto JSON sin secuencias que cierren la etiqueta `<script>`.
+    """
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+
+
+def plot_script(graph_id, figure):
+    """
+    JavaScript que dibuja una figura en su contenedor.
+
+    :param graph_id: Identificador del `<div>` del gráfico.
+    :param figure: Figura como diccionario (la que devuelven las cachés).
+    :return: Texto JavaScript.
+    """
+    return (f"(function (figure) {{ Plotly.newPlot({json.dumps(graph_id)}, figure.data || [], "
+            f"figure.layout || {{}}, {{responsive: true}}); }})({_json(figure)});\n")
+
+
+def page_html(route, heading, body, script="", scripts=()):
+    """
+    Construye el documento HTML de una página con el menú de las páginas estáticas.
+
+    Los enlaces y los scripts son relativos a la carpeta de la página.
+
+    :param route: Ruta de la página en la aplicación (clave de `PAGES`).
+    :param heading: Título de la página.
+    :param body: HTML del contenido.
+    :param script: JavaScript de la página.
+    :param scripts: Scripts adicionales, relativos a la carpeta de la versión.
+    :return: Texto HTML.
+    """
+    root = "../" * PAGES[route][0].count("/")  # De la carpeta de la página a la de la versión
+    menu = "".join(
+        f"<a class=\"nav-link{' active' if path == route else ''}\" href=\"{root + folder or './'}\">"
+        f"{html_escape.escape(label)}</a>"
+        for path, (folder, label) in PAGES.items()
+    )
+    sources = ["assets/plotly.min.js", *scripts]
+    return (
+        "<!DOCTYPE html>\n<html lang=\"es\">\n<head>\n<meta charset=\"utf-8\">\n"
+        f"<title>{html_escape.escape(heading)} · {TITLE}</title>\n"
+        f"<link rel=\"stylesheet\" href=\"{dbc.themes.BOOTSTRAP}\">\n"
+        + "".join(f"<script src=\"{root}{source}\"></script>\n" for source in sources)
+        + "</head>\n<body class=\"container py-3\">\n"
+        f"<nav class=\"nav nav-pills mb-3\">{menu}</nav>\n"
+        f"<h1 class=\"h3\">{html_escape.escape(heading)}</h1>\n{body}\n"
+        f"<script>{script}</script>\n</body>\n</html>\n"
+    )
+
+# --- Estado inicial de cada ruta ---
+
+def default_season():
+    """
+    Temporada que muestran por defecto los selectores (la más reciente).
+
+    :return: Temporada, o `ALL` si no hay particiones.
+    """
+    partitions = current().partitions()
+    return max((season for season, _ in partitions), key=season_rank) if partitions else ALL
+
+
+def league_outputs(start, size, season, competition=ALL):
+    """
+    Salidas del callback de la liga para una ventana, por identificador de elemento.
+
+    :param start: Puesto inicial (empezando en 1).
+    :param size: Tamaño de la ventana.
+    :return: Diccionario identificador -> figura o texto.
+    """
+    from page.leage_players_page import CARDS, update_graph_and_label
+    figure, *texts = update_graph_and_label(start, size, season, competition)
+    ids = [f"{prefix}-{part}" for prefix, _ in CARDS for part in ("value", "stats")] + ["rank-total"]
+    return {"graph-top-players": figure, **dict(zip(ids, texts))}
+
+
+# Script de la página de la liga: cambia de ventana cargando los JSON precalculados
+LEAGUE_SCRIPT = """
+(function () {
+    var total = %(total)d, size = %(size)d, start = 0;
+    function show(outputs) {
+        Object.keys(outputs).forEach(function (id) {
+            if (id === "graph-top-players") {
+                Plotly.react(id, outputs[id].data, outputs[id].layout, {responsive: true});
+            } else {
+                document.getElementById(id).textContent = outputs[id];
+            }
+        });
+    }
+    function load() {
+        fetch("league/" + size + "/" + start + ".json").then(function (response) {
+            return response.json();
+        }).then(show);
+    }
+    document.getElementById("rank-prev").onclick = function () {
+        if (start > 0) { start = Math.max(start - size, 0); load(); }
+    };
+    document.getElementById("rank-next").onclick = function () {
+        if (start + size < total) { start += size; load(); }
+    };
+    document.getElementById("rank-size").onchange = function (event) {
+        size = parseInt(event.target.value, 10);
+        start = Math.floor(start / size) * size;  // Solo existen las ventanas alineadas
+        load();
+    };
+    show(%(outputs)s);
+})();
+"""
+
+
+def render_league(folder, sizes):
+    """
+    Genera la página de la liga y todas las ventanas de su ranking.
+
+    :param folder: Carpeta de la versión.
+    :param sizes: Tamaños de ventana.
+    :return: Número de archivos escritos.
+    """
+    from page.leage_players_page import CARDS, league_view
+
+    season = default_season()
+    total = len(league_view(season, ALL))
+    written = 0
+    for size in sizes:
+        # Las mismas ventanas que recorren los botones "Anteriores" / "Siguientes"
+        for offset in range(0, max(total, 1), size):
+            path = os.path.join(folder, "league", str(size), f"{offset}.json")
+            _write(path, _json(league_outputs(offset + 1, size, season)))
+            written += 1
+
+    options = "".join(f"<option value=\"{size}\">{size} jugadores</option>" for size in sizes)
+    cards = "".join(
+        f"<div class=\"col\"><strong>{html_escape.escape(label)}</strong>"
+        f"<div id=\"{prefix}-value\" class=\"fs-4\"></div>"
+        f"<small id=\"{prefix}-stats\" class=\"text-muted\"></small></div>"
+        for prefix, label in CARDS
+    )
+    body = (
+        "<p><button id=\"rank-prev\" class=\"btn btn-outline-secondary btn-sm\">Anteriores</button> "
+        "<button id=\"rank-next\" class=\"btn btn-outline-secondary btn-sm\">Siguientes</button> "
+        f"<select id=\"rank-size\" class=\"form-select form-select-sm d-inline-block w-auto\">{options}</select> "
+        "<span id=\"rank-total\" class=\"text-muted\"></span></p>\n"
+        f"<div class=\"row mb-3\">{cards}</div>\n<div id=\"graph-top-players\"></div>"
+    )
+    script = LEAGUE_SCRIPT % {"total": total, "size": sizes[0],
+                              "outputs": _json(league_outputs(1, sizes[0], season))}
+    heading = "Ranking de la liga" + ("" if season == ALL else f" ({season})")
+    _write(os.path.join(folder, "index.html"), page_html("/", heading, body, script))
+    return written + 1
+
+
+def render_scatter(folder):
+    """
+    Genera la página de dispersión con los ejes y la vista por defecto.
+
+    :param folder: Carpeta de la versión.
+    :return: Número de archivos escritos.
+    """
+    from page.scatter import update_scatter_plot
+
+    season = default_season()
+    figure = update_scatter_plot(*SCATTER_AXES, season, ALL)
+    pairs = "".join(
+        f"<li>{html_escape.escape(x_axis)} · {html_escape.escape(y_axis)} (r = {r:.2f})</li>"
+        for x_axis, y_axis, r in top_pairs(current().view(*selected_partition(season, ALL)))
+    )
+    body = ("<div id=\"scatter-plot\"></div>\n"
+            f"<h2 class=\"h5\">Pares de estadísticas más relacionados</h2>\n<ul>{pairs}</ul>")
+    _write(os.path.join(folder, "scatter", "index.html"),
+           page_html("/scatter", "Gráfico de dispersión", body, plot_script("scatter-plot", figure)))
+    return 1
+
+
+def render_correlation(folder):
+    """
+    Genera la página de correlaciones de la vista por defecto.
+
+    :param folder: Carpeta de la versión.
+    :return: Número de archivos escritos.
+    """
+    from page.correlation import update_correlation_heatmap
+
+    figure = update_correlation_heatmap(default_season(), ALL)
+    _write(os.path.join(folder, "correlation", "index.html"),
+           page_html("/correlation", "Correlaciones", "<div id=\"correlation-heatmap\"></div>",
+                     plot_script("correlation-heatmap", figure)))
+    return 1
+
+
+# Script de la página de jugadores: el radar se dibuja con `assets/radar.js` a partir de la matriz
+PLAYERS_SCRIPT = """
+(function () {
+    var store = null, selected = [], figure = null;
+    var input = document.getElementById("player-input");
+    function draw() {
+        figure = window.dash_clientside.radar.render(selected, store, figure);
+        Plotly.react("radar-chart", figure.data, figure.layout, {responsive: true});
+        document.getElementById("player-selected").textContent = selected.join(", ");
+    }
+    fetch("radar-matrix.json").then(function (response) {
+        return response.json();
+    }).then(function (data) {
+        store = data;
+        var list = document.getElementById("player-names");
+        store.names.forEach(function (name) {
+            var option = document.createElement("option");
+            option.value = name;
+            list.appendChild(option);
+        });
+        input.disabled = false;
+    });
+    document.getElementById("player-add").onclick = function () {
+        var name = input.value;
+        if (store && store.names.indexOf(name) >= 0 && selected.indexOf(name) < 0) {
+            selected.push(name);
+            draw();
+        }
+        input.value = "";
+    };
+    document.getElementById("player-clear").onclick = function () {
+        selected = [];
+        draw();
+    };
+    Plotly.newPlot("radar-chart", [], {}, {responsive: true});
+})();
+"""
+
+
+def render_players(folder):
+    """
+    Genera la página de jugadores y la matriz de métricas con la que se dibuja su radar.
+
+    :param folder: Carpeta de la versión.
+    :return: Número de archivos escritos.
+    """
+    from page.players_page import radar_payload
+
+    _write(os.path.join(folder, "players", "radar-matrix.json"), _json(radar_payload(current())))
+    body = (
+        "<p><input id=\"player-input\" list=\"player-names\" class=\"form-control d-inline-block w-auto\" "
+        "placeholder=\"Nombre del jugador\" disabled><datalist id=\"player-names\"></datalist> "
+        "<button id=\"player-add\" class=\"btn btn-primary btn-sm\">Añadir</button> "
+        "<button id=\"player-clear\" class=\"btn btn-outline-secondary btn-sm\">Quitar todos</button></p>\n"
+        "<p id=\"player-selected\" class=\"text-muted\"></p>\n<div id=\"radar-chart\"></div>"
+    )
+    _write(os.path.join(folder, "players", "index.html"),
+           page_html("/players", "Comparación de jugadores", body, PLAYERS_SCRIPT, scripts=["assets/radar.js"]))
+    return 2
+
+# --- Escritura y publicación ---
+
+def _write(path, text):
+    """
+    Escribe un archivo de texto, creando sus carpetas.
+
+    :param path: Ruta del archivo.
+    :param text: Contenido.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _publish(output, name):
+    """
+    Marca una versión generada como la publicada (`current.json` y el enlace `current`).
+
+    Ambos se sustituyen con `os.replace`, así que un servidor nunca ve una versión a medias.
+
+    :param output: Carpeta de salida.
+    :param name: Nombre de la carpeta de la versión.
+    """
+    pointer = os.path.join(output, "current.json")
+    _write(pointer + ".tmp", json.dumps({"version": name}))
+    os.replace(pointer + ".tmp", pointer)
+    link = os.path.join(output, "current")
+    try:
+        if os.path.lexists(link + ".tmp"):
+            os.remove(link + ".tmp")
+        os.symlink(name, link + ".tmp")
+        os.replace(link + ".tmp", link)
+    except OSError:
+        pass  # Sin enlaces simbólicos (por ejemplo, en Windows): queda current.json
+
+
+def prerender(output=DEFAULT_OUTPUT, sizes=None, force=False):
+    """
+    Genera la versión estática de todas las páginas para la versión actual de los datos.
+
+    La versión se escribe en una carpeta temporal y se renombra al terminar.
+    Si ya existe y no se pide `force`, solo se vuelve a publicar.
+
+    :param output: Carpeta de salida.
+    :param sizes: Tamaños de ventana del ranking (por defecto, todos los de la página).
+    :param force: Si es True, se vuelve a generar aunque la versión ya exista.
+    :return: Ruta de la carpeta de la versión.
+    """
+    from page.leage_players_page import WINDOW_SIZES
+
+    started = time.perf_counter()
+    snapshot = current()
+    name = snapshot.version.replace("/", "_").replace("+", "_")
+    folder = os.path.join(output, name)
+    if os.path.isdir(folder) and not force:
+        _publish(output, name)
+        print(f"La versión {snapshot.version} ya estaba generada en {folder}")
+        return folder
+
+    temporary = os.path.join(output, f".{name}.{os.getpid()}.tmp")
+    shutil.rmtree(temporary, ignore_errors=True)
+    _write(os.path.join(temporary, "assets", "plotly.min.js"), get_plotlyjs())
+    shutil.copyfile(RADAR_SCRIPT, os.path.join(temporary, "assets", "radar.js"))
+
+    written = render_league(temporary, sizes or WINDOW_SIZES)
+    written += render_scatter(temporary)
+    written += render_correlation(temporary)
+    written += render_players(temporary)
+
+    if os.path.isdir(folder):
+        shutil.rmtree(folder)
+    os.replace(temporary, folder)
+    _publish(output, name)
+    print(f"Páginas estáticas: {written} archivos en {time.perf_counter() - started:.1f} s "
+          f"(versión {snapshot.version}, {folder})")
+    return folder
+
+
+def serve(folder, port):
+    """
+    Sirve una carpeta generada con un servidor estático local (sin Python de la aplicación).
+
+    Las carpetas de las páginas (`/scatter/`) se resuelven a su `index.html`.
+
+    :param folder: Carpeta de la versión.
+    :param port: Puerto local.
+    """
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=folder)
+    with http.server.ThreadingHTTPServer(("127.0.0.1", port), handler) as server:
+        print(f"Sirviendo {folder} en http://127.0.0.1:{port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera la versión estática de las páginas.")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT, help="Carpeta de salida")
+    parser.add_argument("--sizes", default=None, help="Tamaños de ventana del ranking separados por comas")
+    parser.add_argument("--force", action="store_true", help="Volver a generar aunque la versión ya exista")
+    parser.add_argument("--serve", type=int, default=None, metavar="PUERTO",
+                        help="Servir después la carpeta generada en este puerto")
+    args = parser.parse_args()
+
+    folder = prerender(
+        output=args.out,
+        sizes=[int(size) for size in args.sizes.split(",")] if args.sizes else None,
+        force=args.force,
+    )
+    if args.serve:
+        serve(folder, args.serve)
@@ -0,0 +1,191 @@
+"""
+Precalentamiento de las cachés de figuras.
+
+Construye en varios procesos los gráficos y las tarjetas de todas las ventanas
+del ranking, los gráficos de dispersión de los pares de ejes configurados y la
+matriz del radar, y los guarda en la caché compartida en disco
+(`FIGURE_CACHE_DIR`). Así la primera visita tras un despliegue ya encuentra
+las figuras construidas.
+
+Uso:
+    python prewarm.py [--workers N] [--sizes 10,25] [--pairs "Minutos Jugados:Puntos Totales;..."]
+
+También puede lanzarse al arrancar la aplicación con `PREWARM_ON_START=1`.
+"""
+import argparse  # Para leer los argumentos de la línea de comandos
+import multiprocessing  # Para crear los procesos con el método "spawn"
+import os  # Para leer la configuración desde variables de entorno
+import sys  # Para añadir la carpeta del proyecto al path
+import threading  # Para precalentar en segundo plano al arrancar la aplicación
+import time  # Para medir la duración del precalentamiento
+from concurrent.futures import ProcessPoolExecutor, as_completed  # Pool de procesos
+
+# Permitir ejecutar el script desde cualquier carpeta
+module_path = os.path.dirname(os.path.abspath(__file__))
+if module_path not in sys.path:
+    sys.path.append(module_path)
+
+from components.PartitionSelectors import ALL  # Valor "todas" de los selectores
+from data.dataset import current, recent_versions  # Versión actual y versiones que se conservan en disco
+from utils.cache import FIGURE_CACHE_FOLDER  # Carpeta de la caché compartida
+
+# --- Configuración ---
+
+# Pares de ejes del gráfico de dispersión que se precalientan ("X:Y;X:Y")
+DEFAULT_PAIRS = os.environ.get("PREWARM_SCATTER_PAIRS", "Minutos Jugados:Puntos Totales")
+
+# Número de ventanas del ranking que construye cada tarea
+WINDOWS_PER_TASK = 50
+
+
+def parse_pairs(text):
+    """
+    Convierte el texto "X:Y;X:Y" en una lista de pares de ejes.
+
+    :param text: Pares separados por ";" con los ejes separados por ":".
+    :return: Lista de tuplas (eje X, eje Y).
+    """
+    pairs = []
+    for item in text.split(";"):
+        if item.strip():
+            x_axis, y_axis = item.split(":", 1)
+            pairs.append((x_axis.strip(), y_axis.strip()))
+    return pairs
+
+
+def selections(partitions):
+    """
+    Devuelve las combinaciones de los selectores de temporada y competición con datos.
+
+    :param partitions: Lista de tuplas (temporada, competición) disponibles.
+    :return: Lista ordenada de tuplas (temporada, competición), con `ALL` para "todas".
+    """
+    result = {(ALL, ALL)}
+    for season, competition in partitions:
+        result.update({(season, ALL), (ALL, competition), (season, competition)})
+    return sorted(result)
+
+# --- Tareas (se ejecutan en los procesos del pool) ---
+
+def _warm_league(season, competition, size, offsets):
+    """
+    Construye las ventanas del ranking indicadas.
+
+    :return: Número de ventanas que no estaban en la caché.
+    """
+    from page.leage_players_page import LEAGUE_CACHE, update_graph_and_label
+    before = LEAGUE_CACHE.misses
+    for offset in offsets:
+        update_graph_and_label(offset + 1, size, season, competition)
+    return LEAGUE_CACHE.misses - before
+
+
+def _warm_scatter(season, competition, pairs):
+    """
+    Construye los gráficos de dispersión de los pares de ejes indicados.
+
+    :return: Número de gráficos que no estaban en la caché.
+    """
+    from page.scatter import SCATTER_CACHE, update_scatter_plot
+    before = SCATTER_CACHE.misses
+    for x_axis, y_axis in pairs:
+        update_scatter_plot(x_axis, y_axis, season, competition)
+    return SCATTER_CACHE.misses - before
+
+
+def _warm_radar():
+    """
+    Construye la matriz del radar de la versión actual.
+
+    :return: 1 si no estaba en la caché, 0 si ya estaba.
+    """
+    from page.players_page import RADAR_CACHE, load_radar_matrix
+    before = RADAR_CACHE.misses
+    load_radar_matrix(None, None, None)
+    return RADAR_CACHE.misses - before
+
+# --- Precalentamiento ---
+
+def prewarm(workers=None, sizes=None, pairs=None):
+    """
+    Precalienta la caché compartida en disco usando un pool de procesos.
+
+    :param workers: Número de procesos (por defecto, uno por CPU).
+    :param sizes: Tamaños de ventana del ranking (por defecto, todos los de la página).
+    :param pairs: Pares de ejes del gráfico de dispersión (por defecto, `DEFAULT_PAIRS`).
+    :return: Número de entradas construidas.
+    """
+    from page.leage_players_page import WINDOW_SIZES, league_view
+
+    sizes = sizes or WINDOW_SIZES
+    pairs = parse_pairs(DEFAULT_PAIRS) if pairs is None else pairs
+    started = time.perf_counter()
+
+    # Preparar las tareas: ventanas del ranking por grupos, dispersión y radar
+    tasks = [(_warm_radar, ())]
+    for season, competition in selections(current().partitions()):
+        total = len(league_view(season, competition))
+        for size in sizes:
+            # Las mismas ventanas que recorren los botones "Anteriores" / "Siguientes"
+            offsets = list(range(0, max(total, 1), size))
+            for i in range(0, len(offsets), WINDOWS_PER_TASK):
+                tasks.append((_warm_league, (season, competition, size, offsets[i:i + WINDOWS_PER_TASK])))
+        if pairs:
+            tasks.append((_warm_scatter, (season, competition, pairs)))
+
+    # "spawn" evita heredar los hilos (como el vigilante de datos) del proceso padre
+    built = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(function, *args) for function, args in tasks]
+        for future in as_completed(futures):
+            built += future.result()
+
+    print(f"Cachés precalentadas: {built} entradas nuevas en {time.perf_counter() - started:.1f} s "
+          f"(versión {current().version})")
+    return built
+
+
+def start_prewarm(workers=None):
+    """
+    Lanza el precalentamiento en segundo plano, una sola vez por versión de los datos.
+
+    Si la aplicación arranca con varios workers, solo el primero que crea el
+    archivo de bloqueo de la versión lanza el pool; el resto usa la caché en disco.
+
+    :param workers: Número de procesos del pool.
+    :return: Hilo del precalentamiento, o None si otro proceso ya se encarga.
+    """
+    os.makedirs(FIGURE_CACHE_FOLDER, exist_ok=True)
+    version = current().version
+    keep = {f"prewarm-{kept}.lock" for kept in recent_versions() | {version}}
+    for name in os.listdir(FIGURE_CACHE_FOLDER):
+        if name.startswith("prewarm-") and name.endswith(".lock") and name not in keep:
+            try:
+                os.remove(os.path.join(FIGURE_CACHE_FOLDER, name))  # Bloqueo de una versión antigua
+            except OSError:
+                pass
+    lock_path = os.path.join(FIGURE_CACHE_FOLDER, f"prewarm-{version}.lock")
+    try:
+        os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return None
+
+    thread = threading.Thread(target=prewarm, kwargs={"workers": workers},
+                              name="cache-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precalienta la caché de figuras compartida en disco.")
+    parser.add_argument("--workers", type=int, default=None, help="Número de procesos (por defecto, uno por CPU)")
+    parser.add_argument("--sizes", default=None, help="Tamaños de ventana del ranking separados por comas")
+    parser.add_argument("--pairs", default=DEFAULT_PAIRS, help='Pares de ejes "X:Y;X:Y" del gráfico de dispersión')
+    args = parser.parse_args()
+
+    prewarm(
+        workers=args.workers,
+        sizes=[int(size) for size in args.sizes.split(",")] if args.sizes else None,
+        pairs=parse_pairs(args.pairs),
+    )
@@ -0,0 +1,138 @@
+import multiprocessing  # Para recoger los procesos terminados
+import os  # Para comprobar los procesos de las tareas
+import time  # Para esperar a que terminen las tareas
+
+import pytest  # Para omitir las pruebas donde no hay `fork`
+from dash.exceptions import PreventUpdate  # Tareas que no actualizan nada
+
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.correlation import correlation_sums  # Sumas de correlación (estructura devuelta al worker)
+from data.dataset import Snapshot, current, publish  # Versiones de los datos compartidos
+from data.metrics import derive_metrics  # Métricas derivadas
+from utils.background import BACKGROUND_ENABLED, LocalJobManager  # Gestor de tareas en segundo plano
+
+pytestmark = pytest.mark.skipif(not BACKGROUND_ENABLED, reason="Las tareas necesitan fork y fcntl")
+
+
+def start(manager, key, fn, *args, inline=None):
+    """
+    Lanza una tarea con el gestor, como hace Dash al recibir la petición.
+
+    :param manager: Gestor `LocalJobManager`.
+    :param key: Identificador de la tarea.
+    :param fn: Función de la tarea.
+    :param args: Argumentos de la función.
+    :param inline: Función opcional que decide si la tarea se ejecuta sin crear un proceso.
+    :return: Identificador devuelto por el gestor.
+    """
+    fn.inline = inline
+    return manager.call_job_fn(key, manager.make_job_fn(fn, False), list(args), {})
+
+
+def wait(manager, key, timeout=10):
+    """
+    Espera a que una tarea tenga resultado.
+
+    :param manager: Gestor `LocalJobManager`.
+    :param key: Identificador de la tarea.
+    :param timeout: Segundos máximos de espera.
+    """
+    limit = time.time() + timeout
+    while not manager.result_ready(key):
+        assert time.time() < limit, "La tarea no ha terminado"
+        time.sleep(0.02)
+
+
+def finished(pid, timeout=5):
+    """
+    Espera a que termine un proceso hijo y lo recoge.
+
+    :param pid: Identificador del proceso.
+    :param timeout: Segundos máximos de espera.
+    :return: True si el proceso ha terminado antes del límite.
+    """
+    limit = time.time() + timeout
+    while time.time() < limit:
+        multiprocessing.active_children()  # Recoger los hijos terminados
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def slow(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+# --- Pruebas ---
+
+
+def test_result_and_memos_come_back_to_the_worker(tmp_path):
+    publish(Snapshot(derive_metrics(synthetic_players(100)), "background/test"))
+    manager = LocalJobManager(folder=str(tmp_path))
+
+    def work(season):
+        correlation_sums(current().view(season))
+        return f"ok {os.getpid()}"
+
+    view = current().view("2022-23")
+    start(manager, "k", work, "2022-23")
+    wait(manager, "k")
+
+    pid = manager._read("k", ".pid")
+    assert pid != os.getpid()
+    assert manager.get_result("k", "k") == f"ok {pid}"  # Ejecutada en el proceso hijo
+    assert view.cached("correlation_sums") is not None  # Calculadas en el hijo, adoptadas aquí
+    assert not [name for name in os.listdir(str(tmp_path)) if not name.startswith(".")]  # Archivos recogidos
+
+
+def test_identical_requests_share_one_job(tmp_path):
+    manager = LocalJobManager(folder=str(tmp_path))
+    start(manager, "k", slow, 0.5)
+    pid = manager._read("k", ".pid")
+    start(manager, "k", slow, 0.5)
+
+    assert manager._read("k", ".pid") == pid  # Sin segundo proceso
+    assert manager._read("k", ".refs") == 2
+    wait(manager, "k")
+    assert manager.get_result("k", "k") == 0.5
+    assert manager.result_ready("k")  # La otra petición aún no lo ha recogido
+    assert manager.get_result("k", "k") == 0.5
+    assert not manager.result_ready("k")
+
+
+def test_job_is_cancelled_when_nobody_waits(tmp_path):
+    manager = LocalJobManager(folder=str(tmp_path))
+    start(manager, "k", slow, 30)
+    start(manager, "k", slow, 30)
+    pid = manager._read("k", ".pid")
+
+    manager.terminate_job("k")  # Una petición sustituida: la otra sigue esperando
+    assert manager.job_running("k")
+    manager.terminate_job("k")
+    assert not manager._alive("k")
+    assert manager._read("k", ".pid") is None
+    assert finished(pid)  # El hijo se ha matado (no termina solo hasta dentro de 30 s)
+
+
+def test_inline_jobs_and_errors(tmp_path):
+    manager = LocalJobManager(folder=str(tmp_path))
+
+    start(manager, "cached", slow, 0, inline=lambda seconds: True)
+    assert manager.result_ready("cached") and manager._read("cached", ".pid") is None  # Sin proceso hijo
+
+    def fails():
+        raise ValueError("fallo")
+
+    def skips():
+        raise PreventUpdate
+
+    start(manager, "error", fails)
+    start(manager, "skip", skips)
+    wait(manager, "error")
+    wait(manager, "skip")
+    assert manager.get_result("error", "error")["long_callback_error"]["msg"] == "fallo"
+    assert manager.get_result("skip", "skip") == {"_dash_no_update": "_dash_no_update"}
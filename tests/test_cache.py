@@ -0,0 +1,35 @@
+import os  # Para comprobar las carpetas de la caché en disco
+
+import data.dataset as dataset  # Versiones que se conservan en disco
+import utils.cache as cache  # Caché de figuras en memoria y en disco
+from utils.cache import FigureCache  # Caché LRU de figuras serializadas
+
+
+def test_new_version_prunes_figures_of_old_versions(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "recent_versions", lambda: {"v1", "v2"})
+    figures = FigureCache(1024, folder=str(tmp_path), name="prueba")
+    for version in ("v1", "v2"):
+        figures.put((version, 0, 10), "{}")
+    assert sorted(os.listdir(tmp_path)) == ["v1", "v2"]
+
+    monkeypatch.setattr(cache, "recent_versions", lambda: {"v2", "v3"})
+    figures.put(("v3/2022-23/*", 0, 10), "{}")  # Las vistas van en la carpeta de su versión
+
+    assert sorted(os.listdir(tmp_path)) == ["v2", "v3"]
+    assert FigureCache(1024, folder=str(tmp_path)).get(("v3/2022-23/*", 0, 10)) == "{}"
+
+
+def test_prune_versions_keeps_most_recent_stores(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataset, "CACHE_FOLDER", str(tmp_path))
+    hashes = [str(i) * 64 for i in range(4)]
+    for age, sha256 in enumerate(reversed(hashes)):
+        for name in (sha256, f"{sha256}.shared"):
+            os.makedirs(tmp_path / name)
+            os.utime(tmp_path / name, (1000 - age, 1000 - age))
+    (tmp_path / "latest.json").write_text("{}")
+
+    assert dataset.recent_versions(keep=2) == {hashes[3][:12], hashes[2][:12]}
+    dataset.prune_versions(keep=2)
+
+    kept = {hashes[3], f"{hashes[3]}.shared", hashes[2], f"{hashes[2]}.shared", "latest.json"}
+    assert set(os.listdir(tmp_path)) == kept
@@ -0,0 +1,60 @@
+import numpy as np  # Para generar los datos y comparar las matrices
+import pandas as pd  # Para comparar con `DataFrame.corr`
+
+from data.correlation import CorrelationSums, correlation_matrix, top_pairs  # Matriz de correlaciones
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+
+
+def block(rows=200, seed=3):
+    """
+    Genera un bloque con columnas correlacionadas y algunos valores ausentes.
+
+    :param rows: Número de filas.
+    :param seed: Semilla del generador.
+    :return: DataFrame con las columnas A, B, C y D.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=rows)
+    frame = pd.DataFrame({
+        "A": a,
+        "B": 0.8 * a + 0.6 * rng.normal(size=rows),  # Muy correlacionada con A
+        "C": rng.normal(size=rows),  # Independiente
+        "D": -0.4 * a + rng.normal(size=rows),  # Correlación negativa con A
+    })
+    frame.iloc[rng.choice(rows, 20, replace=False), 1] = np.nan
+    return frame
+
+
+# --- Pruebas ---
+
+
+def test_matrix_matches_pandas_with_missing_values():
+    frame = block()
+    sums = CorrelationSums.from_block(frame.columns, frame.to_numpy())
+    np.testing.assert_allclose(sums.matrix(), frame.corr().to_numpy(), atol=1e-10)
+
+
+def test_replace_matches_a_full_recompute():
+    frame = block()
+    sums = CorrelationSums.from_block(frame.columns, frame.to_numpy())
+    changed = frame.copy()
+    rows = [0, 5, 17]
+    changed.iloc[rows] = [[9.0, np.nan, 1.0, -3.0], [0.5, 0.5, 0.5, 0.5], [-2.0, -2.5, np.nan, 4.0]]
+
+    updated = sums.copy().replace(frame.iloc[rows].to_numpy(), changed.iloc[rows].to_numpy())
+    np.testing.assert_allclose(updated.matrix(), changed.corr().to_numpy(), atol=1e-10)
+    np.testing.assert_allclose(sums.matrix(), frame.corr().to_numpy(), atol=1e-10)  # La copia es independiente
+
+
+def test_top_pairs_skip_identical_columns():
+    frame = block()
+    frame["A total"] = frame["A"] * 2  # Idéntica a A: no aporta nada
+    frame["Nombre"] = "x"  # El texto no se correlaciona
+    snapshot = Snapshot(frame, "test")
+
+    pairs = top_pairs(snapshot, count=4)
+    assert {(x, y) for x, y, _ in pairs[:2]} == {("A", "B"), ("B", "A total")}  # Empatadas: B frente a A
+    assert ("A", "A total") not in [(x, y) for x, y, _ in pairs]
+    assert pairs[0][2] > 0.7 and pairs[2][2] < 0  # D: correlación negativa
+    assert [abs(r) for _, _, r in pairs] == sorted((abs(r) for _, _, r in pairs), reverse=True)
+    assert correlation_matrix(snapshot)[0] == ["A", "B", "C", "D", "A total"]
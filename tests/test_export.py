@@ -0,0 +1,101 @@
+import io  # Para leer los CSV descargados
+import threading  # Para sustituir el límite de exportaciones simultáneas
+
+import dash  # Para montar una aplicación mínima con la ruta de exportación
+import pandas as pd  # Para leer y comparar los CSV
+
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.dataset import Snapshot, publish  # Versiones de los datos compartidos
+from data.metrics import derive_metrics  # Métricas derivadas
+from data.ranking import rank_order  # Orden del ranking de la liga
+from utils import export  # Exportación de los datos de las páginas
+
+
+def client(rows=50):
+    """
+    Publica datos sintéticos y devuelve un cliente de una aplicación con la ruta de exportación.
+
+    :param rows: Número de jugadores.
+    :return: Tupla (cliente de pruebas de Flask, versión publicada).
+    """
+    snapshot = publish(Snapshot(derive_metrics(synthetic_players(rows)), "test"))
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    export.export(app)
+    return app.server.test_client(), snapshot
+
+
+def read_csv(response):
+    """
+    Lee el CSV de una respuesta y la cierra (libera el hueco de exportación).
+
+    :param response: Respuesta de la ruta de exportación.
+    :return: DataFrame leído.
+    """
+    try:
+        return pd.read_csv(io.BytesIO(response.get_data()))
+    finally:
+        response.close()
+
+
+# --- Pruebas ---
+
+
+def test_scatter_scales_only_the_axes():
+    test_client, snapshot = client()
+    response = test_client.get(export.export_url("scatter", x="Puntos Totales", y="Asistencias", scale="percentil"))
+
+    assert response.status_code == 200
+    assert response.headers["X-Data-Version"] == snapshot.version
+    frame = read_csv(response)
+    assert list(frame.columns) == ["Nombre", "Puntos Totales", "Asistencias", "PER Aproximado"]
+    assert len(frame) == len(snapshot)
+    assert frame["Puntos Totales"].between(0, 1).all()
+    pd.testing.assert_series_equal(frame["PER Aproximado"], snapshot.frame["PER Aproximado"].reset_index(drop=True),
+                                   check_exact=False)
+
+
+def test_league_window_follows_the_ranking(monkeypatch):
+    monkeypatch.setattr(export, "CHUNK_ROWS", 4)  # Varios bloques en una exportación pequeña
+    test_client, snapshot = client()
+    frame = read_csv(test_client.get(export.export_url("league", start=3, size=10)))
+
+    expected = snapshot.frame["Nombre"].to_numpy()[rank_order(snapshot.view(None, None))[2:12]]
+    assert frame["Nombre"].tolist() == list(expected)
+
+
+def test_radar_exports_the_selected_players():
+    test_client, snapshot = client()
+    names = list(snapshot.frame["Nombre"][[4, 1]])
+    frame = read_csv(test_client.get(export.export_url("radar", player=[*names, "Nadie"])))
+    assert frame["Nombre"].tolist() == names
+
+
+def test_bad_requests_are_rejected():
+    test_client, _ = client()
+    for url in (export.export_url("scatter", x="Nombre", y="Asistencias"),  # Columna no numérica
+                export.export_url("scatter", x="Asistencias", y="Ataque", scale="log"),
+                export.export_url("league", start="uno")):
+        response = test_client.get(url)
+        assert response.status_code == 400, url
+        response.close()
+    assert test_client.get("/export/otra.csv").status_code == 404
+    assert test_client.get("/export/league.xlsx").status_code == 404
+
+
+def test_parquet_needs_pyarrow(monkeypatch):
+    monkeypatch.setattr(export, "pq", None)
+    test_client, _ = client()
+    assert test_client.get(export.export_url("league", "parquet")).status_code == 501
+
+
+def test_concurrent_exports_are_limited(monkeypatch):
+    monkeypatch.setattr(export, "_slots", threading.BoundedSemaphore(1))
+    test_client, _ = client()
+    url = export.export_url("league")
+
+    first = test_client.get(url)  # Respuesta en streaming sin cerrar: ocupa el hueco
+    assert first.status_code == 200
+    assert test_client.get(url).status_code == 429
+    first.close()
+    assert len(read_csv(test_client.get(url))) == 50  # Al cerrarse, el hueco queda libre
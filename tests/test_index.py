@@ -0,0 +1,38 @@
+import pandas as pd  # Para construir un libro con jugadores repetidos
+
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+from data.index import lookup, name_index  # Índice de jugadores por nombre
+from data.partitions import COMPETITION_COLUMN, DEFAULT_SEASON, SEASON_COLUMN, season_rank  # Particiones
+
+
+def players():
+    return Snapshot(pd.DataFrame({
+        "Nombre": ["Ana", "Ana", "Bea", "Ana", "Bea"],
+        SEASON_COLUMN: ["2021-22", "2023-24", "2022-23", "2023-24", "2021-22"],
+        COMPETITION_COLUMN: ["Liga", "Liga", "Liga", "Copa", "Liga"],
+        "Ataque": [1.0, 2.0, 3.0, 4.0, 5.0],
+    }), "test")
+
+
+def test_duplicates_use_latest_season():
+    assert name_index(players()) == {"Ana": 1, "Bea": 2}  # Ana: primera fila de 2023-24
+
+
+def test_seasons_are_ordered_by_year_not_by_label():
+    seasons = ["Actual", "2023-2024", "2022-23", "2021-22"]
+    assert sorted(seasons, key=season_rank) == ["2021-22", "2022-23", "2023-2024", DEFAULT_SEASON]
+
+    snapshot = Snapshot(pd.DataFrame({
+        "Nombre": ["Ana", "Ana", "Ana", "Bea", "Bea"],
+        SEASON_COLUMN: ["2023-2024", DEFAULT_SEASON, "2023-24", "2023-2024", "2023-24"],
+        COMPETITION_COLUMN: ["Liga"] * 5,
+    }), "test")
+    assert name_index(snapshot) == {"Ana": 1, "Bea": 3}  # Bea: el mismo año en dos formatos, primera fila
+
+
+def test_view_indexes_its_own_partition():
+    snapshot = players()
+    names, values = lookup(snapshot.view("2021-22", "Liga"), ["Ana", "Bea"], ["Ataque"])
+
+    assert names == ["Ana", "Bea"]
+    assert values[:, 0].tolist() == [1.0, 5.0]
@@ -0,0 +1,124 @@
+import numpy as np  # Para comparar los rankings y las correlaciones
+import pandas as pd  # Para comparar los DataFrames
+
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.correlation import correlation_sums  # Sumas de correlación incrementales
+from data.dataset import Snapshot, publish  # Versiones de los datos compartidos
+from data.index import metric_matrix  # Matriz de métricas del radar
+from data.live import RATIO_COLUMNS, LiveFeed, event_deltas  # Ingesta en directo
+from data.metrics import derive_metrics  # Métricas derivadas (recálculo completo)
+from data.normalization import sorted_values  # Valores ordenados de los percentiles
+from data.partitions import SEASON_COLUMN  # Columna de la temporada
+from data.ranking import rank_order, rank_window  # Orden y ventanas del ranking de la liga
+
+# --- Datos de prueba ---
+
+EVENTS = [
+    {"jugador": "Juan Pérez 0", "evento": "tiro3_anotado"},
+    {"jugador": "Juan Pérez 0", "evento": "tiro2_fallado"},
+    {"jugador": "Carlos Pérez 1", "evento": "tiro_libre_anotado"},
+    {"jugador": "Carlos Pérez 1", "evento": "rebote_ofensivo"},
+    {"jugador": "Miguel Pérez 2", "evento": "minutos", "cantidad": 5},
+    {"jugador": "Miguel Pérez 2", "estadisticas": {"Asistencias": 3, "Pérdidas": 1}},
+    {"jugador": "Íñigo Pérez 5", "evento": "tapon_cometido"},
+    {"jugador": "Nadie", "evento": "asistencia"},  # Jugador desconocido: se descarta
+]
+
+
+def full_recompute(raw, events):
+    """
+    Aplica los eventos sobre todo el DataFrame y recalcula todas las métricas.
+
+    :param raw: DataFrame con las columnas del libro.
+    :param events: Lista de eventos (jugadores con una sola fila).
+    :return: DataFrame esperado tras los eventos.
+    """
+    expected = raw.copy()
+    positions = {name: row for row, name in enumerate(expected["Nombre"])}
+    for event in events:
+        if event["jugador"] not in positions:
+            continue
+        for column, value in event_deltas(event).items():
+            expected.iloc[positions[event["jugador"]], expected.columns.get_loc(column)] += value
+    for ratio, (made, attempted) in RATIO_COLUMNS.items():
+        made_values = expected[made].to_numpy(dtype=float)
+        attempted_values = expected[attempted].to_numpy(dtype=float)
+        expected[ratio] = np.divide(made_values, attempted_values, out=np.zeros(len(expected)),
+                                    where=attempted_values > 0)
+    return derive_metrics(expected)
+
+
+def publish_synthetic(rows=200):
+    """
+    Publica una versión con datos sintéticos y devuelve también sus columnas del libro.
+
+    :param rows: Número de jugadores.
+    :return: Tupla (DataFrame del libro, versión publicada).
+    """
+    raw = synthetic_players(rows)
+    snapshot = publish(Snapshot(derive_metrics(raw.copy()), "test"))
+    return raw, snapshot
+
+
+# --- Pruebas ---
+
+def test_apply_matches_full_recompute():
+    raw, _ = publish_synthetic()
+    snapshot = LiveFeed("", interval=0).apply(EVENTS)
+
+    expected = full_recompute(raw, EVENTS)
+    pd.testing.assert_frame_equal(snapshot.frame, expected[snapshot.frame.columns], check_dtype=False)
+    assert np.array_equal(rank_order(snapshot), rank_order(Snapshot(expected, "expected")))
+
+
+def test_apply_publishes_delta_without_copying_the_frame():
+    _, base = publish_synthetic()
+    before = base.frame.copy()
+    snapshot = LiveFeed("", interval=0).apply(EVENTS[:2])
+
+    assert snapshot.version == "test+1" and snapshot.ephemeral
+    assert snapshot.cached("frame") is None  # Solo se construye si alguien lo pide
+    assert list(snapshot.delta[0]) == [0]
+    pd.testing.assert_frame_equal(snapshot.take([0, 1]), snapshot.frame.iloc[[0, 1]])
+    pd.testing.assert_frame_equal(base.frame, before)  # La versión del libro no se modifica
+
+
+def test_apply_carries_correlation_sums_forward():
+    raw, base = publish_synthetic()
+    correlation_sums(base)
+    snapshot = LiveFeed("", interval=0).apply(EVENTS)
+
+    carried = snapshot.cached("correlation_sums")
+    expected = correlation_sums(Snapshot(full_recompute(raw, EVENTS), "expected"))
+    assert carried is not None
+    assert np.allclose(carried.matrix(), expected.matrix(), equal_nan=True)
+
+
+def test_apply_accumulates_batches():
+    raw, _ = publish_synthetic()
+    feed = LiveFeed("", interval=0)
+    feed.apply(EVENTS[:4])
+    snapshot = feed.apply(EVENTS[4:])
+
+    expected = full_recompute(raw, EVENTS)
+    pd.testing.assert_frame_equal(snapshot.frame, expected[snapshot.frame.columns], check_dtype=False)
+    assert feed.applied == len(EVENTS) - 1 and feed.skipped == 1
+
+
+def test_views_and_rankings_of_a_delta_do_not_build_the_frame():
+    raw, _ = publish_synthetic()
+    feed = LiveFeed("", interval=0)
+    feed.apply(EVENTS[:4])
+    snapshot = feed.apply(EVENTS[4:])
+    expected = Snapshot(full_recompute(raw, EVENTS), "expected")
+
+    season, columns = raw.loc[0, SEASON_COLUMN], ("Nombre", "PER Aproximado", "Ataque")
+    view, expected_view = snapshot.view(season, columns=columns), expected.view(season, columns=columns)
+    assert len(view) == len(expected_view.frame)
+    assert np.array_equal(rank_order(snapshot), rank_order(expected))
+    assert np.array_equal(rank_order(view), rank_order(expected_view))
+    pd.testing.assert_frame_equal(rank_window(view, 0, 10).reset_index(drop=True),
+                                  rank_window(expected_view, 0, 10).reset_index(drop=True), check_dtype=False)
+    assert np.allclose(metric_matrix(snapshot), metric_matrix(expected))
+    assert np.allclose(sorted_values(view, "PER Aproximado"), sorted_values(expected_view, "PER Aproximado"))
+    assert snapshot.cached("frame") is None and view.cached("frame") is None
@@ -0,0 +1,41 @@
+import numpy as np  # Para comparar los arrays normalizados
+import pandas as pd  # Para construir una versión de los datos
+
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+from data.normalization import PERCENTILE, VALUES, ZSCORE, normalize, percentile_ranks, z_scores  # Escalas
+
+
+def players(values):
+    return Snapshot(pd.DataFrame({"Nombre": [f"J{i}" for i in range(len(values))], "Puntos": values}), "test")
+
+
+# --- Pruebas ---
+
+
+def test_percentiles_average_ties_and_keep_nan():
+    snapshot = players([1.0, 2.0, 2.0, 3.0, np.nan])
+    ranks = percentile_ranks(snapshot, "Puntos")
+
+    assert ranks[:4].tolist() == [0.125, 0.5, 0.5, 0.875]  # Los empates reciben el percentil medio
+    assert np.isnan(ranks[4])
+
+
+def test_percentiles_of_external_values():
+    snapshot = players([10.0, 20.0, 30.0, 40.0])
+    assert percentile_ranks(snapshot, "Puntos", [0.0, 25.0, 100.0]).tolist() == [0.0, 0.5, 1.0]
+    assert np.isnan(percentile_ranks(players([np.nan]), "Puntos", [1.0])).all()  # Columna sin valores
+
+
+def test_z_scores_match_numpy():
+    values = np.array([3.0, 7.0, 8.0, 14.0, np.nan])
+    expected = (values - np.nanmean(values)) / np.nanstd(values)
+
+    np.testing.assert_allclose(z_scores(players(values), "Puntos"), expected)
+    assert z_scores(players([5.0, 5.0]), "Puntos").tolist() == [0.0, 0.0]  # Columna constante
+
+
+def test_normalize_dispatches_by_scale():
+    snapshot = players([1.0, 2.0, 3.0])
+    assert normalize(snapshot, "Puntos", scale=VALUES).tolist() == [1.0, 2.0, 3.0]
+    np.testing.assert_allclose(normalize(snapshot, "Puntos", scale=PERCENTILE), [1 / 6, 1 / 2, 5 / 6])
+    np.testing.assert_allclose(normalize(snapshot, "Puntos", [2.0], scale=ZSCORE), [0.0])
@@ -0,0 +1,54 @@
+import os  # Para comprobar las carpetas de las particiones
+
+import pandas as pd  # Para construir el libro de prueba
+
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN, add_partition_columns  # Columnas de partición
+from data.partitions import STORE_FORMAT, open_store, write_store  # Almacén particionado
+
+
+def players():
+    return add_partition_columns(pd.DataFrame({
+        "Nombre": ["Ana", "Bea", "Cris", "Dani"],
+        SEASON_COLUMN: ["2022-23", "2023-24", "2022-23", None],
+        COMPETITION_COLUMN: ["Liga", "Liga", "Copa/Rey", "Liga"],
+        "Goles": [1.0, 2.0, 3.0, 4.0],
+    }))
+
+
+# --- Pruebas ---
+
+
+def test_store_round_trip(tmp_path):
+    folder = str(tmp_path / "store")
+    write_store(players(), folder, {"hash": "abc"})
+    store = open_store(folder)
+
+    assert store.meta["hash"] == "abc"
+    assert sorted(store.partitions()) == [("2022-23", "Copa/Rey"), ("2022-23", "Liga"),
+                                          ("2023-24", "Liga"), ("Actual", "Liga")]
+    frame = store.read()
+    assert sorted(frame["Nombre"]) == ["Ana", "Bea", "Cris", "Dani"]
+    assert frame["Nombre"].dtype == object and frame["Goles"].dtype == float
+    assert not any(name.startswith(".tmp-") for name in os.listdir(tmp_path))  # Sin restos temporales
+
+
+def test_read_only_the_requested_partitions_and_columns(tmp_path):
+    folder = str(tmp_path / "store")
+    write_store(players(), folder, {})
+    store = open_store(folder)
+
+    frame = store.read(season="2022-23", columns=["Nombre"])
+    assert list(frame.columns) == ["Nombre"]
+    assert sorted(frame["Nombre"]) == ["Ana", "Cris"]
+    assert store.read(season="1999-00", columns=["Goles"])["Goles"].tolist() == []
+
+
+def test_missing_or_outdated_store_is_ignored(tmp_path):
+    assert open_store(str(tmp_path / "missing")) is None
+
+    folder = str(tmp_path / "store")
+    write_store(players(), folder, {})
+    meta = (tmp_path / "store" / "meta.json")
+    meta.write_text(meta.read_text(encoding="utf-8").replace(f'"format": {STORE_FORMAT}', '"format": 0'),
+                    encoding="utf-8")
+    assert open_store(folder) is None
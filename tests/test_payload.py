@@ -0,0 +1,56 @@
+import gzip  # Para descomprimir las respuestas
+
+import dash  # Para montar una aplicación mínima
+import numpy as np  # Para comparar los valores redondeados
+import plotly.graph_objects as go  # Para construir las figuras de prueba
+
+from utils import payload  # Figuras compactas y compresión de las respuestas
+from utils.payload import compact_figure, compress, round_significant  # Funciones probadas
+
+
+# --- Pruebas ---
+
+
+def test_round_significant_keeps_special_values():
+    values = round_significant([0.48387096774193550, 1234567.0, 0.0, np.nan, np.inf], digits=4)
+    assert values[:3].tolist() == [0.4839, 1235000.0, 0.0]
+    assert np.isnan(values[3]) and np.isinf(values[4])
+
+
+def test_compact_figure_rounds_floats_only():
+    fig = go.Figure(go.Scatter(x=[1 / 3, 2 / 3], y=[1, 2], text=["a", "b"],
+                               marker={"color": [0.123456, 0.654321]}))
+    compact_figure(fig, digits=3)
+    trace = fig.data[0]
+
+    assert list(trace.x) == [0.333, 0.667]
+    assert list(trace.y) == [1, 2]  # Los enteros no cambian
+    assert list(trace.text) == ["a", "b"]
+    assert list(trace.marker.color) == [0.123, 0.654]
+
+
+def test_compact_figure_keeps_only_used_template_types():
+    fig = compact_figure(go.Figure([go.Scatter(x=[1.0]), go.Bar(x=[1.0])]))
+    template = fig.layout.template.to_plotly_json()
+
+    assert set(template["data"]) == {"scatter", "bar"}
+    assert template["layout"]  # Los valores por defecto del layout se conservan
+
+
+def test_large_json_responses_are_compressed(monkeypatch):
+    monkeypatch.setattr(payload, "brotli", None)  # Forzar gzip aunque Brotli esté instalada
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    compress(app)
+    body = '{"values": [' + ", ".join(["1"] * 1000) + "]}"
+    app.server.add_url_rule("/big", "big", lambda: app.server.response_class(body, mimetype="application/json"))
+    app.server.add_url_rule("/small", "small", lambda: app.server.response_class("{}", mimetype="application/json"))
+    client = app.server.test_client()
+
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(response.get_data()).decode() == body
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+    assert "Content-Encoding" not in client.get("/big").headers  # El navegador no admite compresión
+    assert "Content-Encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
@@ -0,0 +1,69 @@
+import json  # Para leer las ventanas y la versión publicada
+import os  # Para recorrer los archivos generados
+import re  # Para buscar los enlaces de las páginas
+
+import prerender  # Prerenderizado estático de las páginas
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.dataset import Snapshot, publish  # Versiones de los datos compartidos
+from data.index import name_index  # Índice de jugadores por nombre
+from data.metrics import derive_metrics  # Métricas derivadas
+from page.leage_players_page import league_view  # Vista del ranking de la liga
+
+
+def render(output, rows=60):
+    """
+    Publica datos sintéticos y genera sus páginas estáticas.
+
+    :param output: Carpeta de salida.
+    :param rows: Número de jugadores.
+    :return: Tupla (versión publicada, carpeta de la versión).
+    """
+    snapshot = publish(Snapshot(derive_metrics(synthetic_players(rows)), "prerender/test"))
+    return snapshot, prerender.prerender(str(output), sizes=[10, 25])
+
+
+# --- Pruebas ---
+
+
+def test_writes_every_page_and_window(tmp_path):
+    snapshot, folder = render(tmp_path)
+
+    assert folder == os.path.join(str(tmp_path), "prerender_test")  # Versión sin "/" en el nombre
+    for page in ("index.html", "players/index.html", "scatter/index.html", "correlation/index.html",
+                 "players/radar-matrix.json", "assets/plotly.min.js", "assets/radar.js"):
+        assert os.path.isfile(os.path.join(folder, page)), page
+
+    total = len(league_view(prerender.default_season(), prerender.ALL))
+    for size in (10, 25):
+        names = os.listdir(os.path.join(folder, "league", str(size)))
+        windows = sorted(int(name[:-len(".json")]) for name in names)
+        assert windows == list(range(0, total, size))
+    with open(os.path.join(folder, "league", "10", "10.json"), encoding="utf-8") as f:
+        assert {"graph-top-players", "rank-total"} <= set(json.load(f))
+    with open(os.path.join(folder, "players", "radar-matrix.json"), encoding="utf-8") as f:
+        assert sorted(json.load(f)["names"]) == sorted(name_index(snapshot))
+
+
+def test_links_are_relative_to_each_page(tmp_path):
+    _, folder = render(tmp_path)
+
+    for page in ("index.html", "players/index.html"):
+        with open(os.path.join(folder, page), encoding="utf-8") as f:
+            text = f.read()
+        links = re.findall(r'(?:href|src)="([^"]*)"', text)
+        assert not [link for link in links if link.startswith("/")], page  # Se puede publicar bajo cualquier subruta
+    assert 'src="../assets/radar.js"' in text
+    assert 'href="../scatter/"' in text and 'href="../"' in text
+
+
+def test_publishes_the_version_and_reuses_it(tmp_path):
+    _, folder = render(tmp_path)
+    with open(os.path.join(str(tmp_path), "current.json"), encoding="utf-8") as f:
+        assert json.load(f) == {"version": "prerender_test"}
+    assert os.path.realpath(os.path.join(str(tmp_path), "current")) == os.path.realpath(folder)
+
+    index = os.path.join(folder, "index.html")
+    written = os.stat(index).st_mtime_ns
+    assert prerender.prerender(str(tmp_path)) == folder  # Ya generada: solo se vuelve a publicar
+    assert os.stat(index).st_mtime_ns == written
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")]
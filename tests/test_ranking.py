@@ -0,0 +1,12 @@
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+from data.metrics import derive_metrics  # Métricas derivadas (PER Aproximado)
+from data.ranking import DEFAULT_WINDOW_SIZE, clamp_window, rank_window  # Ventanas del ranking
+
+
+def test_empty_size_uses_default_window():
+    snapshot = Snapshot(derive_metrics(synthetic_players(50)), "test")
+
+    assert clamp_window(snapshot, 0, None) == (0, DEFAULT_WINDOW_SIZE)
+    assert len(rank_window(snapshot, 5, None)) == DEFAULT_WINDOW_SIZE
+    assert clamp_window(snapshot, 45, None) == (45, 50)  # Sin pasar del último puesto
@@ -0,0 +1,40 @@
+import numpy as np  # Para generar nubes de puntos
+
+from data.sampling import density_sample  # Muestreo por densidad del gráfico de dispersión
+
+
+def cloud(size, seed=1):
+    """
+    Genera una nube de puntos normal con un valor atípico al final.
+
+    :param size: Número de puntos de la nube (sin contar el atípico).
+    :param seed: Semilla del generador.
+    :return: Tupla (x, y) con los arrays de coordenadas.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.r_[rng.normal(size=size), 50.0]  # El último punto está muy lejos del resto
+    y = np.r_[rng.normal(size=size), 0.0]
+    return x, y
+
+
+# --- Pruebas ---
+
+
+def test_small_inputs_keep_every_valid_point():
+    x = np.array([1.0, np.nan, 3.0, 4.0])
+    y = np.array([1.0, 2.0, np.inf, 4.0])
+    assert density_sample(x, y, max_points=10).tolist() == [0, 3]  # Sin los puntos sin valor
+
+
+def test_sample_is_reduced_and_keeps_outliers():
+    x, y = cloud(20000)
+    kept = density_sample(x, y, max_points=1000)
+
+    assert len(kept) < 2000  # Se acerca a `max_points` en lugar de conservar los 20.000
+    assert np.all(np.diff(kept) > 0)  # Posiciones ordenadas y sin repetir
+    assert len(x) - 1 in kept  # El atípico se conserva siempre
+
+
+def test_sample_is_reproducible():
+    x, y = cloud(5000)
+    assert np.array_equal(density_sample(x, y, 500), density_sample(x, y, 500))
@@ -0,0 +1,45 @@
+import pandas as pd  # Para construir una versión de los datos con nombres
+
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de las particiones
+from data.search import SearchIndex, fold, search_index  # Búsqueda de jugadores por nombre
+
+NAMES = ["Íñigo Martínez", "Iñaki Williams", "Martín Zubimendi", "Ángel Di María", "Marcos Llorente"]
+
+
+# --- Pruebas ---
+
+
+def test_fold_removes_accents_case_and_extra_spaces():
+    assert fold("  Ángel   DI María ") == "angel di maria"
+
+
+def test_search_ignores_accents():
+    index = SearchIndex(NAMES)
+    assert index.search("inigo martinez")[0] == "Íñigo Martínez"
+    assert index.search("ANGEL")[0] == "Ángel Di María"
+
+
+def test_prefixes_of_any_word_match():
+    index = SearchIndex(NAMES)
+    assert set(index.search("mart")) >= {"Íñigo Martínez", "Martín Zubimendi"}
+    assert index.search("zubi") == ["Martín Zubimendi"]
+    assert index.search("marti")[0] == "Martín Zubimendi"  # El nombre completo empieza por la búsqueda
+
+
+def test_unrelated_or_empty_queries_return_nothing():
+    index = SearchIndex(NAMES)
+    assert index.search("xyz") == []
+    assert index.search("   ") == []
+    assert SearchIndex([]).search("ana") == []
+
+
+def test_limit_and_index_per_version():
+    snapshot = Snapshot(pd.DataFrame({
+        "Nombre": [f"Jugador {i}" for i in range(30)],
+        SEASON_COLUMN: ["Actual"] * 30,
+        COMPETITION_COLUMN: ["Liga"] * 30,
+    }), "test")
+
+    assert len(search_index(snapshot).search("jugador", limit=5)) == 5
+    assert search_index(snapshot) is search_index(snapshot)  # Se construye una sola vez por versión
@@ -0,0 +1,61 @@
+import numpy as np  # Para comprobar que los bloques se proyectan en memoria
+import pandas as pd  # Para construir el libro de prueba
+
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de partición
+from data.shared import open_shared, select_rows, write_shared  # Imagen compartida entre procesos
+
+
+def players():
+    return pd.DataFrame({
+        "Nombre": ["Ana", "Bea", "Cris", "Dani", "Eva"],
+        SEASON_COLUMN: ["2023-24", "2022-23", "2023-24", "2022-23", "2022-23"],
+        COMPETITION_COLUMN: ["Liga", "Liga", "Copa", "Liga", "Copa"],
+        "Partidos": [10, 20, 30, 40, 50],
+        "Goles": [1.5, 2.5, 3.5, 4.5, 5.5],
+    })
+
+
+def bases(array):
+    """
+    Recorre la cadena de arrays de los que `array` es una vista.
+
+    :param array: Array de NumPy.
+    :return: Generador con `array` y cada uno de sus `base`.
+    """
+    while array is not None:
+        yield array
+        array = getattr(array, "base", None)
+
+
+# --- Pruebas ---
+
+
+def test_shared_round_trip(tmp_path):
+    folder = str(tmp_path / "shared")
+    write_shared(players(), folder)
+    frame, ranges = open_shared(folder)
+
+    expected = players().sort_values([SEASON_COLUMN, COMPETITION_COLUMN], kind="stable").reset_index(drop=True)
+    pd.testing.assert_frame_equal(frame[list(expected.columns)], expected)
+    assert ranges == {("2022-23", "Copa"): (0, 1), ("2022-23", "Liga"): (1, 3),
+                      ("2023-24", "Copa"): (3, 4), ("2023-24", "Liga"): (4, 5)}
+    assert list(frame["Nombre"][slice(*ranges[("2022-23", "Liga")])]) == ["Bea", "Dani"]
+
+
+def test_numeric_columns_are_memory_mapped(tmp_path):
+    folder = str(tmp_path / "shared")
+    write_shared(players(), folder)
+    frame, _ = open_shared(folder)
+
+    values = frame["Goles"].to_numpy()
+    assert not values.flags.writeable  # Proyección de solo lectura
+    assert any(isinstance(base, np.memmap) for base in bases(values))  # Sin copia en memoria
+
+
+def test_missing_image_and_row_selection(tmp_path):
+    assert open_shared(str(tmp_path / "missing")) is None
+
+    ranges = {("a", "x"): (0, 2), ("a", "y"): (2, 5), ("b", "x"): (5, 9)}
+    assert select_rows(ranges) == [(0, 9)]  # Los rangos contiguos se fusionan
+    assert select_rows(ranges, competition="x") == [(0, 2), (5, 9)]
+    assert select_rows(ranges, season="c") == []
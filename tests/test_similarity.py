@@ -0,0 +1,54 @@
+import numpy as np  # Para comparar las similitudes con la fuerza bruta
+import pandas as pd  # Para construir una versión de los datos
+
+from benchmarks.synthetic import synthetic_players  # Datos sintéticos con las columnas del libro
+from data.dataset import Snapshot  # Versiones de los datos compartidos
+from data.index import RADAR_METRICS  # Métricas del radar
+from data.metrics import derive_metrics  # Métricas derivadas
+from data.partitions import COMPETITION_COLUMN, SEASON_COLUMN  # Columnas de partición
+from data.similarity import SimilarityIndex, similar_players, similarity_index  # Jugadores similares
+
+
+def players():
+    metrics = {metric: [50.0, 51.0, 90.0, 10.0] for metric in RADAR_METRICS}
+    metrics["Ataque"] = [50.0, 52.0, 90.0, 10.0]
+    return Snapshot(pd.DataFrame(dict({
+        "Nombre": ["Ana", "Bea", "Cris", "Dani"],
+        SEASON_COLUMN: ["Actual"] * 4,
+        COMPETITION_COLUMN: ["Liga"] * 4,
+    }, **metrics)), "test")
+
+
+# --- Pruebas ---
+
+
+def test_nearest_players_come_first():
+    result = similar_players(players(), "Ana", k=2)
+
+    assert [name for name, _ in result] == ["Bea", "Cris"]
+    assert 1 >= result[0][1] > result[1][1] > 0  # Similitud entre 0 y 1, de más a menos parecido
+
+
+def test_unknown_player_or_empty_request():
+    snapshot = players()
+    assert similar_players(snapshot, "Nadie") == []
+    assert similar_players(snapshot, "Ana", k=0) == []
+    assert len(similar_players(snapshot, "Ana", k=10)) == 3  # Nunca se devuelve a sí mismo
+
+
+def test_weights_change_the_neighbours():
+    index = SimilarityIndex(["Ana", "Bea", "Cris"], [[0.0, 0.0], [1.0, 5.0], [5.0, 1.0]], ["A", "B"])
+
+    assert index.neighbours("Ana", k=1, weights={"A": 1, "B": 0})[0][0] == "Bea"
+    assert index.neighbours("Ana", k=1, weights={"A": 0, "B": 1})[0][0] == "Cris"
+
+
+def test_matches_brute_force_on_synthetic_players():
+    snapshot = Snapshot(derive_metrics(synthetic_players(500)), "test")
+    index = similarity_index(snapshot)
+    name = index.names[7]
+
+    distances = ((index.matrix - index.matrix[7]) ** 2).sum(axis=1)
+    distances[7] = np.inf
+    expected = [index.names[i] for i in np.argsort(distances, kind="stable")[:5]]
+    assert [neighbour for neighbour, _ in similar_players(snapshot, name, k=5)] == expected
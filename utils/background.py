@@ -0,0 +1,291 @@
+import contextlib  # Para el bloqueo de las referencias de las tareas
+import functools  # Para conservar el nombre de los callbacks envueltos
+import multiprocessing  # Para ejecutar cada tarea en un proceso hijo
+import os  # Para leer la configuración y manejar los archivos de las tareas
+import pickle  # Para guardar el resultado y el progreso de cada tarea
+import signal  # Para cancelar las tareas sustituidas
+import tempfile  # Para escribir los archivos de forma atómica
+import threading  # Para proteger el registro de tareas entre hilos
+import time  # Para caducar los resultados que nadie recoge
+import traceback  # Para enviar al navegador el error de una tarea
+
+try:
+    import fcntl  # Bloqueo entre procesos (solo en sistemas POSIX)
+except ImportError:
+    fcntl = None
+
+from dash import callback  # Registro de callbacks de Dash
+from dash.exceptions import PreventUpdate  # Tareas que no actualizan nada
+from dash.long_callback.managers import BaseLongCallbackManager  # Interfaz de los gestores de Dash
+
+from data.dataset import adopt_memos, current, memo_keys, new_memos  # Versiones de los datos y sus estructuras
+
+# --- Configuración de las tareas en segundo plano ---
+
+# Carpeta compartida por todos los workers con el estado de las tareas
+BACKGROUND_FOLDER = os.environ.get(
+    "BACKGROUND_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "jobs"))
+
+# Intervalo (en milisegundos) con el que el navegador consulta si la tarea ha terminado
+BACKGROUND_INTERVAL_MS = int(os.environ.get("BACKGROUND_INTERVAL_MS", "250"))
+
+# Segundos que se guarda un resultado que nadie ha recogido (por ejemplo, si se cerró la pestaña)
+RESULT_TTL = int(os.environ.get("BACKGROUND_RESULT_TTL", "120"))
+
+# Las tareas necesitan `fork` (el hijo hereda los callbacks y los datos ya cargados)
+# y `fcntl`; `BACKGROUND_CALLBACKS=0` las ejecuta en el hilo de la petición
+BACKGROUND_ENABLED = (os.environ.get("BACKGROUND_CALLBACKS", "1") == "1"
+                      and fcntl is not None and "fork" in multiprocessing.get_all_start_methods())
+
+# Estructuras derivadas de cada versión que las tareas devuelven al worker junto con el resultado:
+# se calculan una sola vez por versión y el worker no las vuelve a calcular (por ejemplo, las
+# sugerencias de pares tras el mapa de calor o las escalas de otros ejes del gráfico de dispersión)
+RETURNED_MEMOS = {"correlation_sums", "correlation_matrix", "sorted_values", "column_moments"}
+
+# Sufijos de los archivos de cada tarea
+_SUFFIXES = (".pid", ".refs", ".progress", ".memos", ".result")
+
+# --- Gestor de tareas ---
+
+class LocalJobManager(BaseLongCallbackManager):
+    """
+    Gestor de callbacks en segundo plano con procesos locales y el estado en disco.
+
+    Cada tarea se ejecuta en un proceso hijo creado con `fork`, así que el
+    worker que atiende la petición queda libre para los callbacks rápidos. El
+    progreso y el resultado se guardan en `BACKGROUND_FOLDER`, de modo que la
+    consulta del navegador puede llegar a cualquier worker de gunicorn.
+
+    Las estructuras derivadas de `RETURNED_MEMOS` que construye la tarea (sumas
+    de correlación, valores ordenados...) se guardan junto con el resultado y el
+    worker que lo recoge las incorpora a sus versiones de los datos: no se
+    pierden al terminar el proceso hijo.
+
+    El identificador de la tarea es la clave de sus argumentos (y de la versión
+    de los datos): dos peticiones idénticas mientras la primera está en marcha
+    comparten la misma tarea. Cada petición que espera la tarea cuenta como
+    una referencia; cuando el navegador la sustituye por otra (el usuario cambia
+    otra vez el Dropdown) se libera su referencia, y la tarea se cancela si ya
+    nadie la espera.
+    """
+
+    def __init__(self, folder=BACKGROUND_FOLDER, cache_by=None):
+        """
+        :param folder: Carpeta con el estado de las tareas.
+        :param cache_by: Funciones sin argumentos cuyo valor forma parte de la clave
+            (por defecto, la versión de los datos).
+        """
+        self.folder = folder
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+        super().__init__(cache_by or [lambda: current().version])
+
+    # --- Archivos de cada tarea ---
+
+    def _path(self, key, suffix):
+        return os.path.join(self.folder, f"{key}{suffix}")
+
+    def _read(self, key, suffix, default=None):
+        try:
+            with open(self._path(key, suffix), "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+
+    def _write(self, key, suffix, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.folder, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key, suffix))
+
+    def _remove(self, key, *suffixes):
+        for suffix in suffixes or _SUFFIXES:
+            try:
+                os.remove(self._path(key, suffix))
+            except OSError:
+                pass
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """
+        Bloqueo entre hilos y procesos para leer y modificar las referencias de las tareas.
+        """
+        with self._lock, open(os.path.join(self.folder, ".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _alive(self, key):
+        """
+        Indica si el proceso de una tarea sigue en marcha.
+
+        :param key: Identificador de la tarea.
+        :return: True si el proceso existe y no ha terminado.
+        """
+        multiprocessing.active_children()  # Recoger los hijos terminados de este worker
+        pid = self._read(key, ".pid")
+        if pid is None:
+            return False
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().rsplit(")", 1)[1].split()[0] != "Z"  # Terminado, sin recoger
+        except OSError:
+            return True
+
+    def _expire(self):
+        """
+        Borra los archivos de las tareas terminadas que nadie ha recogido en `RESULT_TTL` segundos.
+        """
+        limit = time.time() - RESULT_TTL
+        for name in os.listdir(self.folder):
+            key, suffix = os.path.splitext(name)
+            path = os.path.join(self.folder, name)
+            try:
+                if suffix == ".result" and os.path.getmtime(path) < limit:
+                    self._remove(key)
+                elif suffix == ".pid" and os.path.getmtime(path) < limit and not self._alive(key):
+                    self._remove(key)  # Tarea interrumpida sin resultado
+            except OSError:
+                pass
+
+    # --- Interfaz de Dash ---
+
+    def make_job_fn(self, fn, progress):
+        manager = self
+
+        def job_fn(result_key, progress_key, user_callback_args, context):
+            def set_progress(value):
+                manager._write(result_key, ".progress", value if isinstance(value, (list, tuple)) else [value])
+
+            arguments = user_callback_args if isinstance(user_callback_args, (list, tuple)) else [user_callback_args]
+            before = memo_keys()
+            try:
+                result = fn(*([set_progress] if progress else []), *arguments)
+            except PreventUpdate:
+                result = {"_dash_no_update": "_dash_no_update"}
+            except Exception as err:  # El error se muestra en el navegador, como en Dash
+                result = {"long_callback_error": {"msg": str(err), "tb": traceback.format_exc()}}
+            manager._write(result_key, ".memos", new_memos(before, RETURNED_MEMOS))  # Antes que el resultado
+            manager._write(result_key, ".result", result)
+
+        job_fn.inline = getattr(fn, "inline", None)
+        return job_fn
+
+    def call_job_fn(self, key, job_fn, args, context):
+        with self._locked():
+            self._expire()
+            if os.path.exists(self._path(key, ".result")) or self._alive(key):
+                # Petición idéntica a una tarea en marcha (o recién terminada): se comparte
+                self._write(key, ".refs", self._read(key, ".refs", 0) + 1)
+                return key
+
+            self._remove(key)
+            self._write(key, ".refs", 1)
+            if job_fn.inline is not None and job_fn.inline(*args):
+                # Resultado ya en la caché de figuras: no merece la pena crear un proceso
+                job_fn(key, self._make_progress_key(key), args, context)
+                return key
+            process = multiprocessing.get_context("fork").Process(
+                target=job_fn, args=(key, self._make_progress_key(key), args, context), daemon=True)
+            process.start()
+            self._write(key, ".pid", process.pid)
+        return key
+
+    def job_running(self, job):
+        return bool(job) and not os.path.exists(self._path(job, ".result")) and self._alive(job)
+
+    def terminate_job(self, job):
+        # El navegador ha sustituido la petición: se cancela solo si nadie más la espera
+        if not job:
+            return
+        with self._locked():
+            refs = self._read(job, ".refs", 0) - 1
+            if refs > 0:
+                self._write(job, ".refs", refs)
+                return
+            if self._alive(job):
+                try:
+                    os.kill(self._read(job, ".pid"), signal.SIGKILL)
+                except (OSError, TypeError):
+                    pass
+            self._remove(job)
+
+    def terminate_unhealthy_job(self, job):
+        if job and not self.job_running(job) and not os.path.exists(self._path(job, ".result")):
+            self._remove(job)
+            return True
+        return False
+
+    def clear_cache_entry(self, key):
+        self._remove(key)
+
+    def get_progress(self, key):
+        return self._read(key, ".progress")
+
+    def result_ready(self, key):
+        return os.path.exists(self._path(key, ".result"))
+
+    def get_result(self, key, job):
+        result = self._read(key, ".result", self.UNDEFINED)
+        if result is self.UNDEFINED:
+            return self.UNDEFINED
+        adopt_memos(self._read(key, ".memos"))  # Lo que calculó la tarea ya no se recalcula aquí
+        with self._locked():
+            refs = self._read(key, ".refs", 0) - 1
+            if refs > 0:
+                self._write(key, ".refs", refs)  # Otras peticiones esperan el mismo resultado
+            else:
+                self._remove(key)
+        return result
+
+
+# Gestor compartido por todos los callbacks en segundo plano (None si no están disponibles)
+BACKGROUND_MANAGER = LocalJobManager() if BACKGROUND_ENABLED else None
+
+# --- Registro de callbacks en segundo plano ---
+
+def background_callback(*dependencies, progress=None, running=None, inline=None, **kwargs):
+    """
+    Registra un callback costoso para ejecutarlo en segundo plano.
+
+    La función decorada recibe sus argumentos habituales y, como argumento con
+    nombre `set_progress`, una función para informar del progreso (una lista con
+    un valor por salida de `progress`). Se puede seguir llamando directamente
+    (por ejemplo, desde `prewarm.py`); entonces `set_progress` es None.
+
+    Si las tareas en segundo plano no están disponibles, el callback se registra
+    como uno normal y se ejecuta en el hilo de la petición.
+
+    :param dependencies: Salidas, entradas y estados del callback.
+    :param progress: Salidas que muestran el progreso.
+    :param running: Tuplas (salida, valor mientras se ejecuta, valor al terminar).
+    :param inline: Función opcional que recibe los argumentos del callback y devuelve
+        True si el resultado ya está en una caché; entonces se calcula sin crear un proceso.
+    :param kwargs: Resto de opciones de `@callback`.
+    :return: Decorador que devuelve la función sin cambios.
+    """
+    def decorator(function):
+        if BACKGROUND_MANAGER is None:
+            callback(*dependencies, **kwargs)(function)
+            return function
+
+        @functools.wraps(function)  # Mismo nombre (métricas) y mismo código (clave de las tareas)
+        def job(*args):
+            if progress is None:
+                return function(*args)
+            set_progress, *args = args
+            return function(*args, set_progress=set_progress)
+
+        job.inline = inline
+        callback(*dependencies, background=True, manager=BACKGROUND_MANAGER, interval=BACKGROUND_INTERVAL_MS,
+                 progress=progress, running=running, **kwargs)(job)
+        return function
+
+    return decorator
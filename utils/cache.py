@@ -0,0 +1,237 @@
+import hashlib  # Para obtener el nombre de archivo de cada entrada en disco
+import json  # Para serializar y deserializar las figuras guardadas en la caché
+import os  # Para manejar la carpeta de la caché en disco
+import shutil  # Para borrar las figuras de las versiones antiguas
+import tempfile  # Para escribir las entradas en disco de forma atómica
+import threading  # Para proteger la caché cuando varios hilos atienden callbacks
+import time  # Para medir la construcción y la serialización de las figuras
+import weakref  # Para reiniciar los bloqueos de las cachés tras un fork
+from collections import OrderedDict  # Mantiene el orden de uso para el desalojo LRU
+
+from plotly.utils import PlotlyJSONEncoder  # Serializa figuras, arrays de NumPy, fechas...
+
+from data.dataset import recent_versions  # Versiones de los datos que se conservan en disco
+from utils.instrumentation import FIGURE_BUILD_SECONDS, FIGURE_SERIALIZE_SECONDS  # Métricas de /metrics
+
+# Carpeta de la caché de figuras compartida entre procesos
+FIGURE_CACHE_FOLDER = os.environ.get(
+    "FIGURE_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "figures"))
+
+# Versión del formato de las figuras guardadas; cambiarla invalida las entradas en disco
+CACHE_FORMAT = 2
+
+# --- Caché LRU de figuras serializadas ---
+
+_caches = weakref.WeakSet()  # Cachés creadas en el proceso
+
+
+def _reset_locks():
+    """
+    Crea bloqueos nuevos en el proceso hijo tras un `fork` (por ejemplo, una tarea en segundo
+    plano): si otro hilo tenía un bloqueo tomado al hacer el fork, el hijo no podría tomarlo nunca.
+    """
+    for cache in list(_caches):
+        cache._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
+class FigureCache:
+    """
+    Caché LRU de figuras de Plotly serializadas en JSON, limitada por tamaño en bytes.
+
+    Las figuras se guardan como texto JSON, de modo que el tamaño ocupado se
+    conoce con exactitud y una entrada no puede modificarse desde fuera. Cuando
+    se supera el límite se desalojan las entradas usadas hace más tiempo.
+
+    Si se indica una carpeta, cada entrada se guarda también en disco. Así
+    varios procesos (los workers de gunicorn o el precalentamiento con
+    `prewarm.py`) comparten las figuras ya construidas. En disco las entradas
+    se agrupan en una carpeta por versión del libro; al guardar la primera
+    figura de una versión se borran las carpetas de las versiones que ya no se
+    conservan (ver `recent_versions`), así que el disco no crece sin límite.
+    """
+
+    def __init__(self, max_bytes, folder=None, name="figuras", version=None):
+        """
+        :param max_bytes: Tamaño máximo (en bytes) de todas las figuras guardadas en memoria.
+        :param folder: Carpeta de la caché compartida en disco (opcional).
+        :param name: Nombre de la caché en las métricas de /metrics.
+        :param version: Función que devuelve la versión de los datos de una clave
+            (`Snapshot.version`); por defecto, el primer elemento de la clave.
+        """
+        self.max_bytes = max_bytes
+        self.folder = folder
+        self.name = name
+        self.version = version or (lambda key: key[0])
+        self.hits = 0  # Número de consultas servidas desde la caché (memoria o disco)
+        self.disk_hits = 0  # Número de consultas servidas desde el disco
+        self.misses = 0  # Número de consultas que tuvieron que construir la figura
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def _path(self, key):
+        """
+        Devuelve la ruta del archivo en disco de una clave.
+
+        :param key: Clave de la figura.
+        :return: Ruta del archivo JSON de la entrada.
+        """
+        digest = hashlib.sha1(repr((CACHE_FORMAT, key)).encode("utf-8")).hexdigest()
+        return os.path.join(self._version_folder(key), digest[:2], f"{digest}.json")
+
+    def _version_folder(self, key):
+        """
+        Devuelve la carpeta en disco de la versión del libro de una clave.
+
+        Las vistas de una temporada (`<versión>/<temporada>/<competición>`) van
+        en la carpeta de su versión del libro.
+
+        :param key: Clave de la figura.
+        :return: Ruta de la carpeta de la versión.
+        """
+        return os.path.join(self.folder, str(self.version(key)).split("/")[0])
+
+    def prune(self, keep):
+        """
+        Borra de la carpeta en disco las figuras de las versiones que no se conservan.
+
+        :param keep: Nombres de las carpetas de versión que se conservan.
+        """
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return
+        for name in names:
+            if name not in keep:
+                shutil.rmtree(os.path.join(self.folder, name), ignore_errors=True)
+
+    def _read_disk(self, key):
+        """
+        Lee una entrada de la caché en disco.
+
+        :param key: Clave de la figura.
+        :return: Texto JSON de la figura o None si no está.
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key, value):
+        """
+        Guarda una entrada en la caché en disco (escritura atómica).
+
+        :param key: Clave de la figura.
+        :param value: Texto JSON de la figura.
+        """
+        path = self._path(key)
+        version_folder = self._version_folder(key)
+        if not os.path.isdir(version_folder):
+            # Primera figura de esta versión: borrar las de las versiones que ya no se usan
+            self.prune(recent_versions() | {os.path.basename(version_folder)})
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # La caché en disco es opcional: si no se puede escribir, seguimos sin ella
+
+    def get(self, key):
+        """
+        Devuelve la figura serializada asociada a la clave, o None si no está.
+
+        :param key: Clave de la figura.
+        :return: Texto JSON de la figura o None.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)  # Marcar como usada recientemente
+                self.hits += 1
+                return value
+
+        # Segundo nivel: la caché compartida en disco
+        value = self._read_disk(key) if self.folder else None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        self.put(key, value, persist=False)
+        return value
+
+    def put(self, key, value, persist=True):
+        """
+        Guarda una figura serializada, desalojando las menos usadas si hace falta.
+
+        :param key: Clave de la figura.
+        :param value: Texto JSON de la figura.
+        :param persist: Si es True y hay carpeta, la entrada también se guarda en disco.
+        """
+        if persist and self.folder:
+            self._write_disk(key, value)
+        size = len(value)
+        if size > self.max_bytes:
+            return  # Una figura mayor que la caché completa no se guarda
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def get_or_build(self, key, builder, persist=True):
+        """
+        Devuelve la figura de la caché o la construye y la guarda si no está.
+
+        :param key: Clave de la figura.
+        :param builder: Función sin argumentos que devuelve una `go.Figure` (o cualquier
+            valor serializable, como una tupla de figura y textos).
+        :param persist: Si es False, la figura solo se guarda en memoria (versiones efímeras).
+        :return: Valor deserializado (la figura como diccionario), listo para devolverlo desde un callback.
+        """
+        value = self.get(key)
+        if value is None:
+            started = time.perf_counter()
+            figure = builder()
+            built = time.perf_counter()
+            value = json.dumps(figure, cls=PlotlyJSONEncoder)
+            FIGURE_BUILD_SECONDS.observe(built - started, self.name)
+            FIGURE_SERIALIZE_SECONDS.observe(time.perf_counter() - built, self.name)
+            self.put(key, value, persist)
+        return json.loads(value)
+
+    def contains(self, key):
+        """
+        Indica si la clave está en la caché (en memoria o en disco) sin contar aciertos ni fallos.
+
+        :param key: Clave de la figura.
+        :return: True si la entrada existe.
+        """
+        with self._lock:
+            if key in self._entries:
+                return True
+        return bool(self.folder) and os.path.exists(self._path(key))
+
+    def stats(self):
+        """
+        Devuelve los contadores de la caché.
+
+        :return: Diccionario con aciertos, fallos, número de entradas y bytes ocupados.
+        """
+        with self._lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self._size}
@@ -0,0 +1,261 @@
+import os  # Para leer la configuración desde variables de entorno
+import threading  # Para limitar las exportaciones simultáneas
+from urllib.parse import urlencode  # Para construir los enlaces de exportación
+
+import flask  # Para la ruta de exportación y las respuestas en streaming
+import numpy as np  # Para seleccionar las filas de cada bloque
+
+try:
+    import pyarrow as pa  # Parquet (opcional: solo si pyarrow está instalado)
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from data.dataset import current  # Versión actual de los datos compartidos
+from data.index import RADAR_METRICS, name_index  # Métricas del radar e índice de jugadores
+from data.normalization import PERCENTILE, VALUES, ZSCORE, normalize  # Escalas de los ejes y del radar
+from data.ranking import clamp_window, rank_order  # Orden del ranking precalculado
+from components.PartitionSelectors import selected_partition  # Filtro de temporada y competición
+
+# --- Configuración de la exportación ---
+
+# Filas por bloque: la memoria de una exportación no depende de su tamaño total
+CHUNK_ROWS = int(os.environ.get("EXPORT_CHUNK_ROWS", "10000"))
+
+# Exportaciones simultáneas por proceso; las demás reciben 429 en lugar de ocupar el worker
+MAX_CONCURRENT = int(os.environ.get("EXPORT_MAX_CONCURRENT", "2"))
+
+# Formatos disponibles (Parquet solo si pyarrow está instalado)
+FORMATS = ("csv", "parquet")
+
+_slots = threading.BoundedSemaphore(MAX_CONCURRENT)
+
+# --- Selección de las filas ---
+
+def _int_arg(args, name, default):
+    """
+    Lee un parámetro entero de la petición.
+
+    :param args: Parámetros de la petición.
+    :param name: Nombre del parámetro.
+    :param default: Valor si no se indica.
+    :return: Entero leído.
+    """
+    try:
+        return int(args.get(name, default))
+    except ValueError:
+        flask.abort(400, f"El parámetro '{name}' debe ser un número entero.")
+
+
+def _scale_arg(args):
+    """
+    Lee la escala de las columnas numéricas de la petición.
+
+    :param args: Parámetros de la petición.
+    :return: `VALUES` (si no se indica), `PERCENTILE` o `ZSCORE`.
+    """
+    scale = args.get("scale", VALUES)
+    if scale not in (VALUES, PERCENTILE, ZSCORE):
+        flask.abort(400, f"Escala desconocida: '{scale}'.")
+    return scale
+
+
+def league_selection(args):
+    """
+    Filas de una ventana del ranking de la liga, en el orden del ranking.
+
+    Parámetros: `season`, `competition`, `start` (puesto inicial, desde 1) y
+    `size` (número de jugadores; 0 exporta el ranking completo).
+
+    :param args: Parámetros de la petición.
+    :return: Tupla (vista `Snapshot`, posiciones de las filas, columnas, escala de cada columna).
+    """
+    from page.leage_players_page import LEAGUE_COLUMNS  # La página también importa este módulo
+    snapshot = current().view(*selected_partition(args.get("season"), args.get("competition")),
+                              columns=LEAGUE_COLUMNS)
+    size = _int_arg(args, "size", 0)
+    start, end = clamp_window(snapshot, _int_arg(args, "start", 1) - 1, size or len(snapshot))
+    return snapshot, rank_order(snapshot)[start:end], LEAGUE_COLUMNS, {}
+
+
+def scatter_selection(args):
+    """
+    Filas del gráfico de dispersión: todos los jugadores de la vista (no solo la muestra dibujada).
+
+    Parámetros: `x`, `y`, `season`, `competition` y `scale`. Como en el gráfico
+    (`scaled_frame`), la escala solo se aplica a los ejes.
+
+    :param args: Parámetros de la petición.
+    :return: Tupla (vista `Snapshot`, posiciones de las filas, columnas, escala de cada columna).
+    """
+    snapshot = current().view(*selected_partition(args.get("season"), args.get("competition")))
+    axes = [args.get("x", ""), args.get("y", "")]
+    for column in axes:
+        if column not in snapshot.frame.columns or snapshot.frame[column].dtype.kind not in "iuf":
+            flask.abort(400, f"Columna desconocida o no numérica: '{column}'.")
+    columns = list(dict.fromkeys(["Nombre", *axes, "PER Aproximado"]))
+    scale = _scale_arg(args)
+    return snapshot, np.arange(len(snapshot)), columns, {axis: scale for axis in axes}
+
+
+def radar_selection(args):
+    """
+    Filas de los jugadores comparados en el radar.
+
+    Parámetros: `player` (repetido, uno por jugador) y `scale`, que se aplica a
+    todas las métricas del radar, como en el gráfico.
+
+    :param args: Parámetros de la petición.
+    :return: Tupla (versión `Snapshot`, posiciones de las filas, columnas, escala de cada columna).
+    """
+    snapshot = current()
+    index = name_index(snapshot)
+    rows = [index[name] for name in args.getlist("player") if name in index]
+    scale = _scale_arg(args)
+    columns = ["Nombre", *RADAR_METRICS]
+    return snapshot, np.asarray(rows, dtype=np.intp), columns, {metric: scale for metric in RADAR_METRICS}
+
+
+# Selecciones exportables, por nombre
+SELECTIONS = {"league": league_selection, "scatter": scatter_selection, "radar": radar_selection}
+
+# --- Escritura por bloques ---
+
+def _chunks(snapshot, rows, columns, scales):
+    """
+    Recorre la selección en bloques de `CHUNK_ROWS` filas.
+
+    Solo se copia en memoria el bloque actual; las columnas con escala se
+    convierten bloque a bloque (con los arrays ordenados de la versión).
+
+    :param snapshot: Versión de los datos.
+    :param rows: Posiciones de las filas a exportar.
+    :param columns: Columnas a exportar.
+    :param scales: Diccionario columna -> escala (las columnas que no aparecen van en valores originales).
+    :return: Generador de DataFrames.
+    """
+    for start in range(0, len(rows), CHUNK_ROWS):
+        chunk = snapshot.take(rows[start:start + CHUNK_ROWS], columns).reset_index(drop=True)
+        for column, scale in scales.items():
+            if scale != VALUES:
+                chunk[column] = normalize(snapshot, column, chunk[column].to_numpy(), scale)
+        yield chunk
+
+
+def csv_stream(snapshot, rows, columns, scales):
+    """
+    Genera el CSV de la selección por bloques.
+
+    La cabecera se escribe con `to_csv`, igual que las filas (mismas comillas y escapes).
+
+    :return: Generador de fragmentos de texto (cabecera y un fragmento por bloque).
+    """
+    yield snapshot.take(rows[:0], columns).to_csv(index=False)
+    for chunk in _chunks(snapshot, rows, columns, scales):
+        yield chunk.to_csv(header=False, index=False)
+
+
+class _ChunkSink:
+    """
+    Destino de escritura que acumula los bytes hasta que el generador los envía.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self):
+        data, self.parts = b"".join(self.parts), []
+        return data
+
+
+def parquet_stream(snapshot, rows, columns, scales):
+    """
+    Genera el archivo Parquet de la selección: un grupo de filas por bloque.
+
+    Cada grupo se envía en cuanto se escribe; el pie del archivo se envía al final.
+
+    :return: Generador de fragmentos de bytes.
+    """
+    sink = _ChunkSink()
+    writer = None
+    try:
+        for chunk in _chunks(snapshot, rows, columns, scales):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema)
+            writer.write_table(table)
+            yield sink.drain()
+        if writer is None:  # Selección vacía: archivo con el esquema y sin filas
+            table = pa.Table.from_pandas(snapshot.take(rows[:0], columns), preserve_index=False)
+            writer = pq.ParquetWriter(sink, table.schema)
+        writer.close()
+        writer = None
+        yield sink.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+# --- Ruta de exportación ---
+
+def export_url(selection, file_format="csv", **params):
+    """
+    Construye el enlace de exportación de una selección.
+
+    :param selection: "league", "scatter" o "radar".
+    :param file_format: "csv" o "parquet".
+    :param params: Parámetros de la selección (las listas se repiten, como `player`).
+    :return: Ruta relativa con los parámetros.
+    """
+    params = {name: value for name, value in params.items() if value is not None}
+    return f"/export/{selection}.{file_format}?{urlencode(params, doseq=True)}"
+
+
+def export(app):
+    """
+    Publica la ruta `/export/<selección>.<formato>` para descargar los datos de las páginas.
+
+    Las respuestas se envían en streaming por bloques de filas, así que la
+    memoria no depende del tamaño de la exportación. Como mucho hay
+    `MAX_CONCURRENT` exportaciones a la vez por proceso; el resto recibe 429.
+
+    :param app: Aplicación Dash.
+    :return: La misma aplicación.
+    """
+    @app.server.route("/export/<selection>.<file_format>")
+    def _export(selection, file_format):
+        if selection not in SELECTIONS or file_format not in FORMATS:
+            flask.abort(404)
+        if file_format == "parquet" and pq is None:
+            flask.abort(501, "La exportación a Parquet necesita el paquete pyarrow.")
+
+        # Versión de los datos fijada al empezar: todos los bloques salen de la misma
+        snapshot, rows, columns, scales = SELECTIONS[selection](flask.request.args)
+        if not _slots.acquire(blocking=False):
+            flask.abort(429, "Hay demasiadas exportaciones en curso; inténtalo de nuevo en unos segundos.")
+
+        stream = (csv_stream if file_format == "csv" else parquet_stream)(snapshot, rows, columns, scales)
+        mimetype = "text/csv" if file_format == "csv" else "application/vnd.apache.parquet"
+        response = flask.Response(stream, mimetype=mimetype)
+        response.call_on_close(_slots.release)  # También si el cliente se desconecta a mitad
+        response.headers["Content-Disposition"] = f'attachment; filename="{selection}.{file_format}"'
+        response.headers["X-Data-Version"] = snapshot.version
+        return response
+
+    return app
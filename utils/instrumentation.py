@@ -0,0 +1,280 @@
+import bisect  # Para encontrar el intervalo (bucket) de cada observación
+import functools  # Para conservar el nombre de los callbacks envueltos
+import os  # Para activar o desactivar la instrumentación con una variable de entorno
+import threading  # Para proteger los contadores cuando varios hilos atienden peticiones
+import time  # Para medir los tiempos
+
+from dash.exceptions import PreventUpdate  # No es un error: el callback decide no actualizar
+import flask  # Para los hooks de las peticiones y la ruta /metrics
+
+# --- Métricas en formato de texto de Prometheus ---
+
+# La instrumentación está activa salvo que se desactive con METRICS_ENABLED=0
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+
+# Límites de los intervalos de tiempo (segundos) y de tamaño (bytes)
+TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Ruta de las peticiones de los callbacks de Dash
+DASH_UPDATE_PATH = "/_dash-update-component"
+
+_wrap_lock = threading.Lock()  # Evita envolver dos veces el mismo callback
+
+
+def _escape(value):
+    """
+    Escapa el valor de una etiqueta para el formato de texto de Prometheus.
+
+    :param value: Valor de la etiqueta.
+    :return: Texto escapado.
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames, labels, extra=""):
+    """
+    Devuelve las etiquetas de una serie en formato `{a="x",b="y"}`.
+
+    :param labelnames: Nombres de las etiquetas.
+    :param labels: Valores de las etiquetas, en el mismo orden.
+    :param extra: Etiqueta adicional ya formateada (por ejemplo, `le="0.1"`).
+    :return: Texto de las etiquetas (vacío si no hay ninguna).
+    """
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labels)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    """
+    Contador acumulado por combinación de etiquetas.
+    """
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        :param name: Nombre de la métrica.
+        :param documentation: Descripción que se muestra en `# HELP`.
+        :param labelnames: Nombres de las etiquetas.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        """
+        Incrementa el contador de las etiquetas indicadas.
+
+        :param labels: Valores de las etiquetas, en el orden de `labelnames`.
+        :param amount: Cantidad que se suma.
+        """
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        """
+        :return: Líneas de la métrica en formato de texto de Prometheus.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    """
+    Histograma acumulado por combinación de etiquetas, con intervalos fijos.
+
+    Cada observación solo actualiza un contador y una suma, de modo que el
+    coste no depende del número de observaciones.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=TIME_BUCKETS):
+        """
+        :param name: Nombre de la métrica.
+        :param documentation: Descripción que se muestra en `# HELP`.
+        :param labelnames: Nombres de las etiquetas.
+        :param buckets: Límites superiores de los intervalos, en orden creciente.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series = {}  # etiquetas -> [contadores por intervalo, suma, número de observaciones]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """
+        Registra una observación.
+
+        :param value: Valor observado (segundos, bytes...).
+        :param labels: Valores de las etiquetas, en el orden de `labelnames`.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        """
+        :return: Líneas de la métrica en formato de texto de Prometheus.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labels, (list(counts), total, count))
+                            for labels, (counts, total, count) in self._series.items())
+        for labels, (counts, total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += bucket_count
+                le = f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+# --- Métricas de la aplicación ---
+
+REQUEST_SECONDS = Histogram(
+    "dash_callback_request_seconds",
+    "Tiempo total de la petición de un callback (lectura, ejecución y respuesta).",
+    ["callback"])
+CALLBACK_SECONDS = Histogram(
+    "dash_callback_seconds",
+    "Tiempo de la función del callback, incluida la serialización de sus salidas.",
+    ["callback"])
+FIGURE_BUILD_SECONDS = Histogram(
+    "dash_figure_build_seconds",
+    "Tiempo de construcción de las figuras que no estaban en caché.",
+    ["cache"])
+FIGURE_SERIALIZE_SECONDS = Histogram(
+    "dash_figure_serialize_seconds",
+    "Tiempo de serialización a JSON de las figuras que no estaban en caché.",
+    ["cache"])
+RESPONSE_BYTES = Histogram(
+    "dash_callback_response_bytes",
+    "Tamaño en bytes de las respuestas de los callbacks.",
+    ["callback"], buckets=SIZE_BUCKETS)
+CALLBACK_ERRORS = Counter(
+    "dash_callback_errors_total",
+    "Número de callbacks que terminaron con una excepción.",
+    ["callback"])
+
+REGISTRY = [REQUEST_SECONDS, CALLBACK_SECONDS, FIGURE_BUILD_SECONDS,
+            FIGURE_SERIALIZE_SECONDS, RESPONSE_BYTES, CALLBACK_ERRORS]
+
+
+def _reset_locks():
+    """
+    Reinicia los bloqueos de las métricas en el hijo de un `fork` (las tareas en segundo
+    plano también miden sus figuras).
+    """
+    for metric in REGISTRY:
+        metric._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks)
+
+
+def render():
+    """
+    Devuelve todas las métricas registradas en formato de texto de Prometheus.
+
+    :return: Texto de la respuesta de /metrics.
+    """
+    lines = []
+    for item in REGISTRY:
+        lines.extend(item.render())
+    return "\n".join(lines) + "\n"
+
+# --- Instrumentación de los callbacks ---
+
+def _wrap(function):
+    """
+    Envuelve la función de un callback para medir su tiempo y contar sus errores.
+
+    :param function: Función registrada por Dash (ya envuelta por `@callback`).
+    :return: Función instrumentada.
+    """
+    name = function.__name__
+
+    @functools.wraps(function)
+    def instrumented(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except PreventUpdate:
+            raise
+        except Exception:
+            CALLBACK_ERRORS.inc(name)
+            raise
+        finally:
+            CALLBACK_SECONDS.observe(time.perf_counter() - started, name)
+
+    instrumented.instrumented = True
+    return instrumented
+
+
+def _callback_entry(app, output):
+    """
+    Busca el callback asociado a una salida e instrumenta su función si aún no lo está.
+
+    :param app: Aplicación Dash.
+    :param output: Identificador de la salida enviado por el navegador.
+    :return: Entrada del registro de callbacks, o None si no existe.
+    """
+    entry = app.callback_map.get(output)  # Dash ya ha copiado aquí los callbacks de `@callback`
+    if entry is not None and not getattr(entry["callback"], "instrumented", False):
+        with _wrap_lock:
+            if not getattr(entry["callback"], "instrumented", False):
+                entry["callback"] = _wrap(entry["callback"])
+    return entry
+
+
+def instrument(app):
+    """
+    Activa la instrumentación de los callbacks y publica la ruta /metrics.
+
+    Cada petición a `/_dash-update-component` se asocia al nombre de la
+    función del callback. Las funciones se envuelven la primera vez que se
+    usan, así que también se cubren los callbacks registrados más tarde.
+
+    :param app: Aplicación Dash.
+    :return: La misma aplicación.
+    """
+    if not METRICS_ENABLED:
+        return app
+    server = app.server
+
+    @server.before_request
+    def _start_timer():
+        if flask.request.path != DASH_UPDATE_PATH:
+            return
+        body = flask.request.get_json(silent=True) or {}  # Flask guarda el JSON: Dash no lo vuelve a leer
+        entry = _callback_entry(app, body.get("output"))
+        flask.g.metrics_callback = entry["callback"].__name__ if entry else "desconocido"
+        flask.g.metrics_started = time.perf_counter()
+
+    @server.after_request
+    def _record(response):
+        name = flask.g.pop("metrics_callback", None)
+        if name is not None:
+            REQUEST_SECONDS.observe(time.perf_counter() - flask.g.pop("metrics_started"), name)
+            if not response.is_streamed:
+                RESPONSE_BYTES.observe(response.calculate_content_length() or 0, name)
+        return response
+
+    @server.route("/metrics")
+    def _metrics():
+        return flask.Response(render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+    return app
@@ -0,0 +1,147 @@
+import gzip  # Para comprimir las respuestas cuando el navegador lo admite
+import os  # Para leer la configuración desde variables de entorno
+
+import flask  # Para el hook que comprime las respuestas
+import numpy as np  # Para redondear los arrays de las figuras de una vez
+
+try:
+    import brotli  # Compresión Brotli (opcional: solo si está instalada)
+except ImportError:
+    brotli = None
+
+# --- Figuras compactas ---
+
+# Cifras significativas con las que se envían los valores de las figuras
+SIGNIFICANT_DIGITS = int(os.environ.get("FIGURE_SIGNIFICANT_DIGITS", "4"))
+
+# Atributos de las trazas con los valores dibujados
+TRACE_ARRAYS = ("x", "y", "r", "z", "customdata")
+
+
+def round_significant(values, digits=SIGNIFICANT_DIGITS):
+    """
+    Redondea un array a un número de cifras significativas.
+
+    Los valores redondeados se escriben en JSON con muchos menos caracteres
+    (por ejemplo, 0.4839 en lugar de 0.48387096774193550).
+
+    :param values: Array de números reales.
+    :param digits: Cifras significativas que se conservan.
+    :return: Nuevo array redondeado (los NaN e infinitos no cambian).
+    """
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.floor(np.log10(np.abs(values)))
+    magnitude[~np.isfinite(magnitude)] = 0  # Ceros, NaN e infinitos
+    factor = 10.0 ** (digits - 1 - magnitude)
+    return np.round(values * factor) / factor
+
+
+def _compact_array(values, digits):
+    """
+    Redondea los valores de una traza si son números reales.
+
+    :param values: Valores de un atributo de la traza (array, tupla o None).
+    :param digits: Cifras significativas que se conservan.
+    :return: Array redondeado, o None si no hay que cambiar nada (enteros, texto...).
+    """
+    if values is None:
+        return None
+    array = np.asarray(values)
+    return round_significant(array, digits) if array.dtype.kind == "f" else None
+
+
+def compact_figure(fig, digits=SIGNIFICANT_DIGITS):
+    """
+    Reduce el tamaño de una figura antes de enviarla al navegador.
+
+    - Redondea los valores dibujados (ejes, radio y colores) a `digits` cifras significativas.
+    - Deja en la plantilla solo los valores por defecto de los tipos de traza que
+      usa la figura: la plantilla de Plotly incluye los de todos los tipos de
+      gráfico y ocupa más que muchas figuras. El aspecto no cambia.
+
+    Los arrays binarios (`bdata`) no se usan porque la versión de plotly.js
+    incluida en Dash 2.7 no los admite.
+
+    :param fig: Figura `go.Figure` (se modifica en el sitio).
+    :param digits: Cifras significativas que se conservan.
+    :return: La misma figura.
+    """
+    for trace in fig.data:
+        for attribute in TRACE_ARRAYS:
+            if attribute in trace:
+                values = _compact_array(trace[attribute], digits)
+                if values is not None:
+                    trace[attribute] = values
+        if "marker" in trace:
+            values = _compact_array(trace.marker.color, digits)
+            if values is not None:
+                trace.marker.color = values
+
+    template = fig.layout.template.to_plotly_json()
+    used = {trace.type for trace in fig.data}
+    fig.layout.template = {
+        "layout": template.get("layout", {}),
+        "data": {kind: value for kind, value in template.get("data", {}).items() if kind in used},
+    }
+    return fig
+
+# --- Compresión de las respuestas ---
+
+# Nivel de compresión gzip (1 = más rápido, 9 = más pequeño)
+GZIP_LEVEL = int(os.environ.get("RESPONSE_GZIP_LEVEL", "6"))
+
+# Calidad de la compresión Brotli (0 a 11)
+BROTLI_QUALITY = int(os.environ.get("RESPONSE_BROTLI_QUALITY", "5"))
+
+# Tamaño mínimo (bytes) a partir del cual compensa comprimir
+MIN_COMPRESS_SIZE = int(os.environ.get("RESPONSE_MIN_COMPRESS_SIZE", "500"))
+
+# Tipos de contenido que se comprimen (respuestas de los callbacks, layout e índice)
+COMPRESSIBLE_TYPES = ("application/json", "text/html", "text/plain")
+
+
+def _accepts(encoding):
+    """
+    Indica si el navegador admite la codificación indicada.
+
+    :param encoding: Nombre de la codificación ("br" o "gzip").
+    :return: True si aparece en `Accept-Encoding` con un peso distinto de cero.
+    """
+    return flask.request.accept_encodings[encoding] > 0
+
+
+def compress(app):
+    """
+    Comprime con Brotli (si está instalada) o gzip las respuestas JSON y HTML.
+
+    Se aplica a las respuestas de los callbacks (`/_dash-update-component`),
+    al layout (`/_dash-layout`) y a la página inicial. Los archivos estáticos
+    y las respuestas en streaming no se tocan.
+
+    :param app: Aplicación Dash.
+    :return: La misma aplicación.
+    """
+    @app.server.after_request
+    def _compress(response):
+        if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+                or "Content-Encoding" in response.headers
+                or response.mimetype not in COMPRESSIBLE_TYPES):
+            return response
+
+        data = response.get_data()
+        if len(data) < MIN_COMPRESS_SIZE:
+            return response
+
+        if brotli is not None and _accepts("br"):
+            response.set_data(brotli.compress(data, quality=BROTLI_QUALITY))
+            response.headers["Content-Encoding"] = "br"
+        elif _accepts("gzip"):
+            response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            return response
+        response.vary.add("Accept-Encoding")  # Las cachés intermedias deben distinguir la codificación
+        return response
+
+    return app